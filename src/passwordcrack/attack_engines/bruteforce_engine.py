@@ -6,10 +6,139 @@ NOTE: OFFLINE TESTING ONLY - NO NETWORK ATTACKS
 """
 
 import itertools
-from typing import Iterator, Optional, Callable, List
+import multiprocessing
+from collections import deque
+from typing import Iterator, Optional, Callable, List, Tuple
 from ..hash_utils import HashUtils, HashAlgorithm
 
 
+# Suffix length searched by one worker task (charset_size ** 3 candidates)
+PARALLEL_SUFFIX_LENGTH = 3
+
+# Worker tasks kept queued per process, so the pool never runs dry
+_TASKS_PER_WORKER = 2
+
+# (find_match, chars, pairs) built once per worker process by _init_worker
+_worker_state: Optional[Tuple[Callable[[List[bytes]], int], List[bytes], List[bytes]]] = None
+
+
+def iter_bruteforce_blocks(
+    find_match: Callable[[List[bytes]], int],
+    chars: List[bytes],
+    pairs: List[bytes],
+    length: int,
+    head: bytes = b''
+) -> Iterator[Tuple[int, bytes, bool]]:
+    """
+    Search all candidates of one length in blocks, in itertools.product order.
+    
+    Each block is a prefix from itertools.product plus every one-char
+    (length 1) or two-char tail, so hashing runs once per block.
+    
+    Args:
+        find_match: Matcher from HashUtils.block_matcher
+        chars: Charset as single-byte strings
+        pairs: Every two-char combination of chars, in order
+        length: Number of characters to enumerate after head
+        head: Fixed prefix of every candidate
+        
+    Yields:
+        (candidates tried, last candidate, matched) per block; stops after
+        the block that matched, whose candidate is the password
+    """
+    tails = chars if length == 1 else pairs
+    for prefix in itertools.product(chars, repeat=length - (1 if length == 1 else 2)):
+        start = head + b''.join(prefix)
+        block = [start + tail for tail in tails]
+        index = find_match(block)
+        if index < 0:
+            yield len(block), block[-1], False
+        else:
+            yield index + 1, block[index], True
+            return
+
+
+def _init_worker(hash_value: str, algorithm: HashAlgorithm, charset: bytes) -> None:
+    """Pool initializer: build the matcher and tail tables once per process."""
+    global _worker_state
+    chars = [bytes((c,)) for c in charset]
+    pairs = [a + b for a in chars for b in chars]
+    _worker_state = (HashUtils.block_matcher(hash_value, algorithm), chars, pairs)
+
+
+def _search_head(head: bytes, length: int) -> Tuple[int, bytes, bool]:
+    """Pool task: search every candidate starting with head."""
+    find_match, chars, pairs = _worker_state
+    tried = 0
+    for count, candidate, matched in iter_bruteforce_blocks(find_match, chars, pairs, length, head):
+        tried += count
+        if matched:
+            return tried, candidate, True
+    return tried, candidate, False
+
+
+def start_pool(hash_value: str, algorithm: HashAlgorithm, charset: bytes, processes: int):
+    """
+    Start a worker pool for iter_bruteforce_parallel.
+    
+    Args:
+        hash_value: Target hash
+        algorithm: Hash algorithm of the target
+        charset: Characters to enumerate (single-byte)
+        processes: Number of worker processes
+        
+    Returns:
+        multiprocessing.Pool; the caller terminates it when the attack ends
+    """
+    return multiprocessing.Pool(
+        processes,
+        initializer=_init_worker,
+        initargs=(hash_value, algorithm, charset)
+    )
+
+
+def iter_bruteforce_parallel(
+    pool,
+    processes: int,
+    charset: bytes,
+    length: int
+) -> Iterator[Tuple[int, bytes, bool]]:
+    """
+    Search all candidates of one length across a worker pool.
+    
+    The keyspace is sharded by prefix; each task searches the last
+    PARALLEL_SUFFIX_LENGTH characters under one prefix. Only a bounded
+    number of tasks is queued at a time, and results are yielded in
+    prefix order so attempt counts match the single-process search.
+    
+    Args:
+        pool: Pool from start_pool
+        processes: Number of processes in the pool
+        charset: Characters to enumerate (single-byte)
+        length: Candidate length
+        
+    Yields:
+        (candidates tried, last candidate, matched) per task; stops after
+        the task that matched, whose candidate is the password
+    """
+    suffix_length = min(length, PARALLEL_SUFFIX_LENGTH)
+    heads = itertools.product(charset, repeat=length - suffix_length)
+    window = processes * _TASKS_PER_WORKER
+    
+    pending = deque(
+        pool.apply_async(_search_head, (bytes(head), suffix_length))
+        for head in itertools.islice(heads, window)
+    )
+    while pending:
+        result = pending.popleft().get()
+        head = next(heads, None)
+        if head is not None:
+            pending.append(pool.apply_async(_search_head, (bytes(head), suffix_length)))
+        yield result
+        if result[2]:
+            return
+
+
 class BruteforceEngine:
     """Brute-force attack implementation."""
     
@@ -41,6 +170,8 @@ class BruteforceEngine:
             max_length: Maximum password length
         """
         self.hash_value = hash_value.strip().lower()
+        # Raw digest for unsalted algorithms (None for bcrypt/PBKDF2/Argon2)
+        self._target_digest = HashUtils.target_digest(self.hash_value, algorithm)
         self.algorithm = algorithm
         self.min_length = max(1, min_length)
         self.max_length = max(self.min_length, max_length)
@@ -74,18 +205,25 @@ class BruteforceEngine:
         self.found = False
         self.found_password = None
         
+        # Hot-loop state lives in locals; self.attempts is synced every
+        # 1000 attempts and when the loop exits
+        attempts = 0
+        try_password = self._try_password
+        
         try:
             for candidate in self._generate_candidates():
-                self.attempts += 1
+                attempts += 1
                 
-                if progress_callback and self.attempts % 1000 == 0:
-                    progress_callback(self.attempts, candidate)
+                if attempts % 1000 == 0:
+                    self.attempts = attempts
+                    if progress_callback:
+                        progress_callback(attempts, candidate)
                 
-                if max_attempts and self.attempts >= max_attempts:
+                if max_attempts and attempts >= max_attempts:
                     break
                 
                 # Try the candidate
-                if self._try_password(candidate):
+                if try_password(candidate):
                     self.found = True
                     self.found_password = candidate
                     return candidate
@@ -94,6 +232,8 @@ class BruteforceEngine:
             
         except Exception as e:
             raise RuntimeError(f"Brute-force attack failed: {e}")
+        finally:
+            self.attempts = attempts
     
     def attack_generator(self) -> Iterator[tuple[str, bool]]:
         """
@@ -122,9 +262,14 @@ class BruteforceEngine:
         Yields:
             Password candidates
         """
+        charset = self.charset
         for length in range(self.min_length, self.max_length + 1):
-            for combo in itertools.product(self.charset, repeat=length):
-                yield ''.join(combo)
+            # Join each prefix once and vary only the last character, same
+            # order as itertools.product over the full length
+            for prefix in itertools.product(charset, repeat=length - 1):
+                head = ''.join(prefix)
+                for char in charset:
+                    yield head + char
     
     def _try_password(self, password: str) -> bool:
         """
@@ -137,19 +282,12 @@ class BruteforceEngine:
             True if match, False otherwise
         """
         try:
-            # Generate hash for candidate
-            candidate_hash = HashUtils.generate_hash(password, self.algorithm)
-            
             # For PBKDF2, bcrypt, argon2, use verify method
-            if self.algorithm in [
-                HashAlgorithm.BCRYPT,
-                HashAlgorithm.ARGON2,
-                HashAlgorithm.PBKDF2_SHA256
-            ]:
+            if self._target_digest is None:
                 return HashUtils.verify_hash(password, self.hash_value, self.algorithm)
-            else:
-                # For simple hashes, compare directly
-                return candidate_hash.lower() == self.hash_value.lower()
+            
+            # For simple hashes, compare raw digests
+            return HashUtils.generate_digest(password, self.algorithm) == self._target_digest
                 
         except Exception:
             return False
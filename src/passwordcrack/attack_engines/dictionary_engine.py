@@ -5,11 +5,95 @@ Performs dictionary-based password cracking using wordlists.
 NOTE: OFFLINE TESTING ONLY - NO NETWORK ATTACKS
 """
 
-from typing import Iterator, Optional, Callable
+import multiprocessing
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Callable, List, Tuple
 from ..hash_utils import HashUtils, HashAlgorithm
 from ..wordlist_manager import WordlistManager
 
 
+# Words hashed per HashUtils.block_matcher call in attack()
+BATCH_SIZE = 4096
+
+# attack() reports progress every this many attempts
+PROGRESS_INTERVAL = 100
+
+# Wordlist size from which the GUI hashes blocks across worker processes
+PARALLEL_MIN_WORDS = 100_000
+
+# Worker tasks kept queued per process, so the pool never runs dry
+_TASKS_PER_WORKER = 2
+
+# HashUtils.block_matcher result built once per worker process by _init_worker
+_worker_find_match: Optional[Callable[[List[bytes]], int]] = None
+
+
+def _init_worker(hash_value: str, algorithm: HashAlgorithm) -> None:
+    """Pool initializer: build the matcher once per process."""
+    global _worker_find_match
+    _worker_find_match = HashUtils.block_matcher(hash_value, algorithm)
+
+
+def _match_block(block: List[bytes]) -> int:
+    """Pool task: index of the matching word in block, or -1."""
+    return _worker_find_match(block)
+
+
+def start_pool(hash_value: str, algorithm: HashAlgorithm, processes: int):
+    """
+    Start a worker pool for iter_matches_parallel.
+    
+    Args:
+        hash_value: Target hash
+        algorithm: Hash algorithm of the target
+        processes: Number of worker processes
+        
+    Returns:
+        multiprocessing.Pool; the caller terminates it when the attack ends
+    """
+    return multiprocessing.Pool(
+        processes,
+        initializer=_init_worker,
+        initargs=(hash_value, algorithm)
+    )
+
+
+def iter_matches_parallel(
+    pool,
+    processes: int,
+    blocks: Iterable[List[bytes]]
+) -> Iterator[Tuple[List[bytes], int]]:
+    """
+    Hash blocks of words across a worker pool.
+    
+    Only a bounded number of blocks is queued at a time, and results are
+    yielded in block order so attempt counts match the single-process loop.
+    
+    Args:
+        pool: Pool from start_pool
+        processes: Number of processes in the pool
+        blocks: Lists of candidate words as bytes
+        
+    Yields:
+        (block, index of the match or -1) per block; stops after the
+        block that matched
+    """
+    blocks = iter(blocks)
+    window = processes * _TASKS_PER_WORKER
+    
+    pending = deque((block, pool.apply_async(_match_block, (block,))) for block in islice(blocks, window))
+    while pending:
+        block, result = pending.popleft()
+        index = result.get()
+        block_next = next(blocks, None)
+        if block_next is not None:
+            pending.append((block_next, pool.apply_async(_match_block, (block_next,))))
+        yield block, index
+        if index >= 0:
+            return
+
+
 class DictionaryEngine:
     """Dictionary attack implementation."""
     
@@ -28,6 +112,8 @@ class DictionaryEngine:
             wordlist_manager: Wordlist manager instance
         """
         self.hash_value = hash_value.strip().lower()
+        # Raw digest for unsalted algorithms (None for bcrypt/PBKDF2/Argon2)
+        self._target_digest = HashUtils.target_digest(self.hash_value, algorithm)
         self.algorithm = algorithm
         self.wordlist_manager = wordlist_manager
         self.attempts = 0
@@ -54,10 +140,14 @@ class DictionaryEngine:
         self.found_password = None
         
         try:
+            # Unsalted hex targets: hash whole batches and compare raw digests in C
+            if self._target_digest is not None:
+                return self._attack_batched(wordlist_file, progress_callback)
+            
             for word in self.wordlist_manager.load_wordlist(wordlist_file):
                 self.attempts += 1
                 
-                if progress_callback and self.attempts % 100 == 0:
+                if progress_callback and self.attempts % PROGRESS_INTERVAL == 0:
                     progress_callback(self.attempts, word)
                 
                 # Try the word
@@ -71,6 +161,36 @@ class DictionaryEngine:
         except Exception as e:
             raise RuntimeError(f"Dictionary attack failed: {e}")
     
+    def _attack_batched(
+        self,
+        wordlist_file: str,
+        progress_callback: Optional[Callable[[int, str], None]]
+    ) -> Optional[str]:
+        """Dictionary attack in BATCH_SIZE blocks through HashUtils.block_matcher."""
+        find_match = HashUtils.block_matcher(self.hash_value, self.algorithm)
+        words = self.wordlist_manager.load_wordlist(wordlist_file)
+        
+        while True:
+            batch = list(islice(words, BATCH_SIZE))
+            if not batch:
+                return None
+            
+            index = find_match([word.encode('utf-8') for word in batch])
+            tried = len(batch) if index < 0 else index + 1
+            
+            # Same callbacks as the per-word loop: every PROGRESS_INTERVAL attempts
+            if progress_callback:
+                base = self.attempts
+                first = base + PROGRESS_INTERVAL - base % PROGRESS_INTERVAL
+                for attempt in range(first, base + tried + 1, PROGRESS_INTERVAL):
+                    progress_callback(attempt, batch[attempt - base - 1])
+            
+            self.attempts += tried
+            if index >= 0:
+                self.found = True
+                self.found_password = batch[index]
+                return batch[index]
+    
     def attack_generator(
         self,
         wordlist_file: str
@@ -108,19 +228,12 @@ class DictionaryEngine:
             True if match, False otherwise
         """
         try:
-            # Generate hash for candidate
-            candidate_hash = HashUtils.generate_hash(password, self.algorithm)
-            
             # For PBKDF2, bcrypt, argon2, use verify method
-            if self.algorithm in [
-                HashAlgorithm.BCRYPT,
-                HashAlgorithm.ARGON2,
-                HashAlgorithm.PBKDF2_SHA256
-            ]:
+            if self._target_digest is None:
                 return HashUtils.verify_hash(password, self.hash_value, self.algorithm)
-            else:
-                # For simple hashes, compare directly
-                return candidate_hash.lower() == self.hash_value.lower()
+            
+            # For simple hashes, compare raw digests
+            return HashUtils.generate_digest(password, self.algorithm) == self._target_digest
                 
         except Exception:
             return False
@@ -14,6 +14,16 @@ from ..gpx_manager import GPXManager, GPXDevice, DeviceType
 from ..hashcat_wrapper import HashcatWrapper, HashcatMode
 from ..wordlist_manager import WordlistManager
 
+# Wordlists below this many words run with hashcat -S (slow candidates)
+SLOW_CANDIDATES_MAX_WORDS = 1_000_000
+
+# Slow hashes always run with -S, the host keeps up with the device easily
+SLOW_CANDIDATE_ALGORITHMS = frozenset({
+    HashAlgorithm.BCRYPT,
+    HashAlgorithm.PBKDF2_SHA256,
+    HashAlgorithm.ARGON2
+})
+
 
 class GPXDictionaryEngine:
     """GPU-accelerated dictionary attack engine."""
@@ -41,6 +51,7 @@ class GPXDictionaryEngine:
         self.attempts = 0
         self.found = False
         self.found_password: Optional[str] = None
+        self.skipped_wordlists: List[str] = []
     
     def attack(
         self,
@@ -48,7 +59,8 @@ class GPXDictionaryEngine:
         wordlist_manager: WordlistManager,
         use_gpu: bool = True,
         mixed_mode: bool = True,
-        progress_callback: Optional[Callable[[int, str], None]] = None
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        slow_candidates: Optional[bool] = None
     ) -> Optional[str]:
         """
         Perform GPU-accelerated dictionary attack.
@@ -59,6 +71,8 @@ class GPXDictionaryEngine:
             use_gpu: Use GPU if available
             mixed_mode: Allow CPU + GPU together
             progress_callback: Optional progress callback
+            slow_candidates: Force hashcat -S on/off, None to decide from
+                wordlist size and algorithm
             
         Returns:
             Cracked password if found, None otherwise
@@ -68,6 +82,58 @@ class GPXDictionaryEngine:
         if not wordlist_path or not wordlist_path.exists():
             raise FileNotFoundError(f"Wordlist not found: {wordlist_file}")
         
+        return self._run_hashcat([wordlist_path], use_gpu, mixed_mode, slow_candidates)
+    
+    def attack_many(
+        self,
+        wordlist_files: List[str],
+        wordlist_manager: WordlistManager,
+        use_gpu: bool = True,
+        mixed_mode: bool = True,
+        slow_candidates: Optional[bool] = None
+    ) -> Optional[str]:
+        """
+        Perform GPU-accelerated dictionary attack over several wordlists in one hashcat run.
+        
+        Wordlists that cannot be found are skipped and listed in
+        self.skipped_wordlists.
+        
+        Args:
+            wordlist_files: Wordlist filenames, tried in order
+            wordlist_manager: Wordlist manager instance
+            use_gpu: Use GPU if available
+            mixed_mode: Allow CPU + GPU together
+            slow_candidates: Force hashcat -S on/off, None to decide from
+                wordlist size and algorithm
+            
+        Returns:
+            Cracked password if found, None otherwise
+        """
+        wordlist_paths = []
+        self.skipped_wordlists = []
+        for wordlist_file in wordlist_files:
+            wordlist_path = self._resolve_wordlist_path(wordlist_file)
+            if wordlist_path:
+                wordlist_paths.append(wordlist_path)
+            else:
+                self.skipped_wordlists.append(wordlist_file)
+        
+        if not wordlist_paths:
+            raise FileNotFoundError(f"No wordlists found: {', '.join(wordlist_files)}")
+        
+        return self._run_hashcat(wordlist_paths, use_gpu, mixed_mode, slow_candidates)
+    
+    def _run_hashcat(
+        self,
+        wordlist_paths: List[Path],
+        use_gpu: bool,
+        mixed_mode: bool,
+        slow_candidates: Optional[bool] = None
+    ) -> Optional[str]:
+        """Run one hashcat dictionary attack over the given wordlists."""
+        if slow_candidates is None:
+            slow_candidates = self._wants_slow_candidates(wordlist_paths)
+        
         # Select devices
         devices = self._select_devices(use_gpu, mixed_mode)
         
@@ -86,8 +152,9 @@ class GPXDictionaryEngine:
         result = self.hashcat_wrapper.crack_dictionary(
             hash_value=self.hash_value,
             hash_mode=hash_mode,
-            wordlist_path=wordlist_path,
-            devices=devices
+            wordlist_path=wordlist_paths,
+            devices=devices,
+            slow_candidates=slow_candidates
         )
         
         # Process result
@@ -102,6 +169,18 @@ class GPXDictionaryEngine:
         
         return None
     
+    def _wants_slow_candidates(self, wordlist_paths: List[Path]) -> bool:
+        """Decide whether hashcat should generate candidates on the host (-S)."""
+        if self.algorithm in SLOW_CANDIDATE_ALGORITHMS:
+            return True
+        
+        total_words = 0
+        for path in wordlist_paths:
+            total_words += self.hashcat_wrapper.calculate_wordlist_size(path)
+            if total_words >= SLOW_CANDIDATES_MAX_WORDS:
+                return False
+        return True
+    
     def _resolve_wordlist_path(self, wordlist_file: str) -> Optional[Path]:
         """Resolve wordlist path."""
         # Try relative to examples/
@@ -186,7 +265,10 @@ class GPXBruteforceEngine:
         mask: str,
         use_gpu: bool = True,
         mixed_mode: bool = True,
-        progress_callback: Optional[Callable[[int, str], None]] = None
+        progress_callback: Optional[Callable[[int, str], None]] = None,
+        optimized_kernels: bool = True,
+        workload: Optional[int] = 4,
+        increment_min: int = 1
     ) -> Optional[str]:
         """
         Perform GPU-accelerated brute-force attack.
@@ -196,6 +278,9 @@ class GPXBruteforceEngine:
             use_gpu: Use GPU if available
             mixed_mode: Allow CPU + GPU together
             progress_callback: Optional progress callback
+            optimized_kernels: Use hashcat's optimized kernels (-O, max 32 chars)
+            workload: Hashcat workload profile (-w), None for hashcat's default
+            increment_min: Shortest password length to try (--increment-min)
             
         Returns:
             Cracked password if found, None otherwise
@@ -219,7 +304,10 @@ class GPXBruteforceEngine:
             hash_mode=hash_mode,
             mask=mask,
             devices=devices,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            optimized_kernels=optimized_kernels,
+            workload=workload,
+            increment_min=increment_min
         )
         
         # Extract stats from result
@@ -29,6 +29,8 @@ class HybridEngine:
             wordlist_manager: Wordlist manager instance
         """
         self.hash_value = hash_value.strip().lower()
+        # Raw digest for unsalted algorithms (None for bcrypt/PBKDF2/Argon2)
+        self._target_digest = HashUtils.target_digest(self.hash_value, algorithm)
         self.algorithm = algorithm
         self.wordlist_manager = wordlist_manager
         self.attempts = 0
@@ -141,19 +143,12 @@ class HybridEngine:
             True if match, False otherwise
         """
         try:
-            # Generate hash for candidate
-            candidate_hash = HashUtils.generate_hash(password, self.algorithm)
-            
             # For PBKDF2, bcrypt, argon2, use verify method
-            if self.algorithm in [
-                HashAlgorithm.BCRYPT,
-                HashAlgorithm.ARGON2,
-                HashAlgorithm.PBKDF2_SHA256
-            ]:
+            if self._target_digest is None:
                 return HashUtils.verify_hash(password, self.hash_value, self.algorithm)
-            else:
-                # For simple hashes, compare directly
-                return candidate_hash.lower() == self.hash_value.lower()
+            
+            # For simple hashes, compare raw digests
+            return HashUtils.generate_digest(password, self.algorithm) == self._target_digest
                 
         except Exception:
             return False
@@ -0,0 +1,296 @@
+"""
+Numba-compiled brute-force kernels.
+
+Enumerates a fixed-length charset keyspace and hashes it with MD5, SHA1
+or SHA256 in JIT-compiled code spread across all CPU cores.
+Optional: requires numba (pip install numba); callers fall back to the
+pure Python loop when NUMBA_AVAILABLE is False.
+NOTE: OFFLINE TESTING ONLY - NO NETWORK ATTACKS
+"""
+
+import math
+from typing import Iterator, Tuple
+from ..hash_utils import HashAlgorithm
+
+try:
+    import numpy as np
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Kernel algorithm ids, and the byte order of their message/digest words
+_ALGO_MD5 = 0
+_ALGO_SHA1 = 1
+_ALGO_SHA256 = 2
+KERNEL_ALGORITHMS = {
+    HashAlgorithm.MD5: _ALGO_MD5,
+    HashAlgorithm.SHA1: _ALGO_SHA1,
+    HashAlgorithm.SHA256: _ALGO_SHA256,
+}
+_WORD_ORDER = {_ALGO_MD5: '<u4', _ALGO_SHA1: '>u4', _ALGO_SHA256: '>u4'}
+
+# Longest candidate that fits in a single padded 64-byte block
+MAX_KERNEL_LENGTH = 55
+
+# Candidates hashed per kernel call (one progress update each)
+KERNEL_BATCH_SIZE = 1 << 22
+
+
+if NUMBA_AVAILABLE:
+    _M32 = 0xFFFFFFFF
+
+    _MD5_K = np.array(
+        [int(abs(math.sin(i + 1)) * 2**32) & _M32 for i in range(64)],
+        dtype=np.int64
+    )
+    _MD5_S = np.array(
+        [7, 12, 17, 22] * 4 + [5, 9, 14, 20] * 4 + [4, 11, 16, 23] * 4 + [6, 10, 15, 21] * 4,
+        dtype=np.int64
+    )
+    _SHA256_K = np.array([
+        0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+        0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+        0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+        0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+        0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+        0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+        0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+        0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+    ], dtype=np.int64)
+
+    @njit(cache=True, inline='always')
+    def _rotl(x, n):
+        return ((x << n) | (x >> (32 - n))) & _M32
+
+    @njit(cache=True, inline='always')
+    def _rotr(x, n):
+        return ((x >> n) | (x << (32 - n))) & _M32
+
+    @njit(cache=True)
+    def _md5_matches(buf, target, w):
+        for i in range(16):
+            j = 4 * i
+            w[i] = buf[j] | (buf[j + 1] << 8) | (buf[j + 2] << 16) | (buf[j + 3] << 24)
+        a, b, c, d = 0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476
+        for i in range(64):
+            if i < 16:
+                f = (b & c) | ((b ^ _M32) & d)
+                g = i
+            elif i < 32:
+                f = (d & b) | ((d ^ _M32) & c)
+                g = (5 * i + 1) & 15
+            elif i < 48:
+                f = b ^ c ^ d
+                g = (3 * i + 5) & 15
+            else:
+                f = c ^ (b | (d ^ _M32))
+                g = (7 * i) & 15
+            f = (f + a + _MD5_K[i] + w[g]) & _M32
+            a = d
+            d = c
+            c = b
+            b = (b + _rotl(f, _MD5_S[i])) & _M32
+        return (((0x67452301 + a) & _M32) == target[0] and ((0xefcdab89 + b) & _M32) == target[1]
+                and ((0x98badcfe + c) & _M32) == target[2] and ((0x10325476 + d) & _M32) == target[3])
+
+    @njit(cache=True)
+    def _sha1_matches(buf, target, w):
+        for i in range(16):
+            j = 4 * i
+            w[i] = (buf[j] << 24) | (buf[j + 1] << 16) | (buf[j + 2] << 8) | buf[j + 3]
+        for i in range(16, 80):
+            w[i] = _rotl(w[i - 3] ^ w[i - 8] ^ w[i - 14] ^ w[i - 16], 1)
+        a, b, c, d, e = 0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0
+        for i in range(80):
+            if i < 20:
+                f = (b & c) | ((b ^ _M32) & d)
+                k = 0x5A827999
+            elif i < 40:
+                f = b ^ c ^ d
+                k = 0x6ED9EBA1
+            elif i < 60:
+                f = (b & c) | (b & d) | (c & d)
+                k = 0x8F1BBCDC
+            else:
+                f = b ^ c ^ d
+                k = 0xCA62C1D6
+            t = (_rotl(a, 5) + f + e + k + w[i]) & _M32
+            e = d
+            d = c
+            c = _rotl(b, 30)
+            b = a
+            a = t
+        return (((0x67452301 + a) & _M32) == target[0] and ((0xEFCDAB89 + b) & _M32) == target[1]
+                and ((0x98BADCFE + c) & _M32) == target[2] and ((0x10325476 + d) & _M32) == target[3]
+                and ((0xC3D2E1F0 + e) & _M32) == target[4])
+
+    @njit(cache=True)
+    def _sha256_matches(buf, target, w):
+        for i in range(16):
+            j = 4 * i
+            w[i] = (buf[j] << 24) | (buf[j + 1] << 16) | (buf[j + 2] << 8) | buf[j + 3]
+        for i in range(16, 64):
+            s0 = _rotr(w[i - 15], 7) ^ _rotr(w[i - 15], 18) ^ (w[i - 15] >> 3)
+            s1 = _rotr(w[i - 2], 17) ^ _rotr(w[i - 2], 19) ^ (w[i - 2] >> 10)
+            w[i] = (w[i - 16] + s0 + w[i - 7] + s1) & _M32
+        h0, h1, h2, h3 = 0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a
+        h4, h5, h6, h7 = 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19
+        a, b, c, d, e, f, g, h = h0, h1, h2, h3, h4, h5, h6, h7
+        for i in range(64):
+            s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+            ch = (e & f) ^ ((e ^ _M32) & g)
+            t1 = (h + s1 + ch + _SHA256_K[i] + w[i]) & _M32
+            s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+            maj = (a & b) ^ (a & c) ^ (b & c)
+            t2 = (s0 + maj) & _M32
+            h = g
+            g = f
+            f = e
+            e = (d + t1) & _M32
+            d = c
+            c = b
+            b = a
+            a = (t1 + t2) & _M32
+        return (((h0 + a) & _M32) == target[0] and ((h1 + b) & _M32) == target[1]
+                and ((h2 + c) & _M32) == target[2] and ((h3 + d) & _M32) == target[3]
+                and ((h4 + e) & _M32) == target[4] and ((h5 + f) & _M32) == target[5]
+                and ((h6 + g) & _M32) == target[6] and ((h7 + h) & _M32) == target[7])
+
+    # nogil: the GUI thread keeps running while a batch is hashed
+    @njit(cache=True, parallel=True, nogil=True)
+    def _crack_range(target, charset, length, algo_id, start, count, parts):
+        n = charset.size
+        bits = length * 8
+        hits = np.full(parts, -1, np.int64)
+        found = np.zeros(1, np.int64)
+        per = (count + parts - 1) // parts
+        for p in prange(parts):
+            lo = start + p * per
+            hi = min(lo + per, start + count)
+            if lo < hi:
+                # Padded single-block message; only bytes [0, length) change
+                buf = np.zeros(64, np.int64)
+                buf[length] = 0x80
+                for k in range(8):
+                    if algo_id == _ALGO_MD5:
+                        buf[56 + k] = (bits >> (8 * k)) & 0xFF
+                    else:
+                        buf[63 - k] = (bits >> (8 * k)) & 0xFF
+                w = np.zeros(80, np.int64)
+
+                # Decode lo into charset digits, most significant first
+                digits = np.zeros(length, np.int64)
+                rem = lo
+                for k in range(length - 1, -1, -1):
+                    digits[k] = rem % n
+                    rem //= n
+                    buf[k] = charset[digits[k]]
+
+                idx = lo
+                while idx < hi:
+                    if (idx & 1023) == 0 and found[0] != 0:
+                        break
+                    if algo_id == _ALGO_MD5:
+                        matched = _md5_matches(buf, target, w)
+                    elif algo_id == _ALGO_SHA1:
+                        matched = _sha1_matches(buf, target, w)
+                    else:
+                        matched = _sha256_matches(buf, target, w)
+                    if matched:
+                        hits[p] = idx
+                        found[0] = 1
+                        break
+
+                    # Odometer increment of the candidate
+                    idx += 1
+                    k = length - 1
+                    while k >= 0:
+                        digits[k] += 1
+                        if digits[k] < n:
+                            buf[k] = charset[digits[k]]
+                            break
+                        digits[k] = 0
+                        buf[k] = charset[0]
+                        k -= 1
+
+        best = -1
+        for p in range(parts):
+            if hits[p] >= 0 and (best < 0 or hits[p] < best):
+                best = hits[p]
+        return best
+
+
+def kernel_supports(algorithm: HashAlgorithm, charset: bytes, length: int) -> bool:
+    """
+    Check whether a keyspace can be searched by the compiled kernel.
+
+    Args:
+        algorithm: Target hash algorithm
+        charset: Characters to enumerate
+        length: Candidate length
+
+    Returns:
+        True if numba is installed, the algorithm has a kernel, and every
+        keyspace index fits in a signed 64-bit integer
+    """
+    return (NUMBA_AVAILABLE and algorithm in KERNEL_ALGORITHMS
+            and length <= MAX_KERNEL_LENGTH and len(charset) ** length < 2**63)
+
+
+def candidate_at(charset: bytes, length: int, index: int) -> bytes:
+    """
+    Return the candidate at a keyspace index (itertools.product order).
+
+    Args:
+        charset: Characters to enumerate
+        length: Candidate length
+        index: Position in the keyspace
+
+    Returns:
+        Candidate bytes
+    """
+    n = len(charset)
+    out = bytearray(length)
+    for k in range(length - 1, -1, -1):
+        index, digit = divmod(index, n)
+        out[k] = charset[digit]
+    return bytes(out)
+
+
+def iter_bruteforce(
+    hash_value: str,
+    algorithm: HashAlgorithm,
+    charset: bytes,
+    length: int,
+    batch_size: int = KERNEL_BATCH_SIZE
+) -> Iterator[Tuple[int, bytes, bool]]:
+    """
+    Search all candidates of one length in compiled batches.
+
+    Args:
+        hash_value: Target hex digest
+        algorithm: One of KERNEL_ALGORITHMS
+        charset: Characters to enumerate (single-byte)
+        length: Candidate length (at most MAX_KERNEL_LENGTH)
+        batch_size: Candidates per kernel call
+
+    Yields:
+        (candidates tried, last candidate, matched) per batch; stops after
+        the batch that matched, whose candidate is the password
+    """
+    algo_id = KERNEL_ALGORITHMS[algorithm]
+    target = np.frombuffer(bytes.fromhex(hash_value), dtype=_WORD_ORDER[algo_id]).astype(np.int64)
+    chars = np.frombuffer(charset, dtype=np.uint8).astype(np.int64)
+    parts = get_num_threads() * 4
+    total = len(charset) ** length
+
+    for start in range(0, total, batch_size):
+        count = min(batch_size, total - start)
+        index = _crack_range(target, chars, length, algo_id, start, count, parts)
+        if index < 0:
+            yield count, candidate_at(charset, length, start + count - 1), False
+        else:
+            yield index - start + 1, candidate_at(charset, length, index), True
+            return
@@ -0,0 +1,271 @@
+"""
+PyOpenCL dictionary kernels.
+
+Hashes blocks of wordlist entries with MD5, SHA1 or SHA256 on an OpenCL
+device, so a GPU can still be used when hashcat is not installed.
+Optional: requires pyopencl (pip install pyopencl) and an OpenCL runtime;
+callers fall back to HashUtils.block_matcher when OPENCL_AVAILABLE is False.
+NOTE: OFFLINE TESTING ONLY - NO NETWORK ATTACKS
+"""
+
+from typing import Dict, List, Optional, Tuple
+from ..hash_utils import HashUtils, HashAlgorithm
+
+try:
+    import numpy as np
+    import pyopencl as cl
+    OPENCL_AVAILABLE = True
+except ImportError:
+    OPENCL_AVAILABLE = False
+
+
+# Kernel algorithm ids, and the byte order of their message/digest words
+_ALGO_MD5 = 0
+_ALGO_SHA1 = 1
+_ALGO_SHA256 = 2
+KERNEL_ALGORITHMS = {
+    HashAlgorithm.MD5: _ALGO_MD5,
+    HashAlgorithm.SHA1: _ALGO_SHA1,
+    HashAlgorithm.SHA256: _ALGO_SHA256,
+}
+_WORD_ORDER = {_ALGO_MD5: '<u4', _ALGO_SHA1: '>u4', _ALGO_SHA256: '>u4'}
+
+# Longest word hashed on the device (single padded 64-byte block);
+# longer words in a block are checked on the host
+MAX_KERNEL_WORD_LENGTH = 55
+
+# Wordlist entries sent to the device per kernel launch
+OPENCL_BLOCK_SIZE = 1 << 18
+
+# "No match" value of the hit index
+_NO_HIT = 0x7FFFFFFF
+
+_KERNEL_SOURCE = r"""
+#define ALGO_MD5 0
+#define ALGO_SHA1 1
+#define ALGO_SHA256 2
+
+__constant uint MD5_K[64] = {
+    0xd76aa478, 0xe8c7b756, 0x242070db, 0xc1bdceee, 0xf57c0faf, 0x4787c62a, 0xa8304613, 0xfd469501,
+    0x698098d8, 0x8b44f7af, 0xffff5bb1, 0x895cd7be, 0x6b901122, 0xfd987193, 0xa679438e, 0x49b40821,
+    0xf61e2562, 0xc040b340, 0x265e5a51, 0xe9b6c7aa, 0xd62f105d, 0x02441453, 0xd8a1e681, 0xe7d3fbc8,
+    0x21e1cde6, 0xc33707d6, 0xf4d50d87, 0x455a14ed, 0xa9e3e905, 0xfcefa3f8, 0x676f02d9, 0x8d2a4c8a,
+    0xfffa3942, 0x8771f681, 0x6d9d6122, 0xfde5380c, 0xa4beea44, 0x4bdecfa9, 0xf6bb4b60, 0xbebfbc70,
+    0x289b7ec6, 0xeaa127fa, 0xd4ef3085, 0x04881d05, 0xd9d4d039, 0xe6db99e5, 0x1fa27cf8, 0xc4ac5665,
+    0xf4292244, 0x432aff97, 0xab9423a7, 0xfc93a039, 0x655b59c3, 0x8f0ccc92, 0xffeff47d, 0x85845dd1,
+    0x6fa87e4f, 0xfe2ce6e0, 0xa3014314, 0x4e0811a1, 0xf7537e82, 0xbd3af235, 0x2ad7d2bb, 0xeb86d391
+};
+__constant uint MD5_S[64] = {
+    7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+    5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
+    4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+    6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21
+};
+__constant uint SHA256_K[64] = {
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+};
+
+#define ROTL(x, n) rotate((uint)(x), (uint)(n))
+#define ROTR(x, n) rotate((uint)(x), (uint)(32 - (n)))
+
+bool md5_match(uint *w, __constant uint *target)
+{
+    uint a = 0x67452301, b = 0xefcdab89, c = 0x98badcfe, d = 0x10325476;
+    for (int i = 0; i < 64; i++) {
+        uint f, g;
+        if (i < 16) { f = (b & c) | (~b & d); g = i; }
+        else if (i < 32) { f = (d & b) | (~d & c); g = (5 * i + 1) & 15; }
+        else if (i < 48) { f = b ^ c ^ d; g = (3 * i + 5) & 15; }
+        else { f = c ^ (b | ~d); g = (7 * i) & 15; }
+        f += a + MD5_K[i] + w[g];
+        a = d; d = c; c = b;
+        b += ROTL(f, MD5_S[i]);
+    }
+    return 0x67452301 + a == target[0] && 0xefcdab89 + b == target[1]
+        && 0x98badcfe + c == target[2] && 0x10325476 + d == target[3];
+}
+
+bool sha1_match(uint *w, __constant uint *target)
+{
+    uint a = 0x67452301, b = 0xEFCDAB89, c = 0x98BADCFE, d = 0x10325476, e = 0xC3D2E1F0;
+    for (int i = 0; i < 80; i++) {
+        uint f, k;
+        if (i >= 16)
+            w[i & 15] = ROTL(w[(i - 3) & 15] ^ w[(i - 8) & 15] ^ w[(i - 14) & 15] ^ w[i & 15], 1);
+        if (i < 20) { f = (b & c) | (~b & d); k = 0x5A827999; }
+        else if (i < 40) { f = b ^ c ^ d; k = 0x6ED9EBA1; }
+        else if (i < 60) { f = (b & c) | (b & d) | (c & d); k = 0x8F1BBCDC; }
+        else { f = b ^ c ^ d; k = 0xCA62C1D6; }
+        uint t = ROTL(a, 5) + f + e + k + w[i & 15];
+        e = d; d = c; c = ROTL(b, 30); b = a; a = t;
+    }
+    return 0x67452301 + a == target[0] && 0xEFCDAB89 + b == target[1]
+        && 0x98BADCFE + c == target[2] && 0x10325476 + d == target[3]
+        && 0xC3D2E1F0 + e == target[4];
+}
+
+bool sha256_match(uint *w, __constant uint *target)
+{
+    const uint h0 = 0x6a09e667, h1 = 0xbb67ae85, h2 = 0x3c6ef372, h3 = 0xa54ff53a;
+    const uint h4 = 0x510e527f, h5 = 0x9b05688c, h6 = 0x1f83d9ab, h7 = 0x5be0cd19;
+    uint a = h0, b = h1, c = h2, d = h3, e = h4, f = h5, g = h6, h = h7;
+    for (int i = 0; i < 64; i++) {
+        if (i >= 16) {
+            uint w15 = w[(i - 15) & 15], w2 = w[(i - 2) & 15];
+            uint s0 = ROTR(w15, 7) ^ ROTR(w15, 18) ^ (w15 >> 3);
+            uint s1 = ROTR(w2, 17) ^ ROTR(w2, 19) ^ (w2 >> 10);
+            w[i & 15] += s0 + w[(i - 7) & 15] + s1;
+        }
+        uint t1 = h + (ROTR(e, 6) ^ ROTR(e, 11) ^ ROTR(e, 25)) + ((e & f) ^ (~e & g))
+                  + SHA256_K[i] + w[i & 15];
+        uint t2 = (ROTR(a, 2) ^ ROTR(a, 13) ^ ROTR(a, 22)) + ((a & b) ^ (a & c) ^ (b & c));
+        h = g; g = f; f = e; e = d + t1;
+        d = c; c = b; b = a; a = t1 + t2;
+    }
+    return h0 + a == target[0] && h1 + b == target[1] && h2 + c == target[2]
+        && h3 + d == target[3] && h4 + e == target[4] && h5 + f == target[5]
+        && h6 + g == target[6] && h7 + h == target[7];
+}
+
+__kernel void match_words(__global const uchar *words, __global const uint *offsets,
+                          __constant uint *target, volatile __global int *hit)
+{
+    uint gid = get_global_id(0);
+    uint start = offsets[gid];
+    uint len = offsets[gid + 1] - start;
+    if (len > 55)
+        return;
+
+    /* Single padded block: message, 0x80, zeros, bit length */
+    uint w[16];
+    for (int i = 0; i < 16; i++)
+        w[i] = 0;
+    for (uint i = 0; i <= len; i++) {
+        uint byte = i < len ? words[start + i] : 0x80;
+#if ALGO == ALGO_MD5
+        w[i >> 2] |= byte << ((i & 3) * 8);
+#else
+        w[i >> 2] |= byte << ((3 - (i & 3)) * 8);
+#endif
+    }
+
+#if ALGO == ALGO_MD5
+    w[14] = len * 8;
+    bool matched = md5_match(w, target);
+#elif ALGO == ALGO_SHA1
+    w[15] = len * 8;
+    bool matched = sha1_match(w, target);
+#else
+    w[15] = len * 8;
+    bool matched = sha256_match(w, target);
+#endif
+    if (matched)
+        atomic_min(hit, (int)gid);
+}
+"""
+
+# (context, queue) shared by every matcher, and programs built per algorithm
+_queue_cache: Optional[Tuple["cl.Context", "cl.CommandQueue"]] = None
+_program_cache: Dict[int, "cl.Program"] = {}
+
+
+def kernel_supports(algorithm: HashAlgorithm) -> bool:
+    """
+    Check whether an algorithm can be matched on an OpenCL device.
+
+    Args:
+        algorithm: Target hash algorithm
+
+    Returns:
+        True if pyopencl is installed and the algorithm has a kernel
+    """
+    return OPENCL_AVAILABLE and algorithm in KERNEL_ALGORITHMS
+
+
+def _get_queue() -> Tuple["cl.Context", "cl.CommandQueue"]:
+    """Create (once) a context and command queue, preferring a GPU device."""
+    global _queue_cache
+    if _queue_cache is None:
+        devices = [d for p in cl.get_platforms() for d in p.get_devices()]
+        if not devices:
+            raise RuntimeError("No OpenCL devices found")
+        gpus = [d for d in devices if d.type & cl.device_type.GPU]
+        context = cl.Context([(gpus or devices)[0]])
+        _queue_cache = (context, cl.CommandQueue(context))
+    return _queue_cache
+
+
+class OpenCLMatcher:
+    """Block matcher running on an OpenCL device (same contract as HashUtils.block_matcher)."""
+
+    def __init__(self, hash_value: str, algorithm: HashAlgorithm):
+        """
+        Build (or reuse) the kernel and upload the target digest.
+
+        Args:
+            hash_value: Target hex digest
+            algorithm: One of KERNEL_ALGORITHMS
+
+        Raises:
+            RuntimeError: If no OpenCL device is available
+            pyopencl.Error: If the kernel fails to build
+        """
+        algo_id = KERNEL_ALGORITHMS[algorithm]
+        self.context, self.queue = _get_queue()
+
+        program = _program_cache.get(algo_id)
+        if program is None:
+            program = cl.Program(self.context, _KERNEL_SOURCE).build(options=[f"-DALGO={algo_id}"])
+            _program_cache[algo_id] = program
+        self._kernel = cl.Kernel(program, "match_words")
+
+        target = np.frombuffer(bytes.fromhex(hash_value), dtype=_WORD_ORDER[algo_id]).astype(np.uint32)
+        mf = cl.mem_flags
+        self._target_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=target)
+
+        # Words too long for the kernel's single block are checked here
+        self._host_match = HashUtils.block_matcher(hash_value, algorithm)
+
+    def find_match(self, block: List[bytes]) -> int:
+        """
+        Hash a block of candidates on the device and find the target.
+
+        Args:
+            block: UTF-8 candidates
+
+        Returns:
+            Index of the first matching candidate, or -1 if none match
+        """
+        count = len(block)
+        if count == 0:
+            return -1
+
+        lengths = np.fromiter(map(len, block), dtype=np.uint32, count=count)
+        offsets = np.zeros(count + 1, dtype=np.uint32)
+        np.cumsum(lengths, out=offsets[1:])
+        data = np.frombuffer(b''.join(block) or b'\0', dtype=np.uint8)
+        hit = np.array([_NO_HIT], dtype=np.int32)
+
+        mf = cl.mem_flags
+        words_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=data)
+        offsets_buf = cl.Buffer(self.context, mf.READ_ONLY | mf.COPY_HOST_PTR, hostbuf=offsets)
+        hit_buf = cl.Buffer(self.context, mf.READ_WRITE | mf.COPY_HOST_PTR, hostbuf=hit)
+
+        self._kernel(self.queue, (count,), None, words_buf, offsets_buf, self._target_buf, hit_buf)
+        cl.enqueue_copy(self.queue, hit, hit_buf)
+        index = int(hit[0]) if hit[0] != _NO_HIT else -1
+
+        long_words = np.flatnonzero(lengths > MAX_KERNEL_WORD_LENGTH)
+        if long_words.size:
+            match = self._host_match([block[i] for i in long_words])
+            if match >= 0 and (index < 0 or long_words[match] < index):
+                index = int(long_words[match])
+
+        return index
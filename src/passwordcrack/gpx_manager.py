@@ -12,6 +12,8 @@ import json
 import subprocess
 import platform
 import re
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime
@@ -114,6 +116,9 @@ class GPXManager:
     performance benchmarking, and device tier classification.
     """
     
+    # Forced rescans within this many seconds of the last scan reuse its result
+    RESCAN_TTL = 1.0
+    
     def __init__(self, cache_file: Optional[Path] = None):
         """
         Initialize GPX Manager.
@@ -131,6 +136,9 @@ class GPXManager:
         self.selected_devices: List[GPXDevice] = []
         self.gpx_enabled = False
         self.allow_mixed_mode = True  # Allow CPU + GPU
+        self._last_scan_time: Optional[float] = None  # time.monotonic() of last scan
+        # Serializes cache writes (benchmarks of different devices run concurrently)
+        self._cache_lock = threading.Lock()
         
         # Load cached device info
         self._load_cache()
@@ -148,6 +156,13 @@ class GPXManager:
         if not force_rescan and self.devices:
             return self.devices
         
+        # Share one scan between back-to-back forced rescans (e.g. repeated
+        # device verification from a UI loop)
+        now = time.monotonic()
+        if (self.devices and self._last_scan_time is not None and
+                now - self._last_scan_time < self.RESCAN_TTL):
+            return self.devices
+        
         self.devices = []
         
         # Detect CPU
@@ -160,6 +175,7 @@ class GPXManager:
         
         # Save to cache
         self._save_cache()
+        self._last_scan_time = time.monotonic()
         
         return self.devices
     
@@ -1130,7 +1146,7 @@ class GPXManager:
                 "devices": [d.to_dict() for d in self.devices]
             }
             
-            with open(self.cache_file, 'w') as f:
+            with self._cache_lock, open(self.cache_file, 'w') as f:
                 json.dump(data, f, indent=2)
         
         except Exception as e:
@@ -1144,6 +1160,7 @@ class GPXManager:
         self.devices = []
         self.cpu_device = None
         self.selected_devices = []
+        self._last_scan_time = None
     
     def get_device_summary(self) -> str:
         """
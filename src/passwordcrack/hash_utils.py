@@ -7,7 +7,8 @@ All hashing is done locally on user-provided data only.
 
 import hashlib
 import hmac
-from typing import Optional, Dict, Any
+from operator import methodcaller
+from typing import Optional, Dict, Any, Callable, List, Union
 from enum import Enum
 
 try:
@@ -23,6 +24,13 @@ try:
 except ImportError:
     ARGON2_AVAILABLE = False
 
+# NTLM needs MD4, which OpenSSL 3 only ships in its legacy provider
+try:
+    hashlib.new('md4')
+    NTLM_AVAILABLE = True
+except ValueError:
+    NTLM_AVAILABLE = False
+
 
 class HashAlgorithm(Enum):
     """Supported hash algorithms."""
@@ -36,6 +44,25 @@ class HashAlgorithm(Enum):
     ARGON2 = "argon2"
 
 
+# Hex digest lengths checked by HashUtils.validate_hash
+_EXPECTED_HEX_LENGTHS: Dict[HashAlgorithm, int] = {
+    HashAlgorithm.MD5: 32,
+    HashAlgorithm.SHA1: 40,
+    HashAlgorithm.SHA256: 64,
+    HashAlgorithm.SHA512: 128,
+    HashAlgorithm.NTLM: 32
+}
+
+# hashlib constructors for algorithms block_matcher compares as raw digests
+_RAW_DIGEST_ALGORITHMS: Dict[HashAlgorithm, Callable] = {
+    HashAlgorithm.MD5: hashlib.md5,
+    HashAlgorithm.SHA1: hashlib.sha1,
+    HashAlgorithm.SHA256: hashlib.sha256,
+    HashAlgorithm.SHA512: hashlib.sha512
+}
+_digest = methodcaller('digest')
+
+
 class HashUtils:
     """Utility class for generating password hashes."""
     
@@ -103,6 +130,54 @@ class HashUtils:
         else:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
     
+    @staticmethod
+    def generate_digest(password: Union[str, bytes], algorithm: HashAlgorithm) -> bytes:
+        """
+        Generate the raw digest of a password for an unsalted algorithm.
+        
+        Args:
+            password: The password to hash, or its UTF-8 bytes (pre-encoded
+                wordlists skip the per-call encode)
+            algorithm: MD5, SHA1, SHA256, SHA512 or NTLM
+            
+        Returns:
+            Digest bytes (generate_hash returns the same value hex-encoded)
+            
+        Raises:
+            ValueError: If the algorithm is salted (bcrypt, PBKDF2, Argon2)
+        """
+        if algorithm == HashAlgorithm.NTLM:
+            if isinstance(password, bytes):
+                password = password.decode('utf-8')
+            return hashlib.new('md4', password.encode('utf-16le')).digest()
+        
+        hash_fn = _RAW_DIGEST_ALGORITHMS.get(algorithm)
+        if hash_fn is None:
+            raise ValueError(f"{algorithm.value} has no raw digest")
+        if isinstance(password, str):
+            password = password.encode('utf-8')
+        return hash_fn(password).digest()
+    
+    @staticmethod
+    def target_digest(hash_value: str, algorithm: HashAlgorithm) -> Optional[bytes]:
+        """
+        Decode a target hash for comparison with generate_digest.
+        
+        Args:
+            hash_value: Target hash
+            algorithm: Hash algorithm of the target
+            
+        Returns:
+            Digest bytes, or None if the algorithm is salted or the hash
+            is not valid hex
+        """
+        if algorithm not in _EXPECTED_HEX_LENGTHS:
+            return None
+        try:
+            return bytes.fromhex(hash_value.strip())
+        except ValueError:
+            return None
+    
     @staticmethod
     def verify_hash(password: str, hash_value: str, algorithm: HashAlgorithm) -> bool:
         """
@@ -146,9 +221,8 @@ class HashUtils:
                 return key.hex() == stored_hash
                 
             else:
-                # For simple hashes, just generate and compare
-                generated = HashUtils.generate_hash(password, algorithm)
-                return generated.lower() == hash_value.lower()
+                # For simple hashes, compare raw digests
+                return HashUtils.generate_digest(password, algorithm) == bytes.fromhex(hash_value)
                 
         except Exception:
             return False
@@ -254,17 +328,8 @@ class HashUtils:
         """
         hash_value = hash_value.strip()
         
-        # Define expected lengths
-        expected_lengths = {
-            HashAlgorithm.MD5: 32,
-            HashAlgorithm.SHA1: 40,
-            HashAlgorithm.SHA256: 64,
-            HashAlgorithm.SHA512: 128,
-            HashAlgorithm.NTLM: 32
-        }
-        
-        if algorithm in expected_lengths:
-            expected_len = expected_lengths[algorithm]
+        expected_len = _EXPECTED_HEX_LENGTHS.get(algorithm)
+        if expected_len is not None:
             actual_len = len(hash_value)
             
             if actual_len != expected_len:
@@ -277,3 +342,73 @@ class HashUtils:
                 return False, f"Hash contains non-hexadecimal characters"
         
         return True, ""
+    
+    @staticmethod
+    def block_matcher(hash_value: str, algorithm: HashAlgorithm) -> Callable[[List[bytes]], int]:
+        """
+        Build a function that hashes a block of candidates and finds the target.
+        
+        Plain digest algorithms are hashed and compared as raw bytes through
+        C-level map() calls. NTLM and PBKDF2 get loops with the target parsed
+        up front; bcrypt and Argon2 are checked candidate by candidate with
+        verify_hash.
+        
+        Args:
+            hash_value: Target hash (hex for plain digest algorithms)
+            algorithm: Hash algorithm of the target
+            
+        Returns:
+            Function taking a list of UTF-8 candidates and returning the index
+            of the matching candidate, or -1 if none match
+        """
+        hash_fn = _RAW_DIGEST_ALGORITHMS.get(algorithm)
+        if hash_fn is not None:
+            target = bytes.fromhex(hash_value)
+            
+            def find_match(block: List[bytes]) -> int:
+                hashes = list(map(_digest, map(hash_fn, block)))
+                return hashes.index(target) if target in hashes else -1
+            
+            return find_match
+        
+        if algorithm == HashAlgorithm.NTLM and NTLM_AVAILABLE:
+            target = bytes.fromhex(hash_value)
+            
+            def find_match(block: List[bytes]) -> int:
+                for index, candidate in enumerate(block):
+                    utf16 = candidate.decode('utf-8', 'ignore').encode('utf-16le')
+                    if hashlib.new('md4', utf16).digest() == target:
+                        return index
+                return -1
+            
+            return find_match
+        
+        if algorithm == HashAlgorithm.PBKDF2_SHA256:
+            # Parse iterations and salt once rather than per candidate
+            try:
+                iterations, salt, stored = hash_value.split('$')
+                iterations = int(iterations)
+                salt = bytes.fromhex(salt)
+                stored = bytes.fromhex(stored)
+            except ValueError:
+                return lambda block: -1
+            
+            def find_match(block: List[bytes]) -> int:
+                for index, candidate in enumerate(block):
+                    if hashlib.pbkdf2_hmac('sha256', candidate, salt, iterations) == stored:
+                        return index
+                return -1
+            
+            return find_match
+        
+        # generate_hash draws a fresh salt for bcrypt/PBKDF2/Argon2, so its
+        # output never equals the target; verify_hash parses the stored salt
+        verify = HashUtils.verify_hash
+        
+        def find_match(block: List[bytes]) -> int:
+            for index, candidate in enumerate(block):
+                if verify(candidate.decode('utf-8', 'ignore'), hash_value, algorithm):
+                    return index
+            return -1
+        
+        return find_match
@@ -7,15 +7,86 @@ password cracking operations.
 NOTE: EDUCATIONAL USE ONLY - REQUIRES HASHCAT INSTALLATION
 """
 
+import os
 import subprocess
+import sys
 import re
+import math
 import threading
+import traceback
 import queue
 from pathlib import Path
-from typing import Optional, Callable, Dict, List, Any, Tuple
+from typing import Optional, Callable, Dict, List, Any, Sequence, Tuple, Union
 from enum import Enum
+from functools import lru_cache
 from .hash_utils import HashAlgorithm
 from .gpx_manager import GPXManager, GPXDevice, DeviceType
+from .performance import format_duration
+
+try:
+    # Third-party ``regex`` engine, used for the status parser when installed
+    import regex as re_fast
+    REGEX_AVAILABLE = True
+except ImportError:
+    re_fast = re
+    REGEX_AVAILABLE = False
+
+
+# Single multiline sweep over hashcat status output; each alternative
+# captures one field so the caller can dispatch on ``match.lastgroup``
+_RE_STATS = re_fast.compile(
+    r'^[ \t]*(?:'
+    r'Status\.+:[ \t]*(?P<status>.+)'
+    r'|Progress\.+:[ \t]*(?P<prog_cur>\d+)/(?P<prog_tot>\d+)'
+    r'|Speed\.#\d+\.+:[ \t]*(?P<spd>[\d.]+)[ \t]*(?P<spd_unit>[kMG]?H/s)'
+    r'|Recovered\.+:[ \t]*(?P<rec>\d+/\d+)'
+    r'|\* Device #\d+: (?P<dev>[^,\r\n]+)'
+    r')',
+    re_fast.MULTILINE
+)
+
+# Keywords marking backend, error or warning notice lines. Matched without
+# ``^.*``/``.*$`` wrappers (which backtrack across every line); the caller
+# expands each hit to its enclosing line.
+_RE_NOTICES = re_fast.compile(
+    r'Platform|Falling back to OpenCL|Failed to initialize'
+    r'|not installed or incorrectly installed'
+    r'|wordlist or mask that you are using is too small'
+)
+
+# Speed unit -> H/s multiplier
+_SPEED_MULT = {'H/s': 1, 'kH/s': 1000, 'MH/s': 1_000_000, 'GH/s': 1_000_000_000}
+
+# Hashcat mask charset tokens and their sizes
+_MASK_TOKEN_RE = re.compile(r'\?[ludsab]')
+_MASK_SIZES = {
+    "?l": 26,  # lowercase
+    "?u": 26,  # uppercase
+    "?d": 10,  # digits
+    "?s": 33,  # special chars
+    "?a": 95,  # all printable ASCII
+    "?b": 256  # all bytes
+}
+
+# GPU-resistant algorithms (slow hashing), keyed by hashcat mode
+_RESISTANT_MODES = {
+    "3200": "bcrypt - Designed to resist GPU acceleration",
+    "7500": "Kerberos 5 - Memory-hard algorithm",
+    "9000": "Password Safe v2 - Slow hashing",
+    "15700": "Ethereum Wallet - Memory-hard",
+    "22000": "WPA-PBKDF2 - Slow hashing"
+}
+
+
+# Hashcat -m mode per algorithm, looked up by HashcatMode.from_algorithm
+_HASHCAT_MODES: Dict[HashAlgorithm, str] = {
+    HashAlgorithm.MD5: "0",
+    HashAlgorithm.SHA1: "100",
+    HashAlgorithm.SHA256: "1400",
+    HashAlgorithm.SHA512: "1700",
+    HashAlgorithm.BCRYPT: "3200",
+    HashAlgorithm.NTLM: "1000"
+}
 
 
 class HashcatMode(Enum):
@@ -38,15 +109,7 @@ class HashcatMode(Enum):
         Returns:
             Hashcat mode string
         """
-        mapping = {
-            HashAlgorithm.MD5: "0",
-            HashAlgorithm.SHA1: "100",
-            HashAlgorithm.SHA256: "1400",
-            HashAlgorithm.SHA512: "1700",
-            HashAlgorithm.BCRYPT: "3200",
-            HashAlgorithm.NTLM: "1000"
-        }
-        return mapping.get(algorithm, "0")
+        return _HASHCAT_MODES.get(algorithm, "0")
 
 
 class HashcatAttackMode(Enum):
@@ -91,6 +154,9 @@ class HashcatWrapper:
         self.output_queue: queue.Queue = queue.Queue()
         self.progress_data: Dict[str, Any] = {}
         self.result: Optional[str] = None
+        # Progress events for poll_progress(); created by its first call so
+        # nothing is queued for callers that never poll
+        self._progress_q: Optional[queue.SimpleQueue] = None
         
         # Don't raise error - just warn. This allows CPU mode to work.
         if not self.hashcat_path:
@@ -178,11 +244,12 @@ class HashcatWrapper:
         self,
         hash_value: str,
         hash_mode: str,
-        wordlist_path: Path,
+        wordlist_path: Union[str, Path, Sequence[Union[str, Path]]],
         devices: Optional[List[GPXDevice]] = None,
         rules_file: Optional[Path] = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
-        output_file: Optional[Path] = None
+        output_file: Optional[Path] = None,
+        slow_candidates: bool = False
     ) -> Dict[str, Any]:
         """
         Perform dictionary attack using hashcat.
@@ -190,22 +257,97 @@ class HashcatWrapper:
         Args:
             hash_value: Hash to crack
             hash_mode: Hashcat hash mode
-            wordlist_path: Path to wordlist
+            wordlist_path: Path to wordlist, or several wordlists for one hashcat run
             devices: List of devices to use
             rules_file: Optional rules file
             progress_callback: Callback for progress updates
             output_file: Optional output file for results
+            slow_candidates: Pass -S (generate candidates on the host)
             
         Returns:
             Result dictionary
         """
+        result = self.crack_dictionary_batch(
+            [hash_value],
+            hash_mode,
+            wordlist_path,
+            devices=devices,
+            rules_file=rules_file,
+            progress_callback=progress_callback,
+            output_file=output_file,
+            slow_candidates=slow_candidates
+        )
+        
+        if result["status"] != "done":
+            return result
+        
+        cracked_password = result["results"].get(hash_value.lower())
+        if cracked_password is not None:
+            return {
+                "status": "cracked",
+                "password": cracked_password,
+                "hash": hash_value,
+                "output": result["output"]
+            }
+        
+        return {
+            "status": "exhausted",
+            "message": "Wordlist exhausted without finding password",
+            "output": result["output"]
+        }
+    
+    def crack_dictionary_batch(
+        self,
+        hashes: List[str],
+        hash_mode: str,
+        wordlist_path: Union[str, Path, Sequence[Union[str, Path]]],
+        devices: Optional[List[GPXDevice]] = None,
+        rules_file: Optional[Path] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        output_file: Optional[Path] = None,
+        slow_candidates: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Perform a dictionary attack against several hashes in one hashcat run.
+        
+        Hashcat loads every hash from the hash file and checks each candidate
+        against all of them, so cracking N hashes costs about the same as one.
+        Several wordlists are passed to the same process one after another,
+        so device setup and kernel compilation happen once.
+        
+        Args:
+            hashes: Hashes to crack (all of the same hash mode)
+            hash_mode: Hashcat hash mode
+            wordlist_path: Path to wordlist, or several wordlists for one hashcat run
+            devices: List of devices to use
+            rules_file: Optional rules file
+            progress_callback: Callback for progress updates
+            output_file: Optional output file for results
+            slow_candidates: Pass -S (generate candidates on the host)
+            
+        Returns:
+            Result dictionary: {
+                'status': 'done',
+                'results': {hash_lowercase: password},
+                'uncracked': [hashes not recovered],
+                'output': hashcat stdout
+            }
+        """
         if not self.hashcat_path:
             return {"status": "error", "message": "Hashcat not available"}
         
-        # Create temporary hash file (use absolute path)
+        if not hashes:
+            return {"status": "error", "message": "No hashes to crack"}
+        
+        if isinstance(wordlist_path, (str, os.PathLike)):
+            wordlist_paths = [Path(wordlist_path)]
+        else:
+            wordlist_paths = [Path(path) for path in wordlist_path]
+        
+        # Create temporary hash file (use absolute path), one hash per line
         hash_file = Path.cwd() / ".temp_hash.txt"
         hash_file = hash_file.resolve()  # Convert to absolute path
-        hash_file.write_text(hash_value)
+        hash_file.write_text('\n'.join(hashes) + '\n')
         
         # Create output file for cracked passwords
         if not output_file:
@@ -220,9 +362,9 @@ class HashcatWrapper:
             "-m", hash_mode,
             "-a", HashcatAttackMode.DICTIONARY.value,
             str(hash_file),
-            str(wordlist_path.resolve()),  # Use absolute path for wordlist too
+            *(str(path.resolve()) for path in wordlist_paths),  # Absolute paths for wordlists too
             "-o", str(output_file),  # Output file for results
-            "--outfile-format", "2"  # Format: hash:password
+            "--outfile-format", "1,2"  # Format: hash:password
         ]
         
         # Add device selection
@@ -236,6 +378,11 @@ class HashcatWrapper:
         if rules_file and rules_file.exists():
             cmd.extend(["-r", str(rules_file)])
         
+        # Slow-candidate mode keeps the device busy when the wordlist is too
+        # small (or the hash too slow) to fill it with amplified candidates
+        if slow_candidates:
+            cmd.append("-S")
+        
         # Add status output for progress tracking
         cmd.append("--status")
         cmd.extend(["--status-timer", "1"])
@@ -248,8 +395,9 @@ class HashcatWrapper:
         print(f"HASHCAT DICTIONARY COMMAND:")
         print(f"Command: {' '.join(cmd)}")
         print(f"Working Dir: {self.hashcat_dir}")
-        print(f"Hash File: {hash_file} (exists: {hash_file.exists()})")
-        print(f"Wordlist: {wordlist_path} (exists: {wordlist_path.exists()})")
+        print(f"Hash File: {hash_file} (exists: {hash_file.exists()}, hashes: {len(hashes)})")
+        for path in wordlist_paths:
+            print(f"Wordlist: {path} (exists: {path.exists()})")
         print(f"{'='*60}\n")
         
         try:
@@ -272,16 +420,26 @@ class HashcatWrapper:
             print(f"\nSTDERR:\n{result.stderr}")
             print(f"{'='*60}\n")
             
-            # Parse result from output file first, then from stdout
-            cracked_password = None
+            # Parse results from output file first, then from stdout
+            results: Dict[str, str] = {}
             if output_file.exists() and output_file.stat().st_size > 0:
                 output_content = output_file.read_text().strip()
                 print(f"DEBUG: Output file content: {output_content}")
-                cracked_password = self._parse_cracked_password(output_content, hash_value)
+                for line in output_content.splitlines():
+                    cracked_hash, sep, password = line.partition(':')
+                    if sep:
+                        results[cracked_hash.strip().lower()] = password.strip()
+                    elif len(hashes) == 1 and line:
+                        # Plain-only output: the single hash is the one cracked
+                        results[hashes[0].lower()] = line.strip()
             
-            if not cracked_password:
+            uncracked = [h for h in hashes if h.lower() not in results]
+            for hash_value in uncracked:
                 # Fallback to parsing stdout
                 cracked_password = self._parse_cracked_password(result.stdout, hash_value)
+                if cracked_password:
+                    results[hash_value.lower()] = cracked_password
+            uncracked = [h for h in uncracked if h.lower() not in results]
             
             # Clean up
             if hash_file.exists():
@@ -299,21 +457,13 @@ class HashcatWrapper:
                 self.status = HashcatStatus.ERROR
                 return {"status": "error", "message": error_msg}
             
-            if cracked_password:
-                self.status = HashcatStatus.CRACKED
-                return {
-                    "status": "cracked",
-                    "password": cracked_password,
-                    "hash": hash_value,
-                    "output": result.stdout
-                }
-            else:
-                self.status = HashcatStatus.EXHAUSTED
-                return {
-                    "status": "exhausted",
-                    "message": "Wordlist exhausted without finding password",
-                    "output": result.stdout
-                }
+            self.status = HashcatStatus.EXHAUSTED if uncracked else HashcatStatus.CRACKED
+            return {
+                "status": "done",
+                "results": results,
+                "uncracked": uncracked,
+                "output": result.stdout
+            }
         
         except subprocess.TimeoutExpired:
             self.status = HashcatStatus.ABORTED
@@ -325,7 +475,6 @@ class HashcatWrapper:
             self.status = HashcatStatus.ERROR
             if hash_file.exists():
                 hash_file.unlink()
-            import traceback
             return {"status": "error", "message": f"{str(e)}\n{traceback.format_exc()}"}
         
         finally:
@@ -340,7 +489,10 @@ class HashcatWrapper:
         mask: str,
         devices: Optional[List[GPXDevice]] = None,
         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
-        output_file: Optional[Path] = None
+        output_file: Optional[Path] = None,
+        optimized_kernels: bool = True,
+        workload: Optional[int] = 4,
+        increment_min: int = 1
     ) -> Dict[str, Any]:
         """
         Perform brute-force/mask attack using hashcat.
@@ -352,6 +504,9 @@ class HashcatWrapper:
             devices: List of devices to use
             progress_callback: Callback for progress updates
             output_file: Optional output file
+            optimized_kernels: Pass -O (optimized kernels, passwords up to 32 chars)
+            workload: Hashcat workload profile 1-4 for -w, None for hashcat's default
+            increment_min: First mask length tried by --increment
             
         Returns:
             Result dictionary
@@ -388,14 +543,16 @@ class HashcatWrapper:
             cmd.extend(device_args)
         
         # Add optimization flags for maximum GPU performance
-        cmd.append("-O")  # Enable optimized kernels (faster, max 32 char passwords)
-        cmd.append("-w")  # Workload profile
-        cmd.append("4")   # 4 = Nightmare mode (max GPU usage, may freeze UI)
+        if optimized_kernels:
+            cmd.append("-O")  # Enable optimized kernels (faster, max 32 char passwords)
+        if workload is not None:
+            cmd.append("-w")  # Workload profile
+            cmd.append(str(workload))  # 4 = Nightmare mode (max GPU usage, may freeze UI)
         
         # Add INCREMENTAL mode - automatically tries all lengths from 1 onwards (NO MAX LIMIT)
         cmd.append("--increment")  # Enable incremental mode
-        cmd.append("--increment-min")  # Start from length 1
-        cmd.append("1")
+        cmd.append("--increment-min")  # Start from the shortest length worth trying
+        cmd.append(str(increment_min))
         # NOTE: No --increment-max = will continue until mask length (16 chars) or password found
         
         # Add status output for real-time progress
@@ -419,7 +576,6 @@ class HashcatWrapper:
             self.status = HashcatStatus.RUNNING
             
             # Use Popen for real-time output streaming WITHOUT text mode (binary)
-            import os
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
@@ -432,6 +588,21 @@ class HashcatWrapper:
             # Store process reference for stop functionality
             self.current_process = process
             
+            # Progress events for the callback thread; none are posted without a consumer
+            progress_q: Optional[queue.SimpleQueue] = queue.SimpleQueue() if progress_callback else None
+            
+            # Discard progress events a poller left over from a previous run
+            if self._progress_q is not None:
+                self._progress_q = queue.SimpleQueue()
+            
+            def post_progress(event: Dict[str, Any]) -> None:
+                """Queue an event for the callback thread and/or poll_progress"""
+                if progress_q is not None:
+                    progress_q.put_nowait(event)
+                poll_q = self._progress_q
+                if poll_q is not None:
+                    poll_q.put_nowait(event)
+            
             # Collect output
             stdout_lines = []
             stderr_lines = []
@@ -447,18 +618,17 @@ class HashcatWrapper:
                             if line_str:
                                 stdout_lines.append(line_str + '\n')
                                 print(f"HASHCAT STDOUT: {line_str}")
-                                import sys
                                 sys.stdout.flush()
                                 
-                                # Call progress callback
-                                if progress_callback:
+                                # Post progress events (callback thread and/or poll_progress)
+                                if progress_q is not None or self._progress_q is not None:
                                     # Parse candidates
                                     if 'Candidates' in line_str and ':' in line_str:
                                         try:
                                             parts = line_str.split(':', 1)
                                             if len(parts) == 2:
                                                 candidate_info = parts[1].strip()
-                                                progress_callback({
+                                                post_progress({
                                                     'type': 'candidate',
                                                     'info': candidate_info
                                                 })
@@ -470,7 +640,7 @@ class HashcatWrapper:
                                         try:
                                             stats = self._parse_hashcat_stats('\n'.join(stdout_lines))
                                             if stats.get('progress', 0) > 0:
-                                                progress_callback({
+                                                post_progress({
                                                     'type': 'progress',
                                                     'attempts': stats.get('progress', 0),
                                                     'total': stats.get('total', 0),
@@ -495,7 +665,6 @@ class HashcatWrapper:
                             if line_str:
                                 stderr_lines.append(line_str + '\n')
                                 print(f"HASHCAT STDERR: {line_str}")
-                                import sys
                                 sys.stdout.flush()
                         except Exception as e:
                             print(f"DEBUG: Stderr decode error: {e}")
@@ -503,14 +672,52 @@ class HashcatWrapper:
                 except Exception as e:
                     print(f"DEBUG: read_stderr error: {e}")
             
+            def dispatch_progress():
+                """Deliver queued progress events to the legacy callback"""
+                done = False
+                while not done:
+                    # Block for one event, then take whatever else is already queued
+                    batch = [progress_q.get()]
+                    while len(batch) < 256:
+                        try:
+                            batch.append(progress_q.get_nowait())
+                        except queue.Empty:
+                            break
+                    
+                    # Coalesce: every candidate line in order, but only the newest
+                    # progress snapshot, so a slow callback never falls behind
+                    latest_progress = None
+                    for event in batch:
+                        if event is None:
+                            done = True
+                            break
+                        if event['type'] == 'progress':
+                            latest_progress = event
+                            continue
+                        try:
+                            progress_callback(event)
+                        except Exception as e:
+                            print(f"DEBUG: Progress callback error: {e}")
+                    
+                    if latest_progress is not None:
+                        try:
+                            progress_callback(latest_progress)
+                        except Exception as e:
+                            print(f"DEBUG: Progress callback error: {e}")
+            
             # Start background threads to read stdout/stderr
             stdout_thread = threading.Thread(target=read_stdout, daemon=True)
             stderr_thread = threading.Thread(target=read_stderr, daemon=True)
             stdout_thread.start()
             stderr_thread.start()
             
+            # Keep progress_callback working by draining the queue on a consumer thread
+            callback_thread = None
+            if progress_callback:
+                callback_thread = threading.Thread(target=dispatch_progress, daemon=True)
+                callback_thread.start()
+            
             print("DEBUG: Started output reader threads")
-            import sys
             sys.stdout.flush()
             
             # Wait for process to complete
@@ -523,6 +730,11 @@ class HashcatWrapper:
             stdout_thread.join(timeout=5)
             stderr_thread.join(timeout=5)
             
+            # Stop the callback consumer once all queued events are delivered
+            if callback_thread:
+                progress_q.put_nowait(None)
+                callback_thread.join(timeout=5)
+            
             # Clear process reference
             self.current_process = None
             
@@ -658,7 +870,6 @@ class HashcatWrapper:
                 hash_file.unlink()
             if output_file.exists():
                 output_file.unlink()
-            import traceback
             return {"status": "error", "message": f"{str(e)}\n{traceback.format_exc()}"}
         
         finally:
@@ -668,6 +879,33 @@ class HashcatWrapper:
             if output_file.exists():
                 output_file.unlink()
     
+    def poll_progress(self, max_items: int = 64) -> List[Dict[str, Any]]:
+        """
+        Drain pending progress events without blocking.
+        
+        Intended to be called periodically from the UI main loop so widget
+        updates happen on the UI thread rather than the hashcat reader thread.
+        Events are only queued once this has been called, so callers that
+        never poll do not accumulate them.
+        
+        Args:
+            max_items: Maximum number of events to return
+            
+        Returns:
+            List of progress event dicts (oldest first)
+        """
+        if self._progress_q is None:
+            self._progress_q = queue.SimpleQueue()
+            return []
+        
+        events = []
+        while len(events) < max_items:
+            try:
+                events.append(self._progress_q.get_nowait())
+            except queue.Empty:
+                break
+        return events
+    
     def stop_attack(self) -> bool:
         """Stop the currently running hashcat process.
         
@@ -676,7 +914,6 @@ class HashcatWrapper:
         """
         if self.current_process and self.current_process.poll() is None:
             print("DEBUG: Stopping hashcat process...")
-            import sys
             sys.stdout.flush()
             try:
                 self.current_process.terminate()
@@ -712,11 +949,13 @@ class HashcatWrapper:
         print(f"\nDEBUG: Parsing password from output...")
         print(f"DEBUG: Looking for hash: {hash_value[:32]}...")
         
-        lines = output.split('\n')
-        
-        for line in lines:
+        # Hashcat writes hex digests in lowercase, so compare against the raw
+        # line first and only lowercase the line when that misses
+        target = hash_value.lower()
+
+        for line in output.splitlines():
             # Look for "hash:password" format
-            if hash_value.lower() in line.lower():
+            if target in line or target in line.lower():
                 print(f"DEBUG: Found matching line: {line}")
                 parts = line.split(':')
                 if len(parts) >= 2:
@@ -748,7 +987,6 @@ class HashcatWrapper:
                 'device_name': str
             }
         """
-        import re
         stats = {
             'status': 'Unknown',
             'progress': 0,
@@ -761,42 +999,42 @@ class HashcatWrapper:
             'device_name': ''
         }
         
-        lines = stdout.split('\n')
-        
-        for line in lines:
-            line_stripped = line.strip()
+        for match in _RE_STATS.finditer(stdout):
+            field = match.lastgroup
             
             # Status line: "Status...........: Exhausted"
-            if line_stripped.startswith('Status'):
-                match = re.search(r'Status\.+:\s*(.+)', line_stripped)
-                if match:
-                    stats['status'] = match.group(1).strip()
+            if field == 'status':
+                stats['status'] = match.group('status').strip()
             
             # Progress line: "Progress.........: 10000/10000 (100.00%)"
-            elif line_stripped.startswith('Progress'):
-                match = re.search(r'Progress\.+:\s*(\d+)/(\d+)', line_stripped)
-                if match:
-                    stats['progress'] = int(match.group(1))
-                    stats['total'] = int(match.group(2))
-            
-            # Speed line: "Speed.#01........: 10636.0 kH/s"
-            elif 'Speed.#' in line_stripped:
-                match = re.search(r'Speed\.#\d+\.+:\s*([\d.]+)\s*(H/s|kH/s|MH/s|GH/s)', line_stripped)
-                if match:
-                    speed_value = float(match.group(1))
-                    speed_unit = match.group(2)
-                    # Convert to H/s
-                    multipliers = {'H/s': 1, 'kH/s': 1000, 'MH/s': 1000000, 'GH/s': 1000000000}
-                    stats['speed'] = speed_value * multipliers.get(speed_unit, 1)
+            elif field == 'prog_tot':
+                stats['progress'] = int(match.group('prog_cur'))
+                stats['total'] = int(match.group('prog_tot'))
+            
+            # Speed line: "Speed.#01........: 10636.0 kH/s" (converted to H/s)
+            elif field == 'spd_unit':
+                stats['speed'] = float(match.group('spd')) * _SPEED_MULT.get(match.group('spd_unit'), 1)
             
             # Recovered line: "Recovered........: 0/1 (0.00%) Digests"
-            elif line_stripped.startswith('Recovered'):
-                match = re.search(r'Recovered\.+:\s*(\d+/\d+)', line_stripped)
-                if match:
-                    stats['recovered'] = match.group(1)
+            elif field == 'rec':
+                stats['recovered'] = match.group('rec')
+            
+            # Device name: "* Device #01: NVIDIA RTX 2000..."
+            elif field == 'dev':
+                stats['device_name'] = match.group('dev').strip()
+        
+        last_line_start = -1
+        for match in _RE_NOTICES.finditer(stdout):
+            line_start = stdout.rfind('\n', 0, match.start()) + 1
+            if line_start == last_line_start:
+                continue  # Another keyword on a line already handled
+            last_line_start = line_start
+            line_end = stdout.find('\n', match.end())
+            # Strip once; all checks below run on the stripped line
+            line = stdout[line_start:line_end if line_end != -1 else len(stdout)].strip()
             
             # Backend detection
-            elif 'CUDA' in line and 'Platform' in line:
+            if 'CUDA' in line and 'Platform' in line:
                 stats['backend'] = 'CUDA'
             elif 'OpenCL' in line and 'Platform' in line:
                 stats['backend'] = 'OpenCL'
@@ -804,17 +1042,9 @@ class HashcatWrapper:
                 stats['backend'] = 'OpenCL (CUDA fallback)'
                 stats['warnings'].append('CUDA RTC initialization failed, using OpenCL backend')
             
-            # Device name: "* Device #01: NVIDIA RTX 2000..."
-            elif line_stripped.startswith('* Device #'):
-                match = re.search(r'\* Device #\d+: (.+?)(?:,|$)', line_stripped)
-                if match:
-                    stats['device_name'] = match.group(1).strip()
-            
             # Error detection
-            elif 'Failed to initialize' in line:
-                stats['errors'].append(line_stripped)
-            elif 'not installed or incorrectly installed' in line:
-                stats['errors'].append(line_stripped)
+            elif 'Failed to initialize' in line or 'not installed or incorrectly installed' in line:
+                stats['errors'].append(line)
             
             # Warnings
             elif 'wordlist or mask that you are using is too small' in line:
@@ -837,24 +1067,12 @@ class HashcatWrapper:
         Returns:
             Tuple of (seconds, formatted_string)
         """
-        if speed_h_per_s == 0:
+        if speed_h_per_s <= 0:
             return (float('inf'), "Unknown")
         
         seconds = keyspace / speed_h_per_s
         
-        # Format time
-        if seconds < 60:
-            return (seconds, f"{seconds:.1f} seconds")
-        elif seconds < 3600:
-            return (seconds, f"{seconds / 60:.1f} minutes")
-        elif seconds < 86400:
-            return (seconds, f"{seconds / 3600:.1f} hours")
-        elif seconds < 2592000:
-            return (seconds, f"{seconds / 86400:.1f} days")
-        elif seconds < 31536000:
-            return (seconds, f"{seconds / 2592000:.1f} months")
-        else:
-            return (seconds, f"{seconds / 31536000:.1f} years")
+        return (seconds, format_duration(seconds))
     
     def calculate_wordlist_size(self, wordlist_path: Path) -> int:
         """
@@ -867,8 +1085,22 @@ class HashcatWrapper:
             Number of words
         """
         try:
-            with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return sum(1 for _ in f)
+            # Count newlines in raw 1 MB blocks - no decoding, no per-line objects
+            count = 0
+            last_block = b''
+            with open(wordlist_path, 'rb') as f:
+                read = f.read
+                while True:
+                    block = read(1 << 20)
+                    if not block:
+                        break
+                    count += block.count(b'\n')
+                    last_block = block
+            
+            # Final line without a trailing newline
+            if last_block and not last_block.endswith(b'\n'):
+                count += 1
+            return count
         except Exception:
             return 0
     
@@ -882,34 +1114,12 @@ class HashcatWrapper:
         Returns:
             Keyspace size
         """
-        # Hashcat mask charsets
-        charsets = {
-            "?l": 26,  # lowercase
-            "?u": 26,  # uppercase
-            "?d": 10,  # digits
-            "?s": 33,  # special chars
-            "?a": 95,  # all printable ASCII
-            "?b": 256  # all bytes
-        }
-        
-        keyspace = 1
-        i = 0
-        
-        while i < len(mask):
-            if mask[i] == '?' and i + 1 < len(mask):
-                charset_key = mask[i:i+2]
-                if charset_key in charsets:
-                    keyspace *= charsets[charset_key]
-                    i += 2
-                    continue
-            
-            # Single character
-            keyspace *= 1
-            i += 1
-        
-        return keyspace
+        # Literal characters contribute a factor of 1, so only charset tokens matter
+        return math.prod(_MASK_SIZES[token] for token in _MASK_TOKEN_RE.findall(mask))
     
-    def check_gpu_resistance(self, hash_mode: str) -> Tuple[bool, str]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def check_gpu_resistance(hash_mode: str) -> Tuple[bool, str]:
         """
         Check if hash algorithm is GPU-resistant.
         
@@ -919,17 +1129,8 @@ class HashcatWrapper:
         Returns:
             Tuple of (is_resistant, explanation)
         """
-        # GPU-resistant algorithms (slow hashing)
-        resistant_modes = {
-            "3200": "bcrypt - Designed to resist GPU acceleration",
-            "7500": "Kerberos 5 - Memory-hard algorithm",
-            "9000": "Password Safe v2 - Slow hashing",
-            "15700": "Ethereum Wallet - Memory-hard",
-            "22000": "WPA-PBKDF2 - Slow hashing"
-        }
-        
-        if hash_mode in resistant_modes:
-            return (True, resistant_modes[hash_mode])
+        if hash_mode in _RESISTANT_MODES:
+            return (True, _RESISTANT_MODES[hash_mode])
         
         return (False, "This algorithm may benefit from GPU acceleration")
     
@@ -955,19 +1156,24 @@ class HashcatWrapper:
         Returns:
             Tuple of (all_available, available_devices)
         """
+        if not devices:
+            return (True, [])
+        
         # Re-detect devices
         self.gpx_manager.detect_devices(force_rescan=True)
         current_devices = self.gpx_manager.devices
         
-        available = []
-        
-        for device in devices:
-            # Check if device still exists
-            for current in current_devices:
-                if (current.device_type == device.device_type and
-                    current.name == device.name):
-                    available.append(current)
-                    break
+        # Index current devices once (reversed so the first duplicate wins),
+        # then check each requested device still exists
+        current_map = {
+            (current.device_type, current.name): current
+            for current in reversed(current_devices)
+        }
+        available = [
+            current_map[key]
+            for device in devices
+            if (key := (device.device_type, device.name)) in current_map
+        ]
         
         all_available = len(available) == len(devices)
         
@@ -2,10 +2,16 @@
 Performance package initialization.
 """
 
-from .benchmark import PerformanceBenchmark, MultiThreadedCracker, estimate_crack_time
+from .benchmark import (
+    PerformanceBenchmark,
+    MultiThreadedCracker,
+    estimate_crack_time,
+    format_duration,
+)
 
 __all__ = [
     'PerformanceBenchmark',
     'MultiThreadedCracker',
     'estimate_crack_time',
+    'format_duration',
 ]
@@ -6,11 +6,193 @@ NOTE: ALL REPORTING IS LOCAL ONLY - NO NETWORK
 """
 
 import json
-import csv
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
-import platform
+from string import Template
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# (system, release, machine), filled in on first use by _platform_info
+_PLATFORM_INFO: Optional[Tuple[str, str, str]] = None
+
+
+def _platform_info() -> Tuple[str, str, str]:
+    """Return cached (system, release, machine) for report footers."""
+    global _PLATFORM_INFO
+    if _PLATFORM_INFO is None:
+        import platform
+        _PLATFORM_INFO = (platform.system(), platform.release(), platform.machine())
+    return _PLATFORM_INFO
+
+
+# Column headers for generate_report_csv
+_CSV_HEADER = (
+    "Session ID",
+    "Attack Type",
+    "Algorithm",
+    "Success",
+    "Password",
+    "Attempts",
+    "Duration (s)",
+    "Speed (attempts/s)",
+    "Created At"
+)
+
+
+def _iter_csv_rows(sessions: List[Dict[str, Any]]) -> Iterator[tuple]:
+    """Yield one CSV row per session without building full analysis dicts."""
+    for session in sessions:
+        get = session.get
+        attempts = get("attempts", 0)
+        found = get("found", False)
+        created_at = get("created_at")
+        last_updated = get("last_updated")
+        
+        duration_seconds = 0
+        if created_at and last_updated:
+            duration_seconds = _session_duration(created_at, last_updated)
+        attempts_per_sec = attempts / duration_seconds if duration_seconds > 0 else 0
+        
+        yield (
+            get("session_id"),
+            get("attack_type"),
+            get("algorithm"),
+            'Yes' if found else 'No',
+            (get("password") if found else None) or 'N/A',
+            attempts,
+            round(duration_seconds, 2),
+            round(attempts_per_sec, 2),
+            created_at
+        )
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# HTML report layout; dynamic fields are filled in by generate_report_html
+_HTML_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>PasswordCrack Suite - Session Report</title>
+    <style>
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 900px;
+            margin: 50px auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #4CAF50;
+            padding-bottom: 10px;
+        }
+        .success {
+            color: #4CAF50;
+            font-weight: bold;
+        }
+        .failure {
+            color: #f44336;
+            font-weight: bold;
+        }
+        .info-grid {
+            display: grid;
+            grid-template-columns: 1fr 2fr;
+            gap: 10px;
+            margin: 20px 0;
+        }
+        .info-label {
+            font-weight: bold;
+            color: #666;
+        }
+        .password {
+            background-color: #fff3cd;
+            padding: 10px;
+            border-left: 4px solid #ffc107;
+            margin: 20px 0;
+        }
+        .footer {
+            margin-top: 30px;
+            padding-top: 20px;
+            border-top: 1px solid #ddd;
+            color: #999;
+            font-size: 0.9em;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🔐 PasswordCrack Suite - Session Report</h1>
+        
+        <div class="info-grid">
+            <div class="info-label">Session ID:</div>
+            <div>${session_id}</div>
+            
+            <div class="info-label">Attack Type:</div>
+            <div>${attack_type}</div>
+            
+            <div class="info-label">Hash Algorithm:</div>
+            <div>${algorithm}</div>
+            
+            <div class="info-label">Result:</div>
+            <div class="${result_class}">
+                ${result_text}
+            </div>
+            
+            <div class="info-label">Total Attempts:</div>
+            <div>${total_attempts}</div>
+            
+            <div class="info-label">Duration:</div>
+            <div>${duration} seconds</div>
+            
+            <div class="info-label">Speed:</div>
+            <div>${speed} attempts/second</div>
+            
+            <div class="info-label">Started:</div>
+            <div>${created_at}</div>
+            
+            <div class="info-label">Completed:</div>
+            <div>${completed_at}</div>
+        </div>
+        
+        ${password_block}
+        
+        <div class="footer">
+            Generated by PasswordCrack Suite - Educational Use Only<br>
+            Report generated on ${generated_at}<br>
+            System: ${system}
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+def _session_duration(created_at: str, last_updated: str) -> float:
+    """Seconds between two ISO timestamps (0 if either cannot be parsed)."""
+    try:
+        start = datetime.fromisoformat(created_at)
+        end = datetime.fromisoformat(last_updated)
+        return (end - start).total_seconds()
+    except Exception:
+        return 0
 
 
 class ResultsAnalyzer:
@@ -48,12 +230,7 @@ class ResultsAnalyzer:
         # Calculate duration
         duration_seconds = 0
         if created_at and last_updated:
-            try:
-                start = datetime.fromisoformat(created_at)
-                end = datetime.fromisoformat(last_updated)
-                duration_seconds = (end - start).total_seconds()
-            except Exception:
-                pass
+            duration_seconds = _session_duration(created_at, last_updated)
         
         # Calculate attempts per second
         attempts_per_sec = attempts / duration_seconds if duration_seconds > 0 else 0
@@ -95,8 +272,7 @@ class ResultsAnalyzer:
         
         filepath = self.report_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(analysis, f, indent=2)
+        filepath.write_bytes(_dumps_json(analysis))
         
         return str(filepath)
     
@@ -166,38 +342,14 @@ class ResultsAnalyzer:
         Returns:
             Path to generated report
         """
+        import csv
+        
         filepath = self.report_dir / filename
         
-        with open(filepath, 'w', newline='') as f:
+        with open(filepath, 'w', newline='', buffering=1 << 20, encoding='utf-8') as f:
             writer = csv.writer(f)
-            
-            # Header
-            writer.writerow([
-                "Session ID",
-                "Attack Type",
-                "Algorithm",
-                "Success",
-                "Password",
-                "Attempts",
-                "Duration (s)",
-                "Speed (attempts/s)",
-                "Created At"
-            ])
-            
-            # Data rows
-            for session in sessions:
-                analysis = self.analyze_session(session)
-                writer.writerow([
-                    analysis['session_id'],
-                    analysis['attack_type'],
-                    analysis['algorithm'],
-                    'Yes' if analysis['success'] else 'No',
-                    analysis['password_found'] or 'N/A',
-                    analysis['total_attempts'],
-                    analysis['duration_seconds'],
-                    analysis['attempts_per_second'],
-                    analysis['created_at']
-                ])
+            writer.writerow(_CSV_HEADER)
+            writer.writerows(_iter_csv_rows(sessions))
         
         return str(filepath)
     
@@ -224,112 +376,30 @@ class ResultsAnalyzer:
         
         filepath = self.report_dir / filename
         
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>PasswordCrack Suite - Session Report</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 900px;
-            margin: 50px auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #333;
-            border-bottom: 3px solid #4CAF50;
-            padding-bottom: 10px;
-        }}
-        .success {{
-            color: #4CAF50;
-            font-weight: bold;
-        }}
-        .failure {{
-            color: #f44336;
-            font-weight: bold;
-        }}
-        .info-grid {{
-            display: grid;
-            grid-template-columns: 1fr 2fr;
-            gap: 10px;
-            margin: 20px 0;
-        }}
-        .info-label {{
-            font-weight: bold;
-            color: #666;
-        }}
-        .password {{
-            background-color: #fff3cd;
-            padding: 10px;
-            border-left: 4px solid #ffc107;
-            margin: 20px 0;
-        }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            color: #999;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🔐 PasswordCrack Suite - Session Report</h1>
-        
-        <div class="info-grid">
-            <div class="info-label">Session ID:</div>
-            <div>{analysis['session_id']}</div>
-            
-            <div class="info-label">Attack Type:</div>
-            <div>{analysis['attack_type']}</div>
-            
-            <div class="info-label">Hash Algorithm:</div>
-            <div>{analysis['algorithm']}</div>
-            
-            <div class="info-label">Result:</div>
-            <div class="{'success' if analysis['success'] else 'failure'}">
-                {'✓ PASSWORD FOUND' if analysis['success'] else '✗ PASSWORD NOT FOUND'}
-            </div>
-            
-            <div class="info-label">Total Attempts:</div>
-            <div>{analysis['total_attempts']:,}</div>
-            
-            <div class="info-label">Duration:</div>
-            <div>{analysis['duration_seconds']:.2f} seconds</div>
-            
-            <div class="info-label">Speed:</div>
-            <div>{analysis['attempts_per_second']:.2f} attempts/second</div>
-            
-            <div class="info-label">Started:</div>
-            <div>{analysis['created_at']}</div>
-            
-            <div class="info-label">Completed:</div>
-            <div>{analysis['completed_at']}</div>
-        </div>
-        
-        {'<div class="password"><strong>Password Found:</strong> ' + analysis['password_found'] + '</div>' if analysis['success'] else ''}
-        
-        <div class="footer">
-            Generated by PasswordCrack Suite - Educational Use Only<br>
-            Report generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}<br>
-            System: {platform.system()} {platform.release()}
-        </div>
-    </div>
-</body>
-</html>
-"""
-        
-        with open(filepath, 'w') as f:
-            f.write(html)
+        system, release, _ = _platform_info()
+        success = analysis['success']
+        password_block = (
+            f'<div class="password"><strong>Password Found:</strong> {analysis["password_found"]}</div>'
+            if success else ''
+        )
+        
+        html = _HTML_TEMPLATE.substitute(
+            session_id=analysis['session_id'],
+            attack_type=analysis['attack_type'],
+            algorithm=analysis['algorithm'],
+            result_class='success' if success else 'failure',
+            result_text='✓ PASSWORD FOUND' if success else '✗ PASSWORD NOT FOUND',
+            total_attempts=f"{analysis['total_attempts']:,}",
+            duration=f"{analysis['duration_seconds']:.2f}",
+            speed=f"{analysis['attempts_per_second']:.2f}",
+            created_at=analysis['created_at'],
+            completed_at=analysis['completed_at'],
+            password_block=password_block,
+            generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            system=f"{system} {release}"
+        )
+        
+        filepath.write_text(html, encoding='utf-8')
         
         return str(filepath)
     
@@ -349,6 +419,7 @@ class ResultsAnalyzer:
             Path to generated report
         """
         analysis = self.analyze_session(session_data)
+        system, release, machine = _platform_info()
         
         # SIEM-compatible event format
         siem_event = {
@@ -365,9 +436,9 @@ class ResultsAnalyzer:
                 "duration_seconds": analysis['duration_seconds']
             },
             "system_info": {
-                "platform": platform.system(),
-                "release": platform.release(),
-                "machine": platform.machine()
+                "platform": system,
+                "release": release,
+                "machine": machine
             }
         }
         
@@ -377,7 +448,6 @@ class ResultsAnalyzer:
         
         filepath = self.report_dir / filename
         
-        with open(filepath, 'w') as f:
-            json.dump(siem_event, f, indent=2)
+        filepath.write_bytes(_dumps_json(siem_event))
         
         return str(filepath)
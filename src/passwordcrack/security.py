@@ -6,12 +6,134 @@ NOTE: ALL OPERATIONS ARE LOCAL ONLY - NO NETWORK
 """
 
 import os
+import hashlib
+import string
 from pathlib import Path
-from typing import Optional, Union
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from typing import Dict, Optional, Union
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM, ChaCha20Poly1305
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from fastpbkdf2 import pbkdf2_hmac as fast_pbkdf2_hmac
+    FASTPBKDF2_AVAILABLE = True
+except ImportError:
+    FASTPBKDF2_AVAILABLE = False
+
+try:
+    from argon2.low_level import hash_secret_raw, Type as Argon2Type
+    ARGON2_AVAILABLE = True
+except ImportError:
+    ARGON2_AVAILABLE = False
+
+# PBKDF2-SHA256 iteration count for legacy password-derived keys
+PBKDF2_ITERATIONS = 100000
+
+# Argon2id cost parameters for password-derived keys (memory in KiB)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 64 * 1024
+ARGON2_PARALLELISM = 2
+
+# Key-file header for Argon2id-derived keys; files without it are PBKDF2
+_KEY_HEADER_ARGON2ID = b"ARGO2\x00"
+
+# Block size for secure_delete_file overwrite passes
+_WIPE_CHUNK_SIZE = 1 << 20
+
+# ASCII character classes for is_strong_password
+_ASCII_LOWER = frozenset(string.ascii_lowercase)
+_ASCII_UPPER = frozenset(string.ascii_uppercase)
+_ASCII_DIGITS = frozenset(string.digits)
+_ASCII_ALNUM = _ASCII_LOWER | _ASCII_UPPER | _ASCII_DIGITS
+
+# Alphabet for generate_random_password, and the largest multiple of its
+# length that fits in a byte (random bytes past it are rejected)
+_PASSWORD_ALPHABET = (string.ascii_letters + string.digits + string.punctuation).encode('ascii')
+_PASSWORD_BYTE_LIMIT = 256 - 256 % len(_PASSWORD_ALPHABET)
+
+# Recommendation lists for every combination of the five strength checks,
+# indexed by bitmask (bit 0 = length, 1 = lower, 2 = upper, 3 = digit, 4 = special)
+_RECOMMENDATION_TEXT = (
+    "Use at least 8 characters",
+    "Add lowercase letters",
+    "Add uppercase letters",
+    "Add numbers",
+    "Add special characters",
+)
+_RECOMMENDATIONS = tuple(
+    tuple(text for bit, text in enumerate(_RECOMMENDATION_TEXT) if not mask >> bit & 1)
+    or ("Password is strong!",)
+    for mask in range(1 << len(_RECOMMENDATION_TEXT))
+)
+
+# fallocate() mode flags (linux/falloc.h)
+_FALLOC_FL_KEEP_SIZE = 0x01
+_FALLOC_FL_PUNCH_HOLE = 0x02
+
+
+def _is_rotational(path: Path) -> Optional[bool]:
+    """
+    Check whether a file lives on rotational media (Linux sysfs).
+    
+    Returns:
+        True for HDDs, False for SSDs, None if it cannot be determined
+    """
+    try:
+        dev = os.stat(path).st_dev
+        block_dir = Path(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}").resolve()
+        # Partitions keep queue/ on their parent disk
+        for queue_dir in (block_dir / "queue", block_dir.parent / "queue"):
+            rotational = queue_dir / "rotational"
+            if rotational.exists():
+                return rotational.read_text().strip() == "1"
+    except (OSError, AttributeError):
+        pass
+    return None
+
+
+def _punch_hole(fd: int, length: int) -> bool:
+    """
+    Deallocate a file's blocks so the filesystem can discard (TRIM) them.
+    
+    Scoped to this file's own extents, unlike a raw BLKDISCARD on the device.
+    
+    Returns:
+        True if the hole was punched, False if unsupported
+    """
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.fallocate.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64]
+        mode = _FALLOC_FL_PUNCH_HOLE | _FALLOC_FL_KEEP_SIZE
+        return libc.fallocate(fd, mode, 0, length) == 0
+    except (OSError, AttributeError, TypeError):
+        return False
+
+
+# One-byte algorithm tags prefixed to encrypted data
+_TAG_AESGCM = b'\x01'
+_TAG_CHACHA20 = b'\x02'
+_AEAD_CLASSES = {_TAG_AESGCM: AESGCM, _TAG_CHACHA20: ChaCha20Poly1305}
+
+
+def _cpu_has_aes_acceleration() -> bool:
+    """Check for AES + carry-less multiply instructions (AES-NI/PCLMUL or ARMv8 AES/PMULL)."""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith(('flags', 'Features')):
+                    flags = set(line.partition(':')[2].split())
+                    return 'aes' in flags and ('pclmulqdq' in flags or 'pmull' in flags)
+    except OSError:
+        pass
+    # No /proc/cpuinfo (Windows/macOS) - assume AES hardware, as on all current CPUs there
+    return True
+
+
+# AES-GCM is only fast (and constant-time) with hardware AES; otherwise use ChaCha20-Poly1305
+AES_HW_AVAILABLE = _cpu_has_aes_acceleration()
 
 
 class SecurityManager:
@@ -30,10 +152,31 @@ class SecurityManager:
             self.key_file = Path(key_file)
         
         self.key: Optional[bytes] = None
+        # Ciphers built from self.key (keyed by algorithm tag), reused across calls
+        self._ciphers: Dict[bytes, Union[AESGCM, ChaCha20Poly1305]] = {}
+        self._cipher_key: Optional[bytes] = None
+        self._encrypt_tag = _TAG_AESGCM if AES_HW_AVAILABLE else _TAG_CHACHA20
+    
+    def _set_key(self, key: bytes) -> None:
+        """Set the active key and build its default cipher once."""
+        self.key = key
+        self._ciphers = {}
+        self._cipher_key = key
+        self._cipher(self._encrypt_tag)
+    
+    def _cipher(self, tag: bytes) -> Union[AESGCM, ChaCha20Poly1305]:
+        """Return the cipher for an algorithm tag, rebuilding it if the key changed."""
+        if self._cipher_key is not self.key:
+            self._ciphers = {}
+            self._cipher_key = self.key
+        cipher = self._ciphers.get(tag)
+        if cipher is None:
+            cipher = self._ciphers[tag] = _AEAD_CLASSES[tag](self.key)
+        return cipher
     
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         """
-        Derive encryption key from password.
+        Derive encryption key from password with Argon2id.
         
         Args:
             password: Password to derive from
@@ -42,13 +185,31 @@ class SecurityManager:
         Returns:
             32-byte encryption key
         """
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
+        return hash_secret_raw(
+            password.encode(), salt,
+            time_cost=ARGON2_TIME_COST,
+            memory_cost=ARGON2_MEMORY_COST,
+            parallelism=ARGON2_PARALLELISM,
+            hash_len=32,
+            type=Argon2Type.ID
         )
-        return kdf.derive(password.encode())
+    
+    def _derive_key_pbkdf2(self, password: str, salt: bytes) -> bytes:
+        """
+        Derive encryption key from password with PBKDF2-SHA256 (legacy key files).
+        
+        Args:
+            password: Password to derive from
+            salt: Salt for key derivation
+            
+        Returns:
+            32-byte encryption key
+        """
+        if FASTPBKDF2_AVAILABLE:
+            return fast_pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS, 32)
+        
+        # OpenSSL's PBKDF2 directly, without a per-derivation KDF object
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, PBKDF2_ITERATIONS, dklen=32)
     
     def generate_key(self, password: Optional[str] = None) -> bytes:
         """
@@ -62,12 +223,17 @@ class SecurityManager:
         """
         if password:
             salt = secrets.token_bytes(16)
-            self.key = self._derive_key(password, salt)
+            if ARGON2_AVAILABLE:
+                self._set_key(self._derive_key(password, salt))
+                header = _KEY_HEADER_ARGON2ID
+            else:
+                self._set_key(self._derive_key_pbkdf2(password, salt))
+                header = b""
             # Store salt with key
             with open(self.key_file, 'wb') as f:
-                f.write(salt + self.key)
+                f.write(header + salt + self.key)
         else:
-            self.key = AESGCM.generate_key(bit_length=256)
+            self._set_key(AESGCM.generate_key(bit_length=256))
             with open(self.key_file, 'wb') as f:
                 f.write(self.key)
         
@@ -90,23 +256,28 @@ class SecurityManager:
             data = f.read()
         
         if password:
-            # First 16 bytes are salt, rest is key
-            salt = data[:16]
-            self.key = self._derive_key(password, salt)
+            if data.startswith(_KEY_HEADER_ARGON2ID):
+                # Header, 16-byte salt, then key
+                salt = data[len(_KEY_HEADER_ARGON2ID):len(_KEY_HEADER_ARGON2ID) + 16]
+                self._set_key(self._derive_key(password, salt))
+            else:
+                # Legacy PBKDF2 file: first 16 bytes are salt, rest is key
+                salt = data[:16]
+                self._set_key(self._derive_key_pbkdf2(password, salt))
         else:
-            self.key = data
+            self._set_key(data)
         
         return self.key
     
     def encrypt_data(self, data: Union[str, bytes]) -> bytes:
         """
-        Encrypt data using AES-GCM.
+        Encrypt data using AES-GCM (ChaCha20-Poly1305 on CPUs without AES hardware).
         
         Args:
             data: Data to encrypt (str or bytes)
             
         Returns:
-            Encrypted data (nonce + ciphertext + tag)
+            Encrypted data (algorithm tag + nonce + ciphertext + tag)
         """
         if self.key is None:
             raise ValueError("No key loaded. Generate or load a key first.")
@@ -118,18 +289,19 @@ class SecurityManager:
         nonce = secrets.token_bytes(12)
         
         # Encrypt
-        aesgcm = AESGCM(self.key)
-        ciphertext = aesgcm.encrypt(nonce, data, None)
+        tag = self._encrypt_tag
+        ciphertext = self._cipher(tag).encrypt(nonce, data, None)
         
-        # Return nonce + ciphertext
-        return nonce + ciphertext
+        # Return algorithm tag + nonce + ciphertext
+        return tag + nonce + ciphertext
     
     def decrypt_data(self, encrypted_data: bytes) -> str:
         """
-        Decrypt data using AES-GCM.
+        Decrypt data produced by encrypt_data.
         
         Args:
-            encrypted_data: Encrypted data (nonce + ciphertext + tag)
+            encrypted_data: Encrypted data (algorithm tag + nonce + ciphertext + tag),
+                or untagged AES-GCM data (nonce + ciphertext + tag) from older versions
             
         Returns:
             Decrypted data as string
@@ -137,13 +309,19 @@ class SecurityManager:
         if self.key is None:
             raise ValueError("No key loaded. Load a key first.")
         
-        # Extract nonce and ciphertext
+        tag = encrypted_data[:1]
+        if tag in _AEAD_CLASSES:
+            # Extract nonce and ciphertext after the algorithm tag
+            try:
+                plaintext = self._cipher(tag).decrypt(encrypted_data[1:13], encrypted_data[13:], None)
+                return plaintext.decode('utf-8')
+            except InvalidTag:
+                pass  # Untagged data whose nonce happens to start with a tag byte
+        
+        # Legacy untagged AES-GCM: nonce + ciphertext
         nonce = encrypted_data[:12]
         ciphertext = encrypted_data[12:]
-        
-        # Decrypt
-        aesgcm = AESGCM(self.key)
-        plaintext = aesgcm.decrypt(nonce, ciphertext, None)
+        plaintext = self._cipher(_TAG_AESGCM).decrypt(nonce, ciphertext, None)
         
         return plaintext.decode('utf-8')
     
@@ -166,10 +344,30 @@ class SecurityManager:
             # Get file size
             file_size = filepath.stat().st_size
             
-            # Overwrite with random data 3 times
-            for _ in range(3):
-                with open(filepath, 'wb') as f:
-                    f.write(secrets.token_bytes(file_size))
+            # SSD wear-leveling remaps overwrites to fresh cells, so extra passes
+            # buy nothing there: overwrite once, then discard the blocks (TRIM).
+            # Rotational or unknown media keep the 3-pass overwrite.
+            on_ssd = _is_rotational(filepath) is False
+            passes = 1 if on_ssd else 3
+            
+            # Overwrite with random data, streaming 1 MiB blocks so
+            # memory use stays flat regardless of file size
+            for pass_number in range(passes):
+                fd = os.open(filepath, os.O_WRONLY | getattr(os, 'O_BINARY', 0))
+                try:
+                    remaining = file_size
+                    while remaining:
+                        n = min(_WIPE_CHUNK_SIZE, remaining)
+                        os.write(fd, secrets.token_bytes(n))
+                        remaining -= n
+                    os.fsync(fd)
+                    if hasattr(os, 'posix_fadvise'):
+                        # Drop the overwritten pages from the page cache
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    if on_ssd and pass_number == passes - 1:
+                        _punch_hole(fd, file_size)
+                finally:
+                    os.close(fd)
             
             # Finally delete
             filepath.unlink()
@@ -193,13 +391,13 @@ class SecurityManager:
         if not dirpath.exists():
             return False
         
+        # Delete all files in parallel - overwrite/fsync I/O releases the GIL
+        files = [file for file in dirpath.rglob("*") if file.is_file()]
         success = True
-        
-        # Delete all files
-        for file in dirpath.rglob("*"):
-            if file.is_file():
-                if not self.secure_delete_file(file):
-                    success = False
+        if files:
+            max_workers = min(8, os.cpu_count() or 1, len(files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                success = all(list(executor.map(self.secure_delete_file, files)))
         
         # Try to remove empty directory
         try:
@@ -220,10 +418,16 @@ class SecurityManager:
         Returns:
             Random password string
         """
-        import string
-        alphabet = string.ascii_letters + string.digits + string.punctuation
-        password = ''.join(secrets.choice(alphabet) for _ in range(length))
-        return password
+        out = bytearray()
+        while len(out) < length:
+            # Draw in bulk; bytes at or above _PASSWORD_BYTE_LIMIT are rejected
+            # so every alphabet character stays equally likely
+            for b in secrets.token_bytes(2 * (length - len(out))):
+                if b < _PASSWORD_BYTE_LIMIT:
+                    out.append(_PASSWORD_ALPHABET[b % len(_PASSWORD_ALPHABET)])
+                    if len(out) == length:
+                        break
+        return out.decode('ascii')
     
     @staticmethod
     def is_strong_password(password: str) -> dict:
@@ -236,10 +440,18 @@ class SecurityManager:
         Returns:
             Dict with strength analysis
         """
-        has_lower = any(c.islower() for c in password)
-        has_upper = any(c.isupper() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
+        if password.isascii():
+            # One pass to build the character set, then C-level set tests
+            chars = set(password)
+            has_lower = not chars.isdisjoint(_ASCII_LOWER)
+            has_upper = not chars.isdisjoint(_ASCII_UPPER)
+            has_digit = not chars.isdisjoint(_ASCII_DIGITS)
+            has_special = not chars <= _ASCII_ALNUM
+        else:
+            has_lower = any(c.islower() for c in password)
+            has_upper = any(c.isupper() for c in password)
+            has_digit = any(c.isdigit() for c in password)
+            has_special = any(not c.isalnum() for c in password)
         
         score = sum([has_lower, has_upper, has_digit, has_special])
         length_ok = len(password) >= 8
@@ -273,20 +485,6 @@ class SecurityManager:
         has_special: bool
     ) -> list:
         """Get password improvement recommendations."""
-        recommendations = []
-        
-        if not length_ok:
-            recommendations.append("Use at least 8 characters")
-        if not has_lower:
-            recommendations.append("Add lowercase letters")
-        if not has_upper:
-            recommendations.append("Add uppercase letters")
-        if not has_digit:
-            recommendations.append("Add numbers")
-        if not has_special:
-            recommendations.append("Add special characters")
-        
-        if not recommendations:
-            recommendations.append("Password is strong!")
-        
-        return recommendations
+        mask = (length_ok | has_lower << 1 | has_upper << 2
+                | has_digit << 3 | has_special << 4)
+        return list(_RECOMMENDATIONS[mask])
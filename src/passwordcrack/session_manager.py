@@ -7,11 +7,99 @@ NOTE: ALL DATA STORED LOCALLY ONLY - NO NETWORK
 
 import json
 import os
+import shutil
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from datetime import datetime
 import uuid
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Fields copied into the session_<id>.meta.json sidecar for list_sessions
+_SUMMARY_FIELDS = ("session_id", "attack_type", "algorithm", "created_at", "status", "found")
+
+
+# Checkpoints kept in memory; older ones are spilled in batches of this
+# size to the append-only session_<id>.ckpt.log (one JSON object per line).
+# Only sessions last saved unencrypted spill - the log is plaintext.
+CHECKPOINT_RING_SIZE = 128
+
+# (epoch second, ISO string) of the last _now_iso call
+_iso_cache = (None, "")
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string at second precision (cached per second)."""
+    global _iso_cache
+    now = int(time.time())
+    if _iso_cache[0] != now:
+        _iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _iso_cache[1]
+
+
+def _dumps_json(data: Any) -> bytes:
+    """Serialize data as indented JSON bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _dumps_json_line(data: Any) -> bytes:
+    """Serialize data as one compact JSON line (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data) + b"\n"
+    return json.dumps(data, separators=(",", ":")).encode('utf-8') + b"\n"
+
+
+def _copy_session_file(src: Path, dst: Union[str, Path]) -> None:
+    """
+    Copy a session file with os.sendfile, creating the destination as 0600.
+    
+    Falls back to shutil.copy off Linux (sendfile elsewhere needs a socket
+    destination) or if sendfile fails or stops before the whole file is sent.
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "sendfile"):
+        shutil.copy(src, dst)
+        return
+    
+    dst = Path(dst)
+    if dst.is_dir():
+        dst = dst / Path(src).name
+    
+    try:
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                remaining = os.fstat(src_fd).st_size
+                offset = 0
+                while remaining > 0:
+                    sent = os.sendfile(dst_fd, src_fd, offset, remaining)
+                    if sent == 0:
+                        raise OSError("sendfile stopped before end of file")
+                    offset += sent
+                    remaining -= sent
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+    except OSError:
+        shutil.copy(src, dst)
+
+
+def _loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class SessionManager:
     """Manages cracking session persistence and resume."""
@@ -32,6 +120,8 @@ class SessionManager:
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.current_session: Optional[Dict[str, Any]] = None
         self.session_id: Optional[str] = None
+        # True once the current session is saved/loaded unencrypted
+        self._spill_checkpoints = False
     
     def create_session(
         self,
@@ -67,7 +157,7 @@ class SessionManager:
             "attack_type": attack_type,
             "algorithm": algorithm,
             "hash_value": hash_value,
-            "created_at": datetime.now().isoformat(),
+            "created_at": _now_iso(),
             "status": "active",
             "attempts": 0,
             "found": False,
@@ -76,6 +166,7 @@ class SessionManager:
             "gpx_settings": gpx_settings,
             "checkpoints": []
         }
+        self._spill_checkpoints = False
         
         return self.session_id
     
@@ -96,9 +187,18 @@ class SessionManager:
         filepath = self.session_dir / filename
         
         # Update last saved timestamp
-        self.current_session["last_saved"] = datetime.now().isoformat()
+        self.current_session["last_saved"] = _now_iso()
         
-        data = json.dumps(self.current_session, indent=2)
+        # Encrypted sessions keep every checkpoint in the encrypted file:
+        # fold back anything spilled to the plaintext log by earlier saves
+        self._spill_checkpoints = not encrypt
+        log_path = self._checkpoint_log_path(self.session_id)
+        if encrypt and log_path.exists():
+            checkpoints = self.current_session["checkpoints"]
+            checkpoints[:0] = self._read_checkpoint_log(self.session_id)
+            self.current_session.pop("checkpoints_logged", None)
+        
+        data = _dumps_json(self.current_session)
         
         if encrypt:
             # Import security module for encryption
@@ -106,14 +206,38 @@ class SessionManager:
             security = SecurityManager()
             data = security.encrypt_data(data)
         
-        with open(filepath, 'w' if not encrypt else 'wb') as f:
-            if encrypt:
-                f.write(data)
-            else:
-                f.write(data)
+        with open(filepath, 'wb') as f:
+            f.write(data)
+        if encrypt:
+            log_path.unlink(missing_ok=True)
+        
+        # Summary sidecar so list_sessions can skip the full session
+        # (and its checkpoint list). Encrypted sessions get none.
+        meta_path = self._meta_path(self.session_id)
+        if encrypt:
+            meta_path.unlink(missing_ok=True)
+        else:
+            summary = {key: self.current_session.get(key) for key in _SUMMARY_FIELDS}
+            meta_path.write_bytes(_dumps_json(summary))
         
         return str(filepath)
     
+    def _meta_path(self, session_id: str) -> Path:
+        """Path of the summary sidecar for a session."""
+        return self.session_dir / f"session_{session_id}.meta.json"
+    
+    def _checkpoint_log_path(self, session_id: str) -> Path:
+        """Path of the append-only log holding checkpoints spilled from memory."""
+        return self.session_dir / f"session_{session_id}.ckpt.log"
+    
+    def _read_checkpoint_log(self, session_id: str) -> list:
+        """Checkpoints spilled to a session's log, oldest first."""
+        log_path = self._checkpoint_log_path(session_id)
+        if not log_path.exists():
+            return []
+        with open(log_path, 'rb') as f:
+            return [_loads_json(line) for line in f if line.strip()]
+    
     def load_session(self, session_id: str, encrypted: bool = False) -> Dict[str, Any]:
         """
         Load a session from disk.
@@ -131,8 +255,7 @@ class SessionManager:
         if not filepath.exists():
             raise FileNotFoundError(f"Session not found: {session_id}")
         
-        mode = 'rb' if encrypted else 'r'
-        with open(filepath, mode) as f:
+        with open(filepath, 'rb') as f:
             data = f.read()
         
         if encrypted:
@@ -141,8 +264,9 @@ class SessionManager:
             security = SecurityManager()
             data = security.decrypt_data(data)
         
-        self.current_session = json.loads(data)
+        self.current_session = _loads_json(data)
         self.session_id = session_id
+        self._spill_checkpoints = not encrypted
         
         return self.current_session
     
@@ -157,7 +281,7 @@ class SessionManager:
             raise ValueError("No active session")
         
         self.current_session.update(kwargs)
-        self.current_session["last_updated"] = datetime.now().isoformat()
+        self.current_session["last_updated"] = _now_iso()
     
     def add_checkpoint(self, position: Any, data: Optional[Dict] = None) -> None:
         """
@@ -171,13 +295,24 @@ class SessionManager:
             raise ValueError("No active session")
         
         checkpoint = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.time_ns(),
             "position": position,
             "attempts": self.current_session.get("attempts", 0),
             "data": data or {}
         }
         
-        self.current_session["checkpoints"].append(checkpoint)
+        checkpoints = self.current_session["checkpoints"]
+        checkpoints.append(checkpoint)
+        
+        if self._spill_checkpoints and len(checkpoints) >= 2 * CHECKPOINT_RING_SIZE:
+            # Keep the newest CHECKPOINT_RING_SIZE in memory so saves stay small
+            spilled = checkpoints[:-CHECKPOINT_RING_SIZE]
+            with open(self._checkpoint_log_path(self.session_id), 'ab') as f:
+                f.write(b"".join(map(_dumps_json_line, spilled)))
+            del checkpoints[:-CHECKPOINT_RING_SIZE]
+            self.current_session["checkpoints_logged"] = (
+                self.current_session.get("checkpoints_logged", 0) + len(spilled)
+            )
     
     def record_gpx_fallback(self, reason: str) -> None:
         """
@@ -194,7 +329,7 @@ class SessionManager:
         
         self.current_session["gpx_settings"]["gpx_fallback_occurred"] = True
         self.current_session["gpx_settings"]["fallback_reason"] = reason
-        self.current_session["gpx_settings"]["fallback_timestamp"] = datetime.now().isoformat()
+        self.current_session["gpx_settings"]["fallback_timestamp"] = _now_iso()
     
     def get_gpx_settings(self) -> Dict[str, Any]:
         """
@@ -218,7 +353,14 @@ class SessionManager:
         if not self.current_session or not self.current_session["checkpoints"]:
             return None
         
-        return self.current_session["checkpoints"][-1]
+        checkpoint = self.current_session["checkpoints"][-1]
+        if "timestamp" not in checkpoint:
+            # Checkpoints store raw ts_ns; format only when one is read back
+            checkpoint = {
+                "timestamp": datetime.fromtimestamp(checkpoint["ts_ns"] / 1e9).isoformat(),
+                **checkpoint
+            }
+        return checkpoint
     
     def list_sessions(self) -> list:
         """
@@ -230,10 +372,17 @@ class SessionManager:
         sessions = []
         
         for filepath in self.session_dir.glob("session_*.json"):
+            if filepath.name.endswith(".meta.json"):
+                continue
+            
             try:
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
-                    
+                try:
+                    data = _loads_json(filepath.with_suffix(".meta.json").read_bytes())
+                except FileNotFoundError:
+                    # Saved before sidecars existed, or imported
+                    with open(filepath, 'rb') as f:
+                        data = _loads_json(f.read())
+                
                 sessions.append({
                     "session_id": data.get("session_id"),
                     "attack_type": data.get("attack_type"),
@@ -263,6 +412,8 @@ class SessionManager:
         
         if filepath.exists():
             filepath.unlink()
+            self._meta_path(session_id).unlink(missing_ok=True)
+            self._checkpoint_log_path(session_id).unlink(missing_ok=True)
             
             if self.session_id == session_id:
                 self.current_session = None
@@ -289,8 +440,16 @@ class SessionManager:
         if not filepath.exists():
             raise FileNotFoundError(f"Session not found: {session_id}")
         
-        import shutil
-        shutil.copy(filepath, output_path)
+        if self._checkpoint_log_path(session_id).exists():
+            # Export one self-contained file: spilled checkpoints go back in
+            with open(filepath, 'rb') as f:
+                data = _loads_json(f.read())
+            data["checkpoints"] = self._read_checkpoint_log(session_id) + data.get("checkpoints", [])
+            data.pop("checkpoints_logged", None)
+            with open(output_path, 'wb') as f:
+                f.write(_dumps_json(data))
+        else:
+            _copy_session_file(filepath, output_path)
         
         return output_path
     
@@ -304,17 +463,23 @@ class SessionManager:
         Returns:
             Session ID of imported session
         """
-        import shutil
-        
         # Load to validate
-        with open(input_path, 'r') as f:
-            data = json.load(f)
+        with open(input_path, 'rb') as f:
+            data = _loads_json(f.read())
         
         session_id = data.get("session_id", str(uuid.uuid4()))
         filename = f"session_{session_id}.json"
         filepath = self.session_dir / filename
         
-        shutil.copy(input_path, filepath)
+        if "checkpoints_logged" in data:
+            # The spilled checkpoints stayed behind with the original log
+            data.pop("checkpoints_logged")
+            with open(filepath, 'wb') as f:
+                f.write(_dumps_json(data))
+        else:
+            _copy_session_file(input_path, filepath)
+        self._meta_path(session_id).unlink(missing_ok=True)
+        self._checkpoint_log_path(session_id).unlink(missing_ok=True)
         
         return session_id
     
@@ -328,7 +493,10 @@ class SessionManager:
         Returns:
             Session information dictionary
         """
-        session = self.load_session(session_id)
+        if self.current_session and self.current_session.get("session_id") == session_id:
+            session = self.current_session
+        else:
+            session = self.load_session(session_id)
         
         return {
             "session_id": session.get("session_id"),
@@ -340,6 +508,8 @@ class SessionManager:
             "attempts": session.get("attempts"),
             "found": session.get("found"),
             "password": session.get("password"),
-            "checkpoint_count": len(session.get("checkpoints", [])),
+            "checkpoint_count": (
+                len(session.get("checkpoints", [])) + session.get("checkpoints_logged", 0)
+            ),
             "parameters": session.get("parameters", {})
         }
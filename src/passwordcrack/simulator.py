@@ -5,13 +5,29 @@ Creates synthetic test hashes and automated demo flows.
 NOTE: EDUCATIONAL DEMOS ONLY - NO REAL ATTACKS
 """
 
-from typing import Dict, Any, List, Optional
+from pathlib import Path
+from typing import Dict, Any, Callable, List, Optional
+import hashlib
+import json
 import secrets
 import random
 from .hash_utils import HashUtils, HashAlgorithm
 from .wordlist_manager import WordlistManager
 
 
+# Unsalted algorithms hashed directly with hashlib in create_multiple_hashes
+_ALGO_TO_HASHLIB: Dict[HashAlgorithm, Callable] = {
+    HashAlgorithm.MD5: hashlib.md5,
+    HashAlgorithm.SHA1: hashlib.sha1,
+    HashAlgorithm.SHA256: hashlib.sha256,
+    HashAlgorithm.SHA512: hashlib.sha512,
+}
+
+# Base words for the generic weak-password patterns in simulate_weak_passwords
+_ACCOUNT_WORDS = ('admin', 'user', 'test')
+_KEYBOARD_WORDS = ('qwerty', 'abc', 'xyz')
+
+
 class DemoSimulator:
     """Simulates cracking scenarios for demos and training."""
     
@@ -29,6 +45,13 @@ class DemoSimulator:
         "sunshine",
     ]
     
+    # Digests of DEMO_PASSWORDS for every hashlib-backed algorithm
+    _PREHASHED: Dict[tuple, str] = {
+        (password, algo): hash_new(password.encode('utf-8')).hexdigest()
+        for password in DEMO_PASSWORDS
+        for algo, hash_new in _ALGO_TO_HASHLIB.items()
+    }
+    
     def __init__(self):
         """Initialize demo simulator."""
         self.scenarios: List[Dict[str, Any]] = []
@@ -51,7 +74,9 @@ class DemoSimulator:
         if password is None:
             password = random.choice(self.DEMO_PASSWORDS)
         
-        hash_value = HashUtils.generate_hash(password, algorithm)
+        hash_value = self._PREHASHED.get((password, algorithm))
+        if hash_value is None:
+            hash_value = HashUtils.generate_hash(password, algorithm)
         
         return {
             "password": password,
@@ -132,6 +157,9 @@ class DemoSimulator:
             List of hash dictionaries
         """
         hashes = []
+        prehashed = self._PREHASHED
+        hash_new = _ALGO_TO_HASHLIB.get(algorithm)
+        algo_name = algorithm.value
         
         for i in range(count):
             if use_common and i < len(self.DEMO_PASSWORDS):
@@ -140,9 +168,19 @@ class DemoSimulator:
                 # Generate random password
                 password = secrets.token_urlsafe(8)
             
-            hash_dict = self.create_demo_hash(password, algorithm)
-            hash_dict["index"] = i + 1
-            hashes.append(hash_dict)
+            hash_value = prehashed.get((password, algorithm))
+            if hash_value is None:
+                if hash_new is not None:
+                    hash_value = hash_new(password.encode('utf-8')).hexdigest()
+                else:
+                    hash_value = HashUtils.generate_hash(password, algorithm)
+            
+            hashes.append({
+                "password": password,
+                "hash": hash_value,
+                "algorithm": algo_name,
+                "index": i + 1
+            })
         
         return hashes
     
@@ -156,18 +194,21 @@ class DemoSimulator:
         Returns:
             List of weak passwords
         """
-        weak_patterns = [
-            lambda: random.choice(self.DEMO_PASSWORDS),
-            lambda: random.choice(self.DEMO_PASSWORDS) + str(random.randint(0, 99)),
-            lambda: random.choice(self.DEMO_PASSWORDS) + str(random.randint(2000, 2025)),
-            lambda: random.choice(['admin', 'user', 'test']) + str(random.randint(1, 999)),
-            lambda: random.choice(['qwerty', 'abc', 'xyz']) + str(random.randint(100, 999)),
-        ]
+        # (base words, numeric suffix range or None)
+        weak_patterns = (
+            (self.DEMO_PASSWORDS, None),
+            (self.DEMO_PASSWORDS, (0, 99)),
+            (self.DEMO_PASSWORDS, (2000, 2025)),
+            (_ACCOUNT_WORDS, (1, 999)),
+            (_KEYBOARD_WORDS, (100, 999)),
+        )
         
+        choice = random.choice
+        randint = random.randint
         passwords = []
-        for _ in range(count):
-            pattern = random.choice(weak_patterns)
-            passwords.append(pattern())
+        for bases, suffix in random.choices(weak_patterns, k=count):
+            base = choice(bases)
+            passwords.append(base + str(randint(*suffix)) if suffix else base)
         
         return passwords
     
@@ -184,9 +225,6 @@ class DemoSimulator:
         Returns:
             Dict with dataset information
         """
-        from pathlib import Path
-        import json
-        
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
@@ -200,27 +238,25 @@ class DemoSimulator:
             
             # Save to file
             hash_file = output_path / f"hashes_{algo.value}.json"
-            with open(hash_file, 'w') as f:
-                json.dump(hashes, f, indent=2)
+            hash_file.write_text(json.dumps(hashes, indent=2))
         
         # Create weak password wordlist
         weak_passwords = self.simulate_weak_passwords(100)
         wordlist_file = output_path / "weak_passwords.txt"
-        with open(wordlist_file, 'w') as f:
-            for pwd in weak_passwords:
-                f.write(f"{pwd}\n")
+        wordlist_file.write_bytes("\n".join(weak_passwords).encode('utf-8') + b"\n")
         
         # Create README
         readme_file = output_path / "README.txt"
-        with open(readme_file, 'w') as f:
-            f.write("TRAINING DATASET - EDUCATIONAL USE ONLY\n")
-            f.write("=" * 50 + "\n\n")
-            f.write("This dataset contains:\n")
-            f.write(f"- Hash files for {len(algorithms)} algorithms\n")
-            f.write(f"- {len(weak_passwords)} weak passwords for testing\n\n")
-            f.write("Use these files to practice password cracking in a safe,\n")
-            f.write("controlled environment.\n\n")
-            f.write("NEVER use these techniques on real systems without permission!\n")
+        readme_file.write_text(
+            "TRAINING DATASET - EDUCATIONAL USE ONLY\n"
+            + "=" * 50 + "\n\n"
+            "This dataset contains:\n"
+            f"- Hash files for {len(algorithms)} algorithms\n"
+            f"- {len(weak_passwords)} weak passwords for testing\n\n"
+            "Use these files to practice password cracking in a safe,\n"
+            "controlled environment.\n\n"
+            "NEVER use these techniques on real systems without permission!\n"
+        )
         
         return {
             "output_dir": str(output_path),
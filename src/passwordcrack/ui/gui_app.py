@@ -10,25 +10,214 @@ try:
 except ImportError:
     import PySimpleGUI as sg
 import json
+import os
+import queue
+import string
 import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Tuple
 from datetime import datetime
 
 # Import our modules
 from ..hash_utils import HashUtils, HashAlgorithm
 from ..hash_identifier import HashIdentifier
-from ..wordlist_manager import WordlistManager
-from ..attack_engines import DictionaryEngine, BruteforceEngine, MaskEngine, HybridEngine, RuleEngine
-from ..attack_engines.gpx_engine import GPXDictionaryEngine, GPXBruteforceEngine
+from ..wordlist_manager import WordlistManager, WORD_CACHE_MAX_BYTES
 from ..session_manager import SessionManager
 from ..results_analyzer import ResultsAnalyzer
-from ..performance.benchmark import PerformanceBenchmark
 from ..security import SecurityManager
-from ..simulator import DemoSimulator
-from ..gpx_manager import GPXManager, DeviceType, DeviceTier
+from ..gpx_manager import GPXManager
 from ..hashcat_wrapper import HashcatWrapper, HashcatMode
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class _TerminalBuffer(deque):
+    """Last terminal lines (oldest dropped in O(1)), with an append counter for redraws."""
+    
+    def __init__(self, maxlen: int = 100):
+        super().__init__(maxlen=maxlen)
+        self.version = 0
+        self._lock = threading.Lock()
+    
+    def append(self, line: str) -> None:
+        with self._lock:
+            super().append(line)
+            self.version += 1
+    
+    def snapshot(self) -> Tuple[int, List[str]]:
+        """Return (version, lines) taken together, safe against concurrent appends."""
+        with self._lock:
+            return self.version, list(self)
+    
+    def tail(self, count: int) -> str:
+        """Return the last count lines joined with newlines."""
+        with self._lock:
+            return '\n'.join(islice(self, max(len(self) - count, 0), None))
+
+
+# Wordlist combo entries, the "try all" pseudo-entry, and the lists it runs (in order)
+TRY_ALL_WORDLISTS = '*** TRY ALL WORDLISTS ***'
+WORDLIST_CHOICES = (
+    'wordlists/common.txt',
+    'wordlists/rockyou-lite.txt',
+    'SecLists/Passwords/Common-Credentials/10k-most-common.txt',
+    'SecLists/Passwords/Common-Credentials/100k-most-used-passwords-NCSC.txt',
+    'SecLists/Passwords/Common-Credentials/best1050.txt',
+    'SecLists/Passwords/Common-Credentials/best110.txt',
+    'SecLists/Passwords/Common-Credentials/500-worst-passwords.txt',
+    'SecLists/Passwords/darkc0de.txt',
+    'SecLists/Passwords/Common-Credentials/darkweb2017_top-10000.txt'
+)
+ALL_WORDLISTS = (
+    'wordlists/common.txt',
+    'wordlists/rockyou-lite.txt',
+    'SecLists/Passwords/Common-Credentials/best110.txt',
+    'SecLists/Passwords/Common-Credentials/best1050.txt',
+    'SecLists/Passwords/Common-Credentials/10k-most-common.txt',
+    'SecLists/Passwords/Common-Credentials/100k-most-used-passwords-NCSC.txt',
+    'SecLists/Passwords/darkc0de.txt'
+)
+
+# HashAlgorithm by member name, upper and lower case (the -ALGO- combo values)
+_ALGORITHMS_BY_NAME: Dict[str, HashAlgorithm] = {
+    **{algo.name: algo for algo in HashAlgorithm},
+    **{algo.name.lower(): algo for algo in HashAlgorithm}
+}
+
+# Example hashes of 'password' shown when an invalid hash is entered
+_HASH_EXAMPLES: Dict[HashAlgorithm, str] = {
+    HashAlgorithm.MD5: "5f4dcc3b5aa765d61d8327deb882cf99 (password: 'password')",
+    HashAlgorithm.SHA1: "5baa61e4c9b93f3f0682250b6cf8331b7ee68fd8 (password: 'password')",
+    HashAlgorithm.SHA256: "5e884898da28047151d0e56f8dc6292773603d0d6aabbdd62a11ef721d1542d8 (password: 'password')",
+    HashAlgorithm.SHA512: "b109f3bbbc244eb82441917ed06d618b9008dd09b3befd1b5e07394c706a8bb980b1d7785e5976ec049b46df5f1326af5a2ea6d103fd07c95385ffab0cacbc86 (password: 'password')",
+    HashAlgorithm.NTLM: "8846f7eaee8fb117ad06bdd830b7586c (password: 'password')"
+}
+
+@lru_cache(maxsize=64)
+def _cached_validate(hash_value: str, algorithm: HashAlgorithm) -> Tuple[bool, str]:
+    """HashUtils.validate_hash, memoized per (hash, algorithm) entered in the form."""
+    return HashUtils.validate_hash(hash_value, algorithm)
+
+
+# (epoch second, "HH:MM:SS") of the last _log_timestamp call
+_log_ts_cache = (None, "")
+
+
+def _log_timestamp() -> str:
+    """Current local time as HH:MM:SS, formatted at most once per second."""
+    global _log_ts_cache
+    now = int(time.time())
+    if _log_ts_cache[0] != now:
+        _log_ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+    return _log_ts_cache[1]
+
+
+def _update_widgets(window: sg.Window, updates: Dict[str, Any]) -> None:
+    """
+    Set several widget values in one pass.
+    
+    Element.update only reconfigures the Tk widget; nothing is redrawn until
+    control returns to window.read(), so the whole batch paints once.
+    
+    Args:
+        window: Window owning the elements
+        updates: Element key -> new value
+    """
+    for key, value in updates.items():
+        window[key].update(value)
+
+
+# Prefix of the terminal line shown for each hashcat candidate update
+_TRY_PREFIX = "🔍 Trying: "
+
+# Results-tab summary of a finished attack, filled in by _session_details
+_SESSION_DETAILS_TEMPLATE = "SESSION DETAILS\n" + "=" * 60 + """
+
+ATTACK INFORMATION:
+  • Attack Type: {attack_type}
+  • Hash Algorithm: {algorithm}
+  • Target Hash: {hash_value}
+
+RESULTS:
+  • Status: {status}
+  • Password Found: {password}
+{error_line}  • Total Attempts: {attempts:,}
+  • Duration: {duration:.2f} seconds
+  • Average Speed: {speed:,} H/s
+
+TIMESTAMP:
+  • Started: {started}
+  • Completed: {completed}
+
+""" + "=" * 60 + """
+Reports are now available for export!
+Use the buttons above to generate JSON, HTML, or TXT reports.
+"""
+
+# Lines kept in the -TERMINAL- widget after it is trimmed
+TERMINAL_VISIBLE_LINES = 20
+
+# Event-loop poll interval while an attack is running (idle loop blocks)
+ATTACK_POLL_MS = 250
+
+# Event posted by attack threads when stats change, and its minimum spacing
+ATTACK_PROGRESS_EVENT = '-ATTACK_PROGRESS-'
+PROGRESS_EVENT_INTERVAL = 0.2
+
+# Event posted when the attack worker returns, so the result renders at once
+ATTACK_DONE_EVENT = '-ATTACK_DONE-'
+
+# Per-update progress diagnostics (set PCS_DEBUG=1), printed this many lines at a time
+DEBUG_PROGRESS = bool(os.environ.get('PCS_DEBUG'))
+DEBUG_FLUSH_LINES = 32
+
+# Hashcat progress events buffered for the UI thread, and how many it takes per tick
+PROGRESS_QUEUE_SIZE = 256
+PROGRESS_DRAIN_LIMIT = 8
+
+# Wordlist entries hashed per block in the CPU dictionary attack
+DICTIONARY_BLOCK_SIZE = 4096
+
+# Minimum attempts between attack_stats/terminal updates from the CPU attacks
+STATS_PUBLISH_ATTEMPTS = 8192
+
+# Event posted by the GPX benchmark thread with (algo_name, results, errors)
+GPX_BENCHMARK_EVENT = '-BENCH_DONE-'
+
+# Events posted by device rescan threads with an error message (None on success)
+GPX_RESCAN_EVENT = '-RESCAN_DONE-'
+DIAG_RESCAN_EVENT = '-DIAG_RESCAN_DONE-'
+
+# Event posted by the report thread with (path, error message)
+REPORT_EVENT = '-REPORT_DONE-'
+
+# Events posted to the benchmark window: one per algorithm, then completion
+BENCHMARK_ROW_EVENT = '-BENCH_ROW-'
+BENCHMARK_FINISHED_EVENT = '-BENCH_FINISHED-'
+
+# Words remembered across wordlists for de-duplication before the set is reset
+TRIED_WORDS_LIMIT = 50_000_000
+
+# Mask length of the GPU incremental brute-force (?a per position)
+GPU_MAX_LENGTH = 16
+
+# CPU brute-force alphabet (a-z A-Z 0-9 and 8 symbols) and maximum length
+BRUTEFORCE_CHARSET = (string.ascii_lowercase + string.ascii_uppercase + string.digits + "!@#$%^&*").encode()
+BRUTEFORCE_MAX_LENGTH = 12
+
+# Keyspace size of each CPU brute-force length (index 0 unused)
+_BRUTEFORCE_COMBOS = [len(BRUTEFORCE_CHARSET) ** n for n in range(BRUTEFORCE_MAX_LENGTH + 1)]
+
 
 class PasswordCrackGUI:
     """Main GUI application class."""
@@ -36,63 +225,137 @@ class PasswordCrackGUI:
     def __init__(self):
         """Initialize the GUI application."""
         self.config_file = Path.cwd() / "config.json"
-        self.config: Dict[str, Any] = self.load_config()
+        # mtime of the config file when last parsed/written; dirty = unsaved changes
+        self._config_mtime: Optional[int] = None
+        self._config_dirty = False
+        # Loaded in run() once consent is given; nothing reads it before then
+        self.config: Dict[str, Any] = {}
         self.consent_given = False
         self.current_session = None
-        self.attack_thread: Optional[threading.Thread] = None
+        # One long-lived worker runs every attack; attack_future tracks the current one
+        self._attack_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='attack')
+        self.attack_future: Optional[Future] = None
         self.attack_running = False
-        self.attack_paused = False
+        # Set while the attack may run, cleared on pause; workers block in wait()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
         self.attack_result = None
-        self.attack_stats = {'attempts': 0, 'speed': 0, 'start_time': None, 'current_candidate': ''}
-        self.terminal_buffer = []
+        self.attack_stats = {'attempts': 0, 'speed': 0, 'start_time': None, 'start_perf': None, 'current_candidate': ''}
+        self.terminal_buffer = _TerminalBuffer()
+        # Buffer version already shown in -TERMINAL-, and lines in the widget
+        self._terminal_drawn_version = 0
+        self._terminal_lines_shown = 0
+        # Attempt count last rendered by update_progress, and last progress event time
+        self._rendered_attempts: Optional[int] = None
+        # (terminal version, attempts, has result) last handed to update_progress
+        self._last_render_key: Optional[Tuple[int, int, bool]] = None
+        # Value last written to each live stats widget, see _update_changed
+        self._ui_cache: Dict[str, Any] = {}
+        self._last_progress_event = 0.0
+        # Hashcat progress handed from the callback thread to the UI thread,
+        # and the attempt count of the last progress line written
+        self.progress_queue: queue.Queue = queue.Queue(maxsize=PROGRESS_QUEUE_SIZE)
+        self._progress_line_attempts = 0
+        self._debug_buf: List[str] = []
+        self.window: Optional[sg.Window] = None
         
         # Initialize managers
         self.wordlist_manager = WordlistManager()
         self.session_manager = SessionManager()
         self.results_analyzer = ResultsAnalyzer()
+        # Report menu event -> generator
+        self._report_funcs = {
+            'JSON Report': self.results_analyzer.generate_report_json,
+            'HTML Report': self.results_analyzer.generate_report_html,
+            'TXT Report': self.results_analyzer.generate_report_txt
+        }
         self.security_manager = SecurityManager()
-        self.simulator = DemoSimulator()
+        self._simulator = None  # DemoSimulator, created on first use
+        self._demo_scripts: Dict[str, str] = {}  # Demo script per difficulty (static text)
+        self._wordlist_paths: Dict[str, Path] = {}  # Wordlist choice -> absolute path, see _resolve_wordlist
+        self._about_cache: Tuple[Optional[Dict[str, Any]], str] = (None, "")  # (config it was built from, text)
         
         # Initialize GPX (GPU/CPU acceleration)
         self.gpx_manager = GPXManager()
         self.hashcat_wrapper: Optional[HashcatWrapper] = None
         self.gpx_enabled = False
         self.gpx_devices_detected = False
+        # Cached is_gpu_available() / get_device_summary() results,
+        # refreshed whenever devices are rescanned
+        self._gpu_available = False
+        self._device_summary_cache: Optional[str] = None
+        # Device detection is deferred until consent is given
+        self._gpx_initialized = False
+        
+        # Set theme
+        sg.theme('DarkBlue3')
+    
+    def _ensure_gpx_initialized(self) -> None:
+        """Detect devices and locate hashcat (runs once, after consent)."""
+        if self._gpx_initialized:
+            return
+        self._gpx_initialized = True
         
         # Try to initialize GPX
         try:
             self.gpx_manager.detect_devices()
             self.gpx_devices_detected = True
+            self._refresh_device_state()
             
             # Always create hashcat wrapper (it won't raise error anymore)
             self.hashcat_wrapper = HashcatWrapper(self.gpx_manager)
             
             if self.hashcat_wrapper.hashcat_path:
                 print(f"✅ Hashcat found: {self.hashcat_wrapper.hashcat_path}")
-                if self.gpx_manager.is_gpu_available():
+                if self._gpu_available:
                     self.gpx_enabled = True  # Default to ON if GPU available
             else:
                 print(f"⚠️ Hashcat not found - GPU acceleration disabled")
                 
         except Exception as e:
             print(f"GPX initialization warning: {e}")
-            import traceback
             traceback.print_exc()
-        
-        # Set theme
-        sg.theme('DarkBlue3')
+    
+    @property
+    def simulator(self):
+        """Demo simulator, imported and created on first use."""
+        if self._simulator is None:
+            from ..simulator import DemoSimulator
+            self._simulator = DemoSimulator()
+        return self._simulator
+    
+    def _refresh_device_state(self) -> None:
+        """Cache device availability and summary after a (re)scan."""
+        self._gpu_available = self.gpx_manager.is_gpu_available()
+        self._device_summary_cache = self.gpx_manager.get_device_summary()
     
     def load_config(self) -> Dict[str, Any]:
-        """Load application configuration."""
-        if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
-        return {}
+        """Load application configuration (re-parsed only if the file changed)."""
+        try:
+            mtime = self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        
+        if mtime == self._config_mtime:
+            return self.config
+        
+        data = self.config_file.read_bytes()
+        config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        self._config_mtime = mtime
+        return config
     
     def save_config(self) -> None:
-        """Save application configuration."""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        """Save application configuration (no-op if nothing changed)."""
+        if not self._config_dirty:
+            return
+        
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.config, indent=2).encode('utf-8')
+        self.config_file.write_bytes(data)
+        self._config_mtime = self.config_file.stat().st_mtime_ns
+        self._config_dirty = False
     
     def show_consent_screen(self) -> bool:
         """
@@ -196,7 +459,7 @@ class PasswordCrackGUI:
                 return True
             
             if event == "Save & Continue":
-                self.config = {
+                new_config = {
                     'project_name': values['-PROJECT-'],
                     'repo_url': values['-REPO-'],
                     'author': values['-AUTHOR-'],
@@ -205,6 +468,9 @@ class PasswordCrackGUI:
                     'description': values['-DESC-'],
                     'first_run_completed': True
                 }
+                if new_config != self.config:
+                    self.config = new_config
+                    self._config_dirty = True
                 self.save_config()
                 window.close()
                 return True
@@ -213,10 +479,11 @@ class PasswordCrackGUI:
     
     def create_main_window(self) -> sg.Window:
         """Create the main application window."""
+        self._ensure_gpx_initialized()
         
         # Build GPX device summary
-        gpx_device_text = self.gpx_manager.get_device_summary() if self.gpx_devices_detected else "Scanning devices..."
-        gpx_enabled_default = self.gpx_enabled and self.gpx_manager.is_gpu_available()
+        gpx_device_text = self._device_summary_cache if self.gpx_devices_detected else "Scanning devices..."
+        gpx_enabled_default = self.gpx_enabled and self._gpu_available
         
         # Main layout with tabs
         tab_new_session = [
@@ -233,7 +500,7 @@ class PasswordCrackGUI:
             [sg.Text("GPU/CPU Acceleration (GPX):", font=("Arial", 10, "bold"))],
             [sg.Checkbox("Use GPU if available", key='-GPX_ENABLED-', default=gpx_enabled_default,
                         tooltip="GPX = Use GPU acceleration (OpenCL/CUDA). Falls back to CPU if no GPU found.",
-                        disabled=not self.gpx_manager.is_gpu_available()),
+                        disabled=not self._gpu_available),
              sg.Button("Benchmark", key='-BENCHMARK-', size=(12, 1),
                       tooltip="Run a short benchmark to measure GPU/CPU speed"),
              sg.Button("Rescan Devices", key='-RESCAN_DEVICES-', size=(12, 1),
@@ -241,7 +508,7 @@ class PasswordCrackGUI:
              sg.Button("Diagnostics", key='-GPX_DIAGNOSTICS-', size=(12, 1),
                       tooltip="Show detailed GPU/CPU detection diagnostics")],
             [sg.Text(gpx_device_text, key='-GPX_DEVICE_INFO-', size=(70, 1), 
-                    text_color='black' if self.gpx_manager.is_gpu_available() else 'gray')],
+                    text_color='black' if self._gpu_available else 'gray')],
             [sg.Text("Estimated Speed: N/A", key='-GPX_SPEED_EST-', size=(70, 1), visible=False)],
             [sg.Checkbox("Allow CPU + GPU mixed mode", key='-GPX_MIXED-', default=True,
                         tooltip="Use both CPU and GPU together (if supported by hash algorithm)")],
@@ -249,20 +516,12 @@ class PasswordCrackGUI:
             [sg.Text("Attack Type:", font=("Arial", 10, "bold"))],
             [sg.Radio("Dictionary Attack (Fast - tries common passwords)", "ATTACK", key='-DICT-', default=True)],
             [sg.Radio("Brute-Force Attack (Slow - tries all combinations)", "ATTACK", key='-BRUTE-')],
+            [sg.Text("Minimum length (for Brute-Force):", size=(25, 1)),
+             sg.Combo(list(range(1, GPU_MAX_LENGTH + 1)), default_value=1, key='-MIN_LEN-', size=(5, 1),
+                     readonly=True, tooltip="Skip shorter lengths when the password is known to be longer")],
             [sg.HorizontalSeparator()],
             [sg.Text("Wordlist (for Dictionary):", size=(25, 1)), 
-             sg.Combo([
-                 '*** TRY ALL WORDLISTS ***',
-                 'wordlists/common.txt',
-                 'wordlists/rockyou-lite.txt',
-                 'SecLists/Passwords/Common-Credentials/10k-most-common.txt',
-                 'SecLists/Passwords/Common-Credentials/100k-most-used-passwords-NCSC.txt',
-                 'SecLists/Passwords/Common-Credentials/best1050.txt',
-                 'SecLists/Passwords/Common-Credentials/best110.txt',
-                 'SecLists/Passwords/Common-Credentials/500-worst-passwords.txt',
-                 'SecLists/Passwords/darkc0de.txt',
-                 'SecLists/Passwords/Common-Credentials/darkweb2017_top-10000.txt'
-             ], default_value='SecLists/Passwords/Common-Credentials/best110.txt', 
+             sg.Combo([TRY_ALL_WORDLISTS, *WORDLIST_CHOICES], default_value='SecLists/Passwords/Common-Credentials/best110.txt', 
              key='-WORDLIST-', size=(60, 1))],
             [sg.HorizontalSeparator()],
             [sg.Button("Start Attack", size=(15, 1), button_color=('white', 'green')),
@@ -326,8 +585,12 @@ class PasswordCrackGUI:
     
     def log_message(self, window: sg.Window, message: str) -> None:
         """Add a message to the log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        window['-LOG-'].print(f"[{timestamp}] {message}")
+        window['-LOG-'].print(f"[{_log_timestamp()}] {message}")
+    
+    def log_messages(self, window: sg.Window, messages: List[str]) -> None:
+        """Add several messages to the log in one widget update."""
+        stamp = f"[{_log_timestamp()}] "
+        window['-LOG-'].print('\n'.join(stamp + message for message in messages))
     
     def run(self) -> None:
         """Run the main application."""
@@ -336,6 +599,8 @@ class PasswordCrackGUI:
             return
         
         self.consent_given = True
+        self.config = self.load_config()
+        self._ensure_gpx_initialized()
         
         # Show metadata prompt on first run
         if not self.show_metadata_prompt():
@@ -343,21 +608,37 @@ class PasswordCrackGUI:
         
         # Create main window
         window = self.create_main_window()
+        self.window = window
         
-        # Event loop
+        # Event loop: block while idle, poll while an attack needs redrawing
         while True:
-            event, values = window.read(timeout=100)
+            poll = ATTACK_POLL_MS if (self.attack_running or self.attack_result) else None
+            event, values = window.read(timeout=poll)
             
             if event in (sg.WIN_CLOSED, 'Exit'):
                 if self.attack_running:
                     self.attack_running = False
-                    if self.attack_thread:
-                        self.attack_thread.join(timeout=2)
+                    self._resume_event.set()
+                    # The executor's worker is joined at interpreter exit, so
+                    # don't leave it blocked on a hashcat run
+                    if getattr(self, 'hashcat_wrapper', None):
+                        self.hashcat_wrapper.stop_attack()
+                    if self.attack_future:
+                        wait([self.attack_future], timeout=2)
                 break
             
-            # Update progress if attack is running OR if there's a result to show
+            # Update progress if attack is running OR if there's a result to show,
+            # and only if something was published since the last render
             if self.attack_running or self.attack_result:
-                self.update_progress(window)
+                self._drain_progress()
+                render_key = (
+                    self.terminal_buffer.version,
+                    self.attack_stats['attempts'],
+                    self.attack_result is not None
+                )
+                if render_key != self._last_render_key:
+                    self._last_render_key = render_key
+                    self.update_progress(window)
             
             # Handle events
             if event == '-DETECT-':
@@ -366,8 +647,12 @@ class PasswordCrackGUI:
                 self.show_hash_generator()
             elif event == '-BENCHMARK-':
                 self.handle_gpx_benchmark(window, values)
+            elif event == GPX_BENCHMARK_EVENT:
+                self.handle_gpx_benchmark_done(window, *values[event])
             elif event == '-RESCAN_DEVICES-':
                 self.handle_gpx_rescan(window)
+            elif event == GPX_RESCAN_EVENT:
+                self.handle_gpx_rescan_done(window, values[event])
             elif event == '-GPX_DIAGNOSTICS-':
                 self.handle_gpx_diagnostics(window)
             elif event == 'Start Attack':
@@ -390,10 +675,14 @@ class PasswordCrackGUI:
                 self.run_quick_demo(window)
             elif event == 'About':
                 self.show_about()
-            elif event in ['JSON Report', 'HTML Report', 'TXT Report']:
+            elif event in self._report_funcs:
                 self.handle_generate_report(window, event)
+            elif event == REPORT_EVENT:
+                self.handle_report_done(window, *values[event])
         
+        self.window = None
         window.close()
+        self._attack_executor.shutdown(wait=False)
     
     def handle_hash_detection(self, window: sg.Window, values: Dict) -> None:
         """Handle auto-detect hash type."""
@@ -412,32 +701,32 @@ class PasswordCrackGUI:
     
     def _run_attack(self, hash_value: str, algorithm: HashAlgorithm, attack_type: str, values: Dict) -> None:
         """Run the attack in a background thread."""
-        import time
-        
         # ✅ VALIDATION: Check hash format before starting attack
-        is_valid, error_msg = HashUtils.validate_hash(hash_value, algorithm)
+        is_valid, error_msg = _cached_validate(hash_value, algorithm)
         if not is_valid:
             self.terminal_buffer.append(f"❌ INVALID HASH: {error_msg}")
             self.terminal_buffer.append(f"Hash entered: {hash_value}")
             self.terminal_buffer.append(f"Example valid {algorithm.value.upper()} hash:")
             
             # Show example for the algorithm
-            examples = {
-                HashAlgorithm.MD5: "5f4dcc3b5aa765d61d8327deb882cf99 (password: 'password')",
-                HashAlgorithm.SHA1: "5baa61e4c9b93f3f0682250b6cf8331b7ee68fd8 (password: 'password')",
-                HashAlgorithm.SHA256: "5e884898da28047151d0e56f8dc6292773603d0d6aabbdd62a11ef721d1542d8 (password: 'password')",
-                HashAlgorithm.SHA512: "b109f3bbbc244eb82441917ed06d618b9008dd09b3befd1b5e07394c706a8bb980b1d7785e5976ec049b46df5f1326af5a2ea6d103fd07c95385ffab0cacbc86 (password: 'password')",
-                HashAlgorithm.NTLM: "8846f7eaee8fb117ad06bdd830b7586c (password: 'password')"
-            }
-            self.terminal_buffer.append(f"  {examples.get(algorithm, 'N/A')}")
+            self.terminal_buffer.append(f"  {_HASH_EXAMPLES.get(algorithm, 'N/A')}")
             self.terminal_buffer.append("="*50)
-            self.window['-OUTPUT-'].update('\n'.join(self.terminal_buffer[-100:]))
-            self.window['-CRACK-'].update(disabled=False)
+            # Widgets must not be touched from this thread; update_progress
+            # flushes the lines above and reports the failure
+            self.attack_result = {
+                'success': False,
+                'password': None,
+                'attempts': 0,
+                'duration': 0,
+                'error': f'❌ Invalid hash: {error_msg}'
+            }
+            self.attack_running = False
             return
         
-        print(f"DEBUG: _run_attack started! Type: {attack_type}, Algorithm: {algorithm.value.upper()}, Hash: {hash_value[:16]}...")
+        algo_upper = algorithm.value.upper()
+        print(f"DEBUG: _run_attack started! Type: {attack_type}, Algorithm: {algo_upper}, Hash: {hash_value[:16]}...")
         self.terminal_buffer.append(f">>> ATTACK STARTED: {attack_type.upper()} <<<")
-        self.terminal_buffer.append(f"Algorithm: {algorithm.value.upper()}")
+        self.terminal_buffer.append(f"Algorithm: {algo_upper}")
         self.terminal_buffer.append(f"Target Hash: {hash_value[:32]}...")
         self.terminal_buffer.append("="*50)
         
@@ -450,27 +739,30 @@ class PasswordCrackGUI:
         print(f"DEBUG: Hashcat wrapper exists: {self.hashcat_wrapper is not None}")
         if self.hashcat_wrapper:
             print(f"DEBUG: Hashcat path: {self.hashcat_wrapper.hashcat_path}")
-        print(f"DEBUG: GPU available: {self.gpx_manager.is_gpu_available()}")
+        print(f"DEBUG: GPU available: {self._gpu_available}")
         
         # Determine execution mode
         use_gpx = (gpx_enabled and 
                    self.hashcat_wrapper is not None and 
                    self.hashcat_wrapper.hashcat_path is not None and 
-                   self.gpx_manager.is_gpu_available())
+                   self._gpu_available)
         
         print(f"DEBUG: Final use_gpx decision: {use_gpx}")
         
         # Show hashcat warning if GPU enabled but hashcat missing
         if gpx_enabled and (not self.hashcat_wrapper or not self.hashcat_wrapper.hashcat_path):
-            self.terminal_buffer.append("⚠️ GPU ACCELERATION REQUESTED BUT HASHCAT NOT FOUND")
-            self.terminal_buffer.append("⚠️ Please install hashcat from: https://hashcat.net/hashcat/")
-            self.terminal_buffer.append("⚠️ See HASHCAT_INSTALL_GUIDE.md for instructions")
-            self.terminal_buffer.append("⚠️ Falling back to CPU mode...")
-            self.terminal_buffer.append("="*50)
+            # One buffer entry, so the warning is drawn in a single widget update
+            self.terminal_buffer.append("\n".join([
+                "⚠️ GPU ACCELERATION REQUESTED BUT HASHCAT NOT FOUND",
+                "⚠️ Please install hashcat from: https://hashcat.net/hashcat/",
+                "⚠️ See HASHCAT_INSTALL_GUIDE.md for instructions",
+                "⚠️ Falling back to CPU mode...",
+                "="*50,
+            ]))
             # Note: Cannot show popup from thread, message shown in terminal instead
         
         if use_gpx:
-            device_info = self.gpx_manager.get_device_summary()
+            device_info = self._device_summary_cache
             self.terminal_buffer.append(f"🚀 GPU ACCELERATION ENABLED")
             self.terminal_buffer.append(f"Device: {device_info}")
             self.terminal_buffer.append(f"Mixed Mode: {'ON' if gpx_mixed else 'OFF'}")
@@ -481,17 +773,16 @@ class PasswordCrackGUI:
             self._run_gpx_attack(hash_value, algorithm, attack_type, values, gpx_mixed)
         else:
             # Use CPU-only mode
-            if gpx_enabled and not self.gpx_manager.is_gpu_available():
+            if gpx_enabled and not self._gpu_available:
                 self.terminal_buffer.append(f"⚠️ GPU requested but not available")
             self.terminal_buffer.append(f"💻 CPU MODE")
             self.terminal_buffer.append("="*50)
-            self._run_cpu_attack(hash_value, algorithm, attack_type, values)
             print(f"DEBUG: Using CPU-only mode")
             self._run_cpu_attack(hash_value, algorithm, attack_type, values)
     
     def _run_gpx_attack(self, hash_value: str, algorithm: HashAlgorithm, attack_type: str, values: Dict, mixed_mode: bool) -> None:
         """Run GPU-accelerated attack using GPX engines."""
-        import time
+        from ..attack_engines.gpx_engine import GPXDictionaryEngine, GPXBruteforceEngine
         
         try:
             if attack_type == 'dictionary':
@@ -506,72 +797,62 @@ class PasswordCrackGUI:
                 )
                 
                 # Get wordlist(s)
-                if values['-WORDLIST-'] == '*** TRY ALL WORDLISTS ***':
-                    wordlists = [
-                        'wordlists/common.txt',
-                        'wordlists/rockyou-lite.txt',
-                        'SecLists/Passwords/Common-Credentials/best110.txt',
-                        'SecLists/Passwords/Common-Credentials/best1050.txt',
-                        'SecLists/Passwords/Common-Credentials/10k-most-common.txt',
-                        'SecLists/Passwords/Common-Credentials/100k-most-used-passwords-NCSC.txt',
-                        'SecLists/Passwords/darkc0de.txt'
-                    ]
+                if values['-WORDLIST-'] == TRY_ALL_WORDLISTS:
+                    wordlists = list(ALL_WORDLISTS)
                     self.terminal_buffer.append(">>> TRYING ALL WORDLISTS (GPU MODE) <<<")
                 else:
                     wordlists = [values['-WORDLIST-']]
                 
                 total_attempts = 0
                 
-                # Try each wordlist with GPU
-                for wordlist_name in wordlists:
-                    if not self.attack_running:
-                        break
+                # All wordlists go to a single hashcat run, so device setup
+                # and kernel compilation are paid once
+                names = ', '.join(name.split('/')[-1] for name in wordlists)
+                self.terminal_buffer.append(f"\n=== GPU Processing: {names} ===")
+                print(f"DEBUG: GPU processing wordlists: {wordlists}")
+                
+                try:
+                    result = engine.attack_many(
+                        wordlist_files=wordlists,
+                        wordlist_manager=self.wordlist_manager,
+                        use_gpu=True,
+                        mixed_mode=mixed_mode
+                    )
                     
-                    self.terminal_buffer.append(f"\n=== GPU Processing: {wordlist_name.split('/')[-1]} ===")
-                    print(f"DEBUG: GPU processing wordlist: {wordlist_name}")
+                    for wordlist_name in engine.skipped_wordlists:
+                        self.terminal_buffer.append(f"SKIP: {wordlist_name} not found")
                     
-                    try:
-                        # Run GPU-accelerated dictionary attack
-                        result = engine.attack(
-                            wordlist_file=wordlist_name,
-                            wordlist_manager=self.wordlist_manager,
-                            use_gpu=True,
-                            mixed_mode=mixed_mode,
-                            progress_callback=None  # Hashcat provides its own progress
-                        )
-                        
-                        total_attempts += engine.attempts
-                        self.attack_stats['attempts'] = total_attempts
-                        
-                        if result:
-                            # PASSWORD FOUND!
-                            print(f"DEBUG: GPX found password: {result}")
-                            self.terminal_buffer.append("")
-                            self.terminal_buffer.append("=" * 50)
-                            self.terminal_buffer.append(f"🎉 PASSWORD FOUND (GPU): {result}")
-                            self.terminal_buffer.append("=" * 50)
-                            
-                            self.attack_result = {
-                                'success': True,
-                                'password': result,
-                                'attempts': total_attempts,
-                                'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds()
-                            }
-                            self.attack_running = False
-                            time.sleep(0.2)
-                            return
+                    total_attempts += engine.attempts
+                    self.attack_stats['attempts'] = total_attempts
                     
-                    except Exception as e:
-                        print(f"DEBUG: GPX wordlist failed: {e}")
-                        self.terminal_buffer.append(f"⚠️ GPU error for {wordlist_name}: {e}")
-                        continue
+                    if result:
+                        # PASSWORD FOUND!
+                        print(f"DEBUG: GPX found password: {result}")
+                        self.terminal_buffer.append("")
+                        self.terminal_buffer.append("=" * 50)
+                        self.terminal_buffer.append(f"🎉 PASSWORD FOUND (GPU): {result}")
+                        self.terminal_buffer.append("=" * 50)
+                        
+                        self.attack_result = {
+                            'success': True,
+                            'password': result,
+                            'attempts': total_attempts,
+                            'duration': self._elapsed()
+                        }
+                        self.attack_running = False
+                        time.sleep(0.2)
+                        return
+                
+                except Exception as e:
+                    print(f"DEBUG: GPX wordlists failed: {e}")
+                    self.terminal_buffer.append(f"⚠️ GPU error: {e}")
                 
                 # No match found
                 self.attack_result = {
                     'success': False,
                     'password': None,
                     'attempts': total_attempts,
-                    'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds(),
+                    'duration': self._elapsed(),
                     'error': f'❌ Password not found (GPU mode) - tried {total_attempts:,} passwords'
                 }
             
@@ -581,8 +862,9 @@ class PasswordCrackGUI:
                 # Mark as GPU attack in stats for pause/stop handling
                 self.attack_stats['use_gpu'] = True
                 
+                min_len = self._min_length(values, GPU_MAX_LENGTH)
                 self.terminal_buffer.append(f"🔥 GPU BRUTE-FORCE ATTACK")
-                self.terminal_buffer.append(f"Mode: Incremental (starts at length 1, continues until found)")
+                self.terminal_buffer.append(f"Mode: Incremental (starts at length {min_len}, continues until found)")
                 self.terminal_buffer.append(f"Charset: All printable (a-zA-Z0-9 + symbols)")
                 self.terminal_buffer.append(f"Max length: 16 characters (can take hours/days for long passwords!)")
                 self.terminal_buffer.append(f"⚠️ This uses 100% GPU power - will run until password found")
@@ -597,7 +879,8 @@ class PasswordCrackGUI:
                 )
                 
                 # Progress callback to show real-time attempts
-                last_update = [0]  # Use list to modify in nested function
+                # terminal_buffer is cleared in place, never rebound, so its append can be bound once
+                terminal_append = self.terminal_buffer.append
                 
                 def progress_callback(update):
                     """Handle real-time hashcat progress updates"""
@@ -605,54 +888,32 @@ class PasswordCrackGUI:
                         if update['type'] == 'candidate':
                             # Show candidate range being tried
                             candidate_info = update['info']
-                            self.terminal_buffer.append(f"🔍 Trying: {candidate_info}")
-                            # Keep buffer size reasonable
-                            if len(self.terminal_buffer) > 100:
-                                self.terminal_buffer.pop(0)
+                            terminal_append(_TRY_PREFIX + candidate_info)
                             # Update stats
                             self.attack_stats['current_candidate'] = candidate_info
-                            print(f"DEBUG: Showing candidate: {candidate_info}")
-                            import sys
-                            sys.stdout.flush()
                         
                         elif update['type'] == 'progress':
-                            # Show progress stats (every update)
-                            attempts = update.get('attempts', 0)
-                            total = update.get('total', 0)
-                            speed = update.get('speed', 0)
-                            
-                            # Update attack stats ALWAYS
-                            self.attack_stats['attempts'] = attempts
-                            
-                            # Update terminal more frequently (every 50k attempts)
-                            if attempts - last_update[0] >= 50000 or attempts < 100000:
-                                if speed >= 1000000:
-                                    speed_str = f"{speed/1000000:.2f} MH/s"
-                                elif speed >= 1000:
-                                    speed_str = f"{speed/1000:.1f} kH/s"
-                                else:
-                                    speed_str = f"{speed:.0f} H/s"
-                                
-                                percent = (attempts / total * 100) if total > 0 else 0
-                                self.terminal_buffer.append(f"⚡ Progress: {attempts:,}/{total:,} ({percent:.1f}%) @ {speed_str}")
-                                if len(self.terminal_buffer) > 100:
-                                    self.terminal_buffer.pop(0)
-                                last_update[0] = attempts
-                                print(f"DEBUG: Progress update: {attempts:,} attempts @ {speed_str}")
-                                import sys
-                                sys.stdout.flush()
+                            # Hand progress to the UI thread (see _drain_progress)
+                            self._queue_progress((
+                                update.get('attempts', 0),
+                                update.get('total', 0),
+                                update.get('speed', 0)
+                            ))
+                            self._post_progress()
                     except Exception as e:
                         print(f"DEBUG: Progress callback error: {e}")
-                        import traceback
                         traceback.print_exc()
                 
                 # Run GPU brute-force with incremental mode and real-time progress
-                # Mask ?a?a?a?a?a?a?a?a?a?a?a?a?a?a?a?a = 16 chars max, hashcat will try 1,2,3...16
+                # Mask ?a?a?a?a?a?a?a?a?a?a?a?a?a?a?a?a = 16 chars max, hashcat will try min_len...16
                 result = engine.attack(
-                    mask='?a?a?a?a?a?a?a?a?a?a?a?a?a?a?a?a',  # 16 positions, incremental tries 1-16
+                    mask='?a' * GPU_MAX_LENGTH,  # 16 positions, incremental tries min_len-16
                     use_gpu=True,
                     mixed_mode=mixed_mode,
-                    progress_callback=progress_callback  # NOW WITH REAL-TIME UPDATES!
+                    progress_callback=progress_callback,  # NOW WITH REAL-TIME UPDATES!
+                    optimized_kernels=True,  # Mask is 16 chars, under the 32-char -O limit
+                    workload=4,  # Nightmare profile, matches the 100% GPU warning above
+                    increment_min=min_len  # One hashcat session from min_len up to 16
                 )
                 
                 if result:
@@ -668,7 +929,7 @@ class PasswordCrackGUI:
                         'success': True,
                         'password': result,
                         'attempts': engine.attempts,
-                        'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds()
+                        'duration': self._elapsed()
                     }
                 else:
                     # Password not found (exhausted search space)
@@ -676,7 +937,7 @@ class PasswordCrackGUI:
                     self.terminal_buffer.append("")
                     self.terminal_buffer.append("=" * 50)
                     self.terminal_buffer.append("❌ PASSWORD NOT FOUND")
-                    self.terminal_buffer.append(f"Mode: Incremental brute-force (lengths 1-16)")
+                    self.terminal_buffer.append(f"Mode: Incremental brute-force (lengths {min_len}-{GPU_MAX_LENGTH})")
                     self.terminal_buffer.append(f"Charset: All printable characters (a-zA-Z0-9 + symbols)")
                     self.terminal_buffer.append(f"Total attempts: {attempts:,}")
                     self.terminal_buffer.append(f"Password is either:")
@@ -690,15 +951,14 @@ class PasswordCrackGUI:
                         'success': False,
                         'password': None,
                         'attempts': attempts,  # Use actual attempts
-                        'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds(),
-                        'error': f'❌ Password not found after {attempts:,} GPU attempts (incremental 1-8 chars)'
+                        'duration': self._elapsed(),
+                        'error': f'❌ Password not found after {attempts:,} GPU attempts (incremental {min_len}-{GPU_MAX_LENGTH} chars)'
                     }
                 
                 self.attack_running = False
             
         except Exception as e:
             print(f"DEBUG: GPX attack exception: {e}")
-            import traceback
             error_details = traceback.format_exc()
             print(f"DEBUG: Full traceback:\n{error_details}")
             traceback.print_exc()
@@ -714,178 +974,247 @@ class PasswordCrackGUI:
                 'success': False,
                 'password': None,
                 'attempts': self.attack_stats.get('attempts', 0),
-                'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds(),
+                'duration': self._elapsed(),
                 'error': f'❌ GPU attack error: {str(e)}'
             }
             self.attack_running = False
     
     def _run_cpu_attack(self, hash_value: str, algorithm: HashAlgorithm, attack_type: str, values: Dict) -> None:
         """Run CPU-only attack (fallback mode)."""
-        import time
-        import itertools
-        import string
-        
+        algo_upper = algorithm.value.upper()
+        pool = None  # worker processes, started on demand
         try:
             if attack_type == 'dictionary':
-                print(f"DEBUG: Starting dictionary attack with {algorithm.value.upper()}")
+                print(f"DEBUG: Starting dictionary attack with {algo_upper}")
                 
                 # Check if user wants to try all wordlists
-                if values['-WORDLIST-'] == '*** TRY ALL WORDLISTS ***':
-                    wordlists = [
-                        'wordlists/common.txt',
-                        'wordlists/rockyou-lite.txt',
-                        'SecLists/Passwords/Common-Credentials/best110.txt',
-                        'SecLists/Passwords/Common-Credentials/best1050.txt',
-                        'SecLists/Passwords/Common-Credentials/10k-most-common.txt',
-                        'SecLists/Passwords/Common-Credentials/100k-most-used-passwords-NCSC.txt',
-                        'SecLists/Passwords/darkc0de.txt'
-                    ]
+                if values['-WORDLIST-'] == TRY_ALL_WORDLISTS:
+                    wordlists = list(ALL_WORDLISTS)
                     self.terminal_buffer.append(">>> TRYING ALL WORDLISTS <<<")
                 else:
                     wordlists = [values['-WORDLIST-']]
                 
+                from ..attack_engines import dictionary_engine
+                
+                processes = os.cpu_count() or 1
                 total_attempts = 0
+                next_publish = 0
+                find_match = HashUtils.block_matcher(hash_value, algorithm)
+                block_size = DICTIONARY_BLOCK_SIZE
+                on_device = False
+                # Words already hashed by an earlier wordlist (the lists overlap heavily)
+                tried = set()
+                tried_add = tried.add
+                
+                # GPU requested but hashcat unusable: hash on the OpenCL device
+                if values.get('-GPX_ENABLED-', False):
+                    from ..attack_engines import opencl_kernels
+                    if opencl_kernels.kernel_supports(algorithm):
+                        try:
+                            find_match = opencl_kernels.OpenCLMatcher(hash_value, algorithm).find_match
+                            block_size = opencl_kernels.OPENCL_BLOCK_SIZE
+                            on_device = True
+                            self.terminal_buffer.append("🚀 Hashing on OpenCL device (pyopencl)")
+                        except Exception as e:
+                            print(f"DEBUG: OpenCL unavailable: {e}")
+                            self.terminal_buffer.append(f"⚠️ OpenCL unavailable, using CPU: {e}")
+                
                 for wordlist_name in wordlists:
                     if not self.attack_running:
                         break
                     
-                    wordlist_path = Path("examples") / wordlist_name
-                    if not wordlist_path.exists():
-                        wordlist_path = Path.cwd() / "examples" / wordlist_name
+                    wordlist_path = self._resolve_wordlist(wordlist_name)
+                    try:
+                        size = wordlist_path.stat().st_size if wordlist_path else None
+                        if size is None:
+                            words = None
+                        elif size > WORD_CACHE_MAX_BYTES:
+                            # Too large to keep parsed in memory: hash it as it is read
+                            words = self.wordlist_manager.iter_words(wordlist_path)
+                        else:
+                            # Words as raw bytes (parsed once per file version); only decoded for display
+                            words = self.wordlist_manager.load_cached(wordlist_path)
+                    except FileNotFoundError:
+                        self._wordlist_paths.pop(wordlist_name, None)
+                        words = None
                     
-                    if not wordlist_path.exists():
+                    if words is None:
                         self.terminal_buffer.append(f"SKIP: {wordlist_name} not found")
                         continue
                     
                     print(f"DEBUG: Trying wordlist: {wordlist_path}")
                     self.terminal_buffer.append(f"\n=== Trying: {wordlist_name.split('/')[-1]} ===")
                     
-                    # Load wordlist
-                    with open(wordlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        words = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+                    if len(wordlists) > 1:
+                        if len(tried) > TRIED_WORDS_LIMIT:
+                            tried.clear()
+                        if isinstance(words, list):
+                            # Keep first occurrences only; set.add returns None, so each
+                            # new word is recorded and kept in one pass
+                            unique = (w for w in words if not (w in tried or tried_add(w)))
+                        else:
+                            # Streamed lists only skip words already tried - recording
+                            # them would grow tried with the whole file
+                            unique = (w for w in words if w not in tried)
+                    else:
+                        unique = None
                     
-                    print(f"DEBUG: Loaded {len(words)} words from {wordlist_name}")
-                    self.terminal_buffer.append(f"Loaded {len(words)} passwords...")
+                    if isinstance(words, list):
+                        loaded = len(words)
+                        if unique is not None:
+                            words = list(unique)
+                        print(f"DEBUG: Loaded {loaded} words from {wordlist_name} ({loaded - len(words)} duplicates skipped)")
+                        if len(words) < loaded:
+                            self.terminal_buffer.append(f"Loaded {loaded} passwords ({len(words)} new)...")
+                        else:
+                            self.terminal_buffer.append(f"Loaded {loaded} passwords...")
+                    else:
+                        if unique is not None:
+                            words = unique
+                        print(f"DEBUG: Streaming {wordlist_name} ({size:,} bytes)")
+                        self.terminal_buffer.append(f"Streaming {size / 1048576:,.0f} MB of passwords...")
                     
-                    # Try each word from this wordlist
-                    for i, candidate in enumerate(words, 1):
+                    # Hash the wordlist in blocks; stats are published at most
+                    # every STATS_PUBLISH_ATTEMPTS, never per word
+                    word_iter = iter(words)
+                    blocks = iter(lambda: list(islice(word_iter, block_size)), [])
+                    
+                    # Large lists are hashed across worker processes on multi-core CPUs
+                    if (processes > 1 and not on_device
+                            and (not isinstance(words, list) or len(words) >= dictionary_engine.PARALLEL_MIN_WORDS)):
+                        if pool is None:
+                            pool = dictionary_engine.start_pool(hash_value, algorithm, processes)
+                        matches = dictionary_engine.iter_matches_parallel(pool, processes, blocks)
+                    else:
+                        matches = ((block, find_match(block)) for block in blocks)
+                    
+                    for block, index in matches:
+                        if not self._resume_event.is_set():
+                            self._resume_event.wait()
                         if not self.attack_running:
                             print("DEBUG: Attack stopped by user")
                             break
-                        while self.attack_paused:
-                            time.sleep(0.1)
                         
-                        total_attempts += 1
                         
-                        # Update stats EVERY attempt for real-time counter
+                        if index < 0:
+                            total_attempts += len(block)
+                            if total_attempts >= next_publish:
+                                next_publish = total_attempts + STATS_PUBLISH_ATTEMPTS
+                                candidate = block[-1].decode('utf-8', 'ignore')
+                                self.attack_stats['attempts'] = total_attempts
+                                self.attack_stats['current_candidate'] = candidate
+                                self.terminal_buffer.append(f"[{total_attempts:,}] Trying: {candidate}")
+                                self._post_progress()
+                            continue
+                        
+                        total_attempts += index + 1
+                        candidate = block[index].decode('utf-8', 'ignore')
                         self.attack_stats['attempts'] = total_attempts
                         self.attack_stats['current_candidate'] = candidate
-                        
-                        # Update terminal every 10 attempts for speed
-                        if total_attempts % 10 == 0 or total_attempts == 1:
-                            self.terminal_buffer.append(f"[{total_attempts:,}] Trying: {candidate}")
-                            if len(self.terminal_buffer) > 100:
-                                self.terminal_buffer.pop(0)
-                        
-                        if total_attempts == 1:
-                            print(f"DEBUG: First attempt - trying: {candidate}")
-                        
-                        # NO DELAY - run at full speed
-                        
-                        # Try the candidate
-                        candidate_hash = HashUtils.generate_hash(candidate, algorithm)
-                        if candidate_hash == hash_value:
-                            print(f"DEBUG: PASSWORD FOUND: {candidate}")
-                            self.terminal_buffer.append("")
-                            self.terminal_buffer.append("=" * 50)
-                            self.terminal_buffer.append(f"🎉 PASSWORD FOUND: {candidate}")
-                            self.terminal_buffer.append("=" * 50)
-                            self.attack_result = {
-                                'success': True,
-                                'password': candidate,
-                                'attempts': total_attempts,
-                                'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds()
-                            }
-                            self.attack_running = False
-                            time.sleep(0.2)  # Give UI time to pick up the result
-                            return
+                        print(f"DEBUG: PASSWORD FOUND: {candidate}")
+                        self.terminal_buffer.append("")
+                        self.terminal_buffer.append("=" * 50)
+                        self.terminal_buffer.append(f"🎉 PASSWORD FOUND: {candidate}")
+                        self.terminal_buffer.append("=" * 50)
+                        self.attack_result = {
+                            'success': True,
+                            'password': candidate,
+                            'attempts': total_attempts,
+                            'duration': self._elapsed()
+                        }
+                        self.attack_running = False
+                        time.sleep(0.2)  # Give UI time to pick up the result
+                        return
                 
                 # No match found in any wordlist
                 self.attack_result = {
                     'success': False,
                     'password': None,
                     'attempts': total_attempts,
-                    'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds(),
+                    'duration': self._elapsed(),
                     'error': f'❌ Password not found in {len(wordlists)} wordlist(s) - tried {total_attempts:,} passwords'
                 }
             
             elif attack_type == 'bruteforce':
-                print(f"DEBUG: Starting brute-force attack with {algorithm.value.upper()}")
+                print(f"DEBUG: Starting brute-force attack with {algo_upper}")
                 # Brute-force attack - try all combinations
-                max_len = 12  # Fixed max length
-                # Expanded charset: lowercase, uppercase, digits, special chars
-                charset = string.ascii_lowercase + string.ascii_uppercase + string.digits + "!@#$%^&*"
+                max_len = BRUTEFORCE_MAX_LENGTH
+                min_len = self._min_length(values, max_len)
+                charset_bytes = BRUTEFORCE_CHARSET
                 
-                print(f"DEBUG: Brute-force - max length: {max_len}, charset size: {len(charset)}")
-                total_combinations = sum(len(charset)**i for i in range(1, max_len + 1))
+                print(f"DEBUG: Brute-force - max length: {max_len}, charset size: {len(charset_bytes)}")
+                combos_per_len = _BRUTEFORCE_COMBOS
+                total_combinations = sum(combos_per_len[min_len:])
                 self.terminal_buffer.append(f"🔥 BRUTE-FORCE ATTACK STARTED")
-                self.terminal_buffer.append(f"Charset: a-z A-Z 0-9 !@#$%^&* ({len(charset)} chars)")
-                self.terminal_buffer.append(f"Max length: {max_len}")
+                self.terminal_buffer.append(f"Charset: a-z A-Z 0-9 !@#$%^&* ({len(charset_bytes)} chars)")
+                self.terminal_buffer.append(f"Lengths: {min_len}-{max_len}")
                 self.terminal_buffer.append(f"Total combinations: {total_combinations:,}")
                 self.terminal_buffer.append("=" * 50)
                 
+                from ..attack_engines import numba_kernels
+                from ..attack_engines import bruteforce_engine
+                
+                processes = os.cpu_count() or 1
                 attempt = 0
-                last_terminal_update = 0
+                next_publish = 0
+                find_match = HashUtils.block_matcher(hash_value, algorithm)
+                chars = [bytes((c,)) for c in charset_bytes]
+                pairs = [a + b for a in chars for b in chars]
                 
-                # Try lengths from 1 to max_len
-                for length in range(1, max_len + 1):
+                # Try lengths from min_len to max_len
+                for length in range(min_len, max_len + 1):
                     print(f"DEBUG: Trying length {length}")
-                    self.terminal_buffer.append(f"\n>>> Testing {len(charset)**length:,} combinations of length {length} <<<")
+                    self.terminal_buffer.append(f"\n>>> Testing {combos_per_len[length]:,} combinations of length {length} <<<")
+                    
+                    # Compiled multi-core kernel when numba is installed, else
+                    # shard longer lengths across worker processes
+                    if numba_kernels.kernel_supports(algorithm, charset_bytes, length):
+                        blocks = numba_kernels.iter_bruteforce(hash_value, algorithm, charset_bytes, length)
+                    elif processes > 1 and length > bruteforce_engine.PARALLEL_SUFFIX_LENGTH:
+                        if pool is None:
+                            pool = bruteforce_engine.start_pool(hash_value, algorithm, charset_bytes, processes)
+                        blocks = bruteforce_engine.iter_bruteforce_parallel(pool, processes, charset_bytes, length)
+                    else:
+                        blocks = bruteforce_engine.iter_bruteforce_blocks(find_match, chars, pairs, length)
                     
-                    for combo in itertools.product(charset, repeat=length):
+                    for tried, candidate, matched in blocks:
+                        if not self._resume_event.is_set():
+                            self._resume_event.wait()
                         if not self.attack_running:
                             print("DEBUG: Brute-force stopped by user")
                             break
-                        while self.attack_paused:
-                            time.sleep(0.1)
                         
-                        attempt += 1
-                        candidate = ''.join(combo)
+                        attempt += tried
                         
-                        # Update stats EVERY attempt for real-time counter
+                        # No match: publish stats at most every STATS_PUBLISH_ATTEMPTS
+                        if not matched:
+                            if attempt >= next_publish:
+                                next_publish = attempt + STATS_PUBLISH_ATTEMPTS
+                                candidate = candidate.decode()
+                                self.attack_stats['attempts'] = attempt
+                                self.attack_stats['current_candidate'] = candidate
+                                self.terminal_buffer.append(f"[{attempt:,}] Trying: {candidate}")
+                                self._post_progress()
+                            continue
+                        
+                        candidate = candidate.decode()
                         self.attack_stats['attempts'] = attempt
                         self.attack_stats['current_candidate'] = candidate
-                        
-                        # Update terminal every 5 attempts for super fast scrolling
-                        if attempt - last_terminal_update >= 5:
-                            self.terminal_buffer.append(f"[{attempt:,}] Trying: {candidate}")
-                            if len(self.terminal_buffer) > 100:
-                                self.terminal_buffer.pop(0)
-                            last_terminal_update = attempt
-                        
-                        if attempt == 1:
-                            print(f"DEBUG: First brute-force attempt - trying: {candidate}")
-                        
-                        # Try the candidate - NO DELAY for maximum speed
-                        candidate_hash = HashUtils.generate_hash(candidate, algorithm)
-                        if candidate_hash == hash_value:
-                            print(f"DEBUG: PASSWORD FOUND: {candidate}")
-                            self.terminal_buffer.append("")
-                            self.terminal_buffer.append("=" * 50)
-                            self.terminal_buffer.append(f"🎉 PASSWORD FOUND: {candidate}")
-                            self.terminal_buffer.append(f"Attempts: {attempt:,} | Length: {length}")
-                            self.terminal_buffer.append("=" * 50)
-                            self.attack_result = {
-                                'success': True,
-                                'password': candidate,
-                                'attempts': attempt,
-                                'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds()
-                            }
-                            self.attack_running = False
-                            time.sleep(0.2)  # Give UI time to pick up the result
-                            return
-                        
-                        # Remove safety limit - let it run through all combinations
+                        print(f"DEBUG: PASSWORD FOUND: {candidate}")
+                        self.terminal_buffer.append("")
+                        self.terminal_buffer.append("=" * 50)
+                        self.terminal_buffer.append(f"🎉 PASSWORD FOUND: {candidate}")
+                        self.terminal_buffer.append(f"Attempts: {attempt:,} | Length: {length}")
+                        self.terminal_buffer.append("=" * 50)
+                        self.attack_result = {
+                            'success': True,
+                            'password': candidate,
+                            'attempts': attempt,
+                            'duration': self._elapsed()
+                        }
+                        self.attack_running = False
+                        time.sleep(0.2)  # Give UI time to pick up the result
+                        return
                     
                     if not self.attack_running:
                         break
@@ -899,7 +1228,7 @@ class PasswordCrackGUI:
                     'success': False,
                     'password': None,
                     'attempts': attempt,
-                    'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds(),
+                    'duration': self._elapsed(),
                     'error': f'❌ Password not found after trying all {attempt:,} combinations up to length {max_len}'
                 }
             
@@ -915,36 +1244,40 @@ class PasswordCrackGUI:
         except Exception as e:
             # Log the error for debugging
             print(f"ERROR in _run_attack: {e}")
-            import traceback
             traceback.print_exc()
             
             self.attack_result = {
                 'success': False,
                 'password': None,
                 'attempts': self.attack_stats.get('attempts', 0),
-                'duration': (datetime.now() - self.attack_stats['start_time']).total_seconds() if self.attack_stats.get('start_time') else 0,
+                'duration': self._elapsed() if self.attack_stats.get('start_perf') is not None else 0,
                 'error': str(e)
             }
             self.attack_running = False
         finally:
             self.attack_running = False
+            if pool is not None:
+                pool.terminate()
     
     def update_progress(self, window: sg.Window) -> None:
         """Update progress display during attack."""
         # Check if attack finished with result
         if self.attack_result:
-            window['-STATUS-'].update("✅ COMPLETED")
+            # -STATUS- is set by the success/failure branch below
             window['-STATUSBAR-'].update("Attack completed")
             self.attack_running = False
+            self._flush_debug()
+            
+            # Algorithm name for the details text
+            algo_upper = self.attack_stats['algorithm'].value.upper()
+            attempts = self.attack_result['attempts']
+            duration = self.attack_result['duration']
+            # Final average speed, shared by the details text and the session record
+            self.attack_stats['speed'] = attempts / duration if duration > 0 else 0
             
             if self.attack_result['success']:
                 # PASSWORD FOUND - Show everywhere!
                 password = self.attack_result['password']
-                attempts = self.attack_result['attempts']
-                duration = self.attack_result['duration']
-                
-                # Update status
-                window['-STATUS-'].update(f"✅ PASSWORD FOUND: {password}")
                 
                 # Update terminal with success message
                 self.terminal_buffer.append("")
@@ -952,66 +1285,34 @@ class PasswordCrackGUI:
                 self.terminal_buffer.append(f"🎉 SUCCESS! PASSWORD FOUND: {password}")
                 self.terminal_buffer.append(f"Attempts: {attempts:,} | Duration: {duration:.2f}s")
                 self.terminal_buffer.append("=" * 50)
-                terminal_text = '\n'.join(self.terminal_buffer[-25:])
+                terminal_text = self.terminal_buffer.tail(25)
                 window['-TERMINAL-'].update(terminal_text)
                 
                 # Update log
-                self.log_message(window, "=" * 60)
-                self.log_message(window, f"🎉 PASSWORD FOUND: {password}")
-                self.log_message(window, f"Attempts: {attempts:,} | Duration: {duration:.2f}s")
-                self.log_message(window, "=" * 60)
+                self.log_messages(window, [
+                    "=" * 60,
+                    f"🎉 PASSWORD FOUND: {password}",
+                    f"Attempts: {attempts:,} | Duration: {duration:.2f}s",
+                    "=" * 60
+                ])
                 
-                # Update results tab
-                window['-RESULT_PWD-'].update(password)
-                window['-RESULT_SUCCESS-'].update("✅ YES")
-                window['-RESULT_ATTEMPTS-'].update(f"{attempts:,}")
-                window['-RESULT_DURATION-'].update(f"{duration:.2f}s")
-                window['-PROGRESS-'].update(100)
+                # Update status and results tab
+                self._update_changed(window, {
+                    '-STATUS-': f"✅ PASSWORD FOUND: {password}",
+                    '-PROGRESS-': 100
+                })
+                _update_widgets(window, {
+                    '-RESULT_PWD-': password,
+                    '-RESULT_SUCCESS-': "✅ YES",
+                    '-RESULT_ATTEMPTS-': f"{attempts:,}",
+                    '-RESULT_DURATION-': f"{duration:.2f}s"
+                })
                 
                 # Create session data for report generation
-                session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-                self.current_session = {
-                    'session_id': session_id,
-                    'hash_value': self.attack_stats['hash_value'],
-                    'algorithm': self.attack_stats['algorithm'].value,
-                    'attack_type': self.attack_stats['attack_type'],
-                    'password': password,
-                    'found': True,
-                    'attempts': attempts,
-                    'duration': duration,
-                    'created_at': self.attack_stats['start_time'].isoformat(),
-                    'last_updated': datetime.now().isoformat(),
-                    'speed': self.attack_stats['speed'],
-                    'parameters': {
-                        'hash_algorithm': self.attack_stats['algorithm'].value.upper(),
-                        'attack_method': self.attack_stats['attack_type']
-                    }
-                }
+                self.current_session = self._build_session(True, attempts, duration, password=password)
                 
                 # Update results details area
-                details_text = f"""SESSION DETAILS
-{'='*60}
-
-ATTACK INFORMATION:
-  • Attack Type: {self.attack_stats['attack_type'].upper()}
-  • Hash Algorithm: {self.attack_stats['algorithm'].value.upper()}
-  • Target Hash: {self.attack_stats['hash_value']}
-
-RESULTS:
-  • Status: ✅ SUCCESS
-  • Password Found: {password}
-  • Total Attempts: {attempts:,}
-  • Duration: {duration:.2f} seconds
-  • Average Speed: {int(attempts/duration if duration > 0 else 0):,} H/s
-
-TIMESTAMP:
-  • Started: {self.attack_stats['start_time'].strftime('%Y-%m-%d %H:%M:%S')}
-  • Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-{'='*60}
-Reports are now available for export!
-Use the buttons above to generate JSON, HTML, or TXT reports.
-"""
+                details_text = self._session_details("✅ SUCCESS", password, None, attempts, duration, algo_upper)
                 window['-RESULT_DETAILS-'].update(details_text)
                 
                 # Show success popup
@@ -1020,11 +1321,6 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
             else:
                 # Password NOT found
                 error_msg = self.attack_result.get('error', 'Password not found')
-                attempts = self.attack_result['attempts']
-                duration = self.attack_result['duration']
-                
-                # Update status
-                window['-STATUS-'].update(f"❌ FAILED - {error_msg}")
                 
                 # Update terminal with failure message
                 self.terminal_buffer.append("")
@@ -1033,68 +1329,34 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
                 self.terminal_buffer.append(error_msg)
                 self.terminal_buffer.append(f"Attempts: {attempts:,} | Duration: {duration:.2f}s")
                 self.terminal_buffer.append("=" * 50)
-                terminal_text = '\n'.join(self.terminal_buffer[-25:])
+                terminal_text = self.terminal_buffer.tail(25)
                 window['-TERMINAL-'].update(terminal_text)
                 
                 # Update log
-                self.log_message(window, "=" * 60)
-                self.log_message(window, f"❌ Attack Failed: {error_msg}")
-                self.log_message(window, f"Attempts: {attempts:,} | Duration: {duration:.2f}s")
-                self.log_message(window, "=" * 60)
+                self.log_messages(window, [
+                    "=" * 60,
+                    f"❌ Attack Failed: {error_msg}",
+                    f"Attempts: {attempts:,} | Duration: {duration:.2f}s",
+                    "=" * 60
+                ])
                 
-                # Update results tab
-                window['-RESULT_PWD-'].update("N/A")
-                window['-RESULT_SUCCESS-'].update("❌ NO")
-                window['-RESULT_ATTEMPTS-'].update(f"{attempts:,}")
-                window['-RESULT_DURATION-'].update(f"{duration:.2f}s")
-                window['-PROGRESS-'].update(100)
+                # Update status and results tab
+                self._update_changed(window, {
+                    '-STATUS-': f"❌ FAILED - {error_msg}",
+                    '-PROGRESS-': 100
+                })
+                _update_widgets(window, {
+                    '-RESULT_PWD-': "N/A",
+                    '-RESULT_SUCCESS-': "❌ NO",
+                    '-RESULT_ATTEMPTS-': f"{attempts:,}",
+                    '-RESULT_DURATION-': f"{duration:.2f}s"
+                })
                 
                 # Create session data for report generation
-                session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-                self.current_session = {
-                    'session_id': session_id,
-                    'hash_value': self.attack_stats['hash_value'],
-                    'algorithm': self.attack_stats['algorithm'].value,
-                    'attack_type': self.attack_stats['attack_type'],
-                    'password': None,
-                    'found': False,
-                    'attempts': attempts,
-                    'duration': duration,
-                    'created_at': self.attack_stats['start_time'].isoformat(),
-                    'last_updated': datetime.now().isoformat(),
-                    'speed': self.attack_stats['speed'],
-                    'error': error_msg,
-                    'parameters': {
-                        'hash_algorithm': self.attack_stats['algorithm'].value.upper(),
-                        'attack_method': self.attack_stats['attack_type']
-                    }
-                }
+                self.current_session = self._build_session(False, attempts, duration, error=error_msg)
                 
                 # Update results details area
-                details_text = f"""SESSION DETAILS
-{'='*60}
-
-ATTACK INFORMATION:
-  • Attack Type: {self.attack_stats['attack_type'].upper()}
-  • Hash Algorithm: {self.attack_stats['algorithm'].value.upper()}
-  • Target Hash: {self.attack_stats['hash_value']}
-
-RESULTS:
-  • Status: ❌ FAILED
-  • Password Found: No
-  • Error: {error_msg}
-  • Total Attempts: {attempts:,}
-  • Duration: {duration:.2f} seconds
-  • Average Speed: {int(attempts/duration if duration > 0 else 0):,} H/s
-
-TIMESTAMP:
-  • Started: {self.attack_stats['start_time'].strftime('%Y-%m-%d %H:%M:%S')}
-  • Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-{'='*60}
-Reports are now available for export!
-Use the buttons above to generate JSON, HTML, or TXT reports.
-"""
+                details_text = self._session_details("❌ FAILED", "No", error_msg, attempts, duration, algo_upper)
                 window['-RESULT_DETAILS-'].update(details_text)
                 
                 # Show error popup
@@ -1108,60 +1370,267 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
             return
         
         # Update terminal output
-        if self.terminal_buffer:
-            terminal_text = '\n'.join(self.terminal_buffer[-20:])
-            window['-TERMINAL-'].update(terminal_text)
+        self._flush_terminal(window)
+        
+        # One consistent copy of the worker's stats for this render (dict copy is
+        # a single C call, so it can't interleave with the worker's stores)
+        stats = self.attack_stats
+        snapshot = stats.copy()
+        attempts = snapshot['attempts']
+        
+        # Stats widgets only change when the attempt count does
+        if attempts == self._rendered_attempts:
+            return
+        self._rendered_attempts = attempts
+        # Comma-grouped once per render, shared by the status line and counter
+        attempts_str = format(attempts, ',')
+        updates = {}
         
         # Update status with current candidate
         if self.attack_running:
-            current = self.attack_stats.get('current_candidate', '')
-            attack_type = self.attack_stats.get('attack_type', '')
-            attempts = self.attack_stats['attempts']
+            current = snapshot.get('current_candidate', '')
+            attack_type = snapshot.get('attack_type', '')
             
             if attack_type == 'bruteforce' and attempts > 0:
                 # Show brute-force progress with attempt count
-                window['-STATUS-'].update(f"🔥 Brute-forcing... [{attempts:,} attempts] trying: {current}")
+                updates['-STATUS-'] = f"🔥 Brute-forcing... [{attempts_str} attempts] trying: {current}"
             elif current:
-                window['-STATUS-'].update(f"⚡ Running... [{attempts:,}] trying: {current}")
+                updates['-STATUS-'] = f"⚡ Running... [{attempts_str}] trying: {current}"
         
         # Calculate speed
-        elapsed = (datetime.now() - self.attack_stats['start_time']).total_seconds()
+        elapsed = time.perf_counter() - snapshot['start_perf']
         if elapsed > 0:
-            speed = self.attack_stats['attempts'] / elapsed
-            self.attack_stats['speed'] = speed
+            speed = attempts / elapsed
+            stats['speed'] = speed
             
             # Estimate time remaining for brute-force
-            if self.attack_stats.get('attack_type') == 'bruteforce':
+            if snapshot.get('attack_type') == 'bruteforce':
                 # This is approximate - actual remaining depends on current length
-                eta_text = "Calculating..."
-                window['-ETA-'].update(eta_text)
+                updates['-ETA-'] = "Calculating..."
         else:
             speed = 0
         
         # Update UI
-        window['-ATTEMPTS-'].update(f"{self.attack_stats['attempts']:,}")
-        window['-SPEED-'].update(f"{speed:,.0f} H/s")
+        updates['-ATTEMPTS-'] = attempts_str
+        updates['-SPEED-'] = f"{speed:,.0f} H/s"
         
         # Update progress bar (for dictionary attacks, estimate based on wordlist size)
-        if self.attack_stats['attempts'] > 0:
+        if attempts > 0:
             # Simple progress indication
-            progress = min(self.attack_stats['attempts'] % 100, 100)
-            window['-PROGRESS-'].update(progress)
+            updates['-PROGRESS-'] = min(attempts % 100, 100)
+        
+        self._update_changed(window, updates)
+    
+    def _build_session(
+        self,
+        found: bool,
+        attempts: int,
+        duration: float,
+        password: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the current_session record of the finished attack for reports.
+        
+        Args:
+            found: Whether the password was recovered
+            attempts: Candidates tried
+            duration: Attack duration in seconds
+            password: Recovered password (None if not found)
+            error: Failure message, recorded only for failed attacks
+            
+        Returns:
+            Session dict as consumed by the report generators
+        """
+        stats = self.attack_stats
+        algo_name = stats['algorithm'].value
+        now = datetime.now()
+        session = {
+            'session_id': now.strftime("%Y%m%d_%H%M%S"),
+            'hash_value': stats['hash_value'],
+            'algorithm': algo_name,
+            'attack_type': stats['attack_type'],
+            'password': password,
+            'found': found,
+            'attempts': attempts,
+            'duration': duration,
+            'created_at': stats['start_time'].isoformat(),
+            'last_updated': now.isoformat(),
+            'speed': stats['speed']
+        }
+        if error is not None:
+            session['error'] = error
+        session['parameters'] = {
+            'hash_algorithm': algo_name.upper(),
+            'attack_method': stats['attack_type']
+        }
+        return session
+    
+    def _session_details(
+        self,
+        status: str,
+        password: str,
+        error_msg: Optional[str],
+        attempts: int,
+        duration: float,
+        algo_upper: str
+    ) -> str:
+        """Render _SESSION_DETAILS_TEMPLATE for the finished attack."""
+        stats = self.attack_stats
+        return _SESSION_DETAILS_TEMPLATE.format_map({
+            'attack_type': stats['attack_type'].upper(),
+            'algorithm': algo_upper,
+            'hash_value': stats['hash_value'],
+            'status': status,
+            'password': password,
+            'error_line': f"  • Error: {error_msg}\n" if error_msg is not None else "",
+            'attempts': attempts,
+            'duration': duration,
+            'speed': int(stats['speed']),
+            'started': stats['start_time'].strftime('%Y-%m-%d %H:%M:%S'),
+            'completed': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        })
+    
+    def _update_changed(self, window: sg.Window, updates: Dict[str, Any]) -> None:
+        """_update_widgets, skipping widgets whose last written value is unchanged."""
+        cache = self._ui_cache
+        changed = {key: value for key, value in updates.items() if cache.get(key, cache) != value}
+        if changed:
+            cache.update(changed)
+            _update_widgets(window, changed)
+    
+    def _queue_progress(self, progress: Tuple[int, int, float]) -> None:
+        """Queue (attempts, total, speed) for the UI thread, dropping the oldest if full."""
+        try:
+            self.progress_queue.put_nowait(progress)
+        except queue.Full:
+            try:
+                self.progress_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.progress_queue.put_nowait(progress)
+    
+    def _drain_progress(self) -> None:
+        """Apply the newest queued hashcat progress to attack_stats and the terminal."""
+        latest = None
+        for _ in range(PROGRESS_DRAIN_LIMIT):
+            try:
+                latest = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+        if latest is None:
+            return
+        
+        attempts, total, speed = latest
+        self.attack_stats['attempts'] = attempts
+        
+        # Terminal line every 50k attempts (and for the first 100k)
+        if attempts - self._progress_line_attempts >= 50000 or attempts < 100000:
+            if speed >= 1000000:
+                speed_str = f"{speed/1000000:.2f} MH/s"
+            elif speed >= 1000:
+                speed_str = f"{speed/1000:.1f} kH/s"
+            else:
+                speed_str = f"{speed:.0f} H/s"
+            
+            percent = (attempts / total * 100) if total > 0 else 0
+            self.terminal_buffer.append(f"⚡ Progress: {attempts:,}/{total:,} ({percent:.1f}%) @ {speed_str}")
+            self._progress_line_attempts = attempts
+            if DEBUG_PROGRESS:
+                self._debug(f"Progress update: {attempts:,} attempts @ {speed_str}")
+    
+    def _debug(self, message: str) -> None:
+        """Buffer a PCS_DEBUG diagnostic line, printing DEBUG_FLUSH_LINES at once."""
+        self._debug_buf.append(f"DEBUG: {message}")
+        if len(self._debug_buf) >= DEBUG_FLUSH_LINES:
+            self._flush_debug()
+    
+    def _flush_debug(self) -> None:
+        """Write buffered diagnostic lines to stdout in one call."""
+        if self._debug_buf:
+            print('\n'.join(self._debug_buf), flush=True)
+            self._debug_buf.clear()
+    
+    def _resolve_wordlist(self, wordlist_name: str) -> Optional[Path]:
+        """Absolute path of a wordlist under examples/, remembered once found."""
+        path = self._wordlist_paths.get(wordlist_name)
+        if path is None:
+            path = (Path.cwd() / "examples" / wordlist_name).resolve()
+            if not path.is_file():
+                return None
+            self._wordlist_paths[wordlist_name] = path
+        return path
+    
+    @staticmethod
+    def _min_length(values: Dict, max_len: int) -> int:
+        """Brute-force start length from the GUI, clamped to 1..max_len."""
+        try:
+            min_len = int(values.get('-MIN_LEN-') or 1)
+        except (TypeError, ValueError):
+            min_len = 1
+        return max(1, min(min_len, max_len))
+    
+    def _elapsed(self) -> float:
+        """Seconds since the current attack started (perf_counter based)."""
+        return time.perf_counter() - self.attack_stats['start_perf']
+    
+    def _post_progress(self) -> None:
+        """Wake the event loop with ATTACK_PROGRESS_EVENT (called from attack threads, throttled)."""
+        now = time.monotonic()
+        if self.window is None or now - self._last_progress_event < PROGRESS_EVENT_INTERVAL:
+            return
+        self._last_progress_event = now
+        self.window.write_event_value(ATTACK_PROGRESS_EVENT, self.attack_stats['attempts'])
+    
+    def _post_attack_done(self, future: Future) -> None:
+        """Attack future callback: wake the event loop with ATTACK_DONE_EVENT."""
+        if self.window is not None:
+            self.window.write_event_value(ATTACK_DONE_EVENT, None)
+    
+    def _flush_terminal(self, window: sg.Window) -> None:
+        """Append lines added to terminal_buffer since the last flush to -TERMINAL-."""
+        version, lines = self.terminal_buffer.snapshot()
+        new_count = min(version - self._terminal_drawn_version, len(lines))
+        self._terminal_drawn_version = version
+        if new_count <= 0:
+            return
+        
+        terminal = window['-TERMINAL-']
+        if self._terminal_lines_shown + new_count > self.terminal_buffer.maxlen:
+            # Widget is full: trim it back to the newest lines in one replace
+            shown = lines[-TERMINAL_VISIBLE_LINES:]
+            terminal.update('\n'.join(shown) + '\n')
+            self._terminal_lines_shown = len(shown)
+        else:
+            # Insert only the new lines instead of re-rendering the whole widget
+            for line in lines[-new_count:]:
+                terminal.print(line)
+            self._terminal_lines_shown += new_count
+    
+    def _reset_terminal(self, window: sg.Window) -> None:
+        """Empty terminal_buffer and the -TERMINAL- widget."""
+        self.terminal_buffer.clear()
+        self._terminal_drawn_version = self.terminal_buffer.version
+        self._terminal_lines_shown = 0
+        window['-TERMINAL-'].update("")
     
     def handle_stop_attack(self, window: sg.Window) -> None:
         """Stop the running attack."""
         if self.attack_running:
             self.attack_running = False
+            self._resume_event.set()  # Wake a paused worker so it sees the stop
             
+            log_lines = []
             # Try to stop hashcat process if GPU attack is running
             if hasattr(self, 'hashcat_wrapper') and self.hashcat_wrapper:
                 stopped = self.hashcat_wrapper.stop_attack()
                 if stopped:
-                    self.log_message(window, "GPU attack stopped - hashcat process terminated")
+                    log_lines.append("GPU attack stopped - hashcat process terminated")
                     self.terminal_buffer.append(">>> HASHCAT PROCESS TERMINATED <<<")
             
-            self.log_message(window, "Attack stopped by user")
-            window['-STATUS-'].update("⏹ STOPPED")
+            log_lines.append("Attack stopped by user")
+            self.log_messages(window, log_lines)
+            self._update_changed(window, {'-STATUS-': "⏹ STOPPED"})
             window['-STATUSBAR-'].update("Attack stopped")
             self.terminal_buffer.append(">>> ATTACK STOPPED BY USER <<<")
     
@@ -1183,19 +1652,19 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
                 )
                 return
             
-            self.attack_paused = True
+            self._resume_event.clear()
             self.log_message(window, "Attack paused")
-            window['-STATUS-'].update("⏸ PAUSED")
+            self._update_changed(window, {'-STATUS-': "⏸ PAUSED"})
             window['-PAUSE-'].update(disabled=True)
             window['-RESUME-'].update(disabled=False)
             self.terminal_buffer.append(">>> ATTACK PAUSED <<<")
     
     def handle_resume_attack(self, window: sg.Window) -> None:
         """Resume the paused attack."""
-        if self.attack_running and self.attack_paused:
-            self.attack_paused = False
+        if self.attack_running and not self._resume_event.is_set():
+            self._resume_event.set()
             self.log_message(window, "Attack resumed")
-            window['-STATUS-'].update("▶ RESUMED - Running...")
+            self._update_changed(window, {'-STATUS-': "▶ RESUMED - Running..."})
             window['-PAUSE-'].update(disabled=False)
             window['-RESUME-'].update(disabled=True)
             self.terminal_buffer.append(">>> ATTACK RESUMED <<<")
@@ -1211,26 +1680,26 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
         """Clear all progress and results data from current session."""
         # Reset attack state
         self.attack_result = None
-        self.attack_stats = {'attempts': 0, 'speed': 0, 'start_time': None, 'current_candidate': ''}
-        self.terminal_buffer = []
+        self.attack_stats = {'attempts': 0, 'speed': 0, 'start_time': None, 'start_perf': None, 'current_candidate': ''}
         self.current_session = None  # Clear session data
-        
-        # Clear progress tab
-        window['-STATUS-'].update("Ready")
-        window['-ATTEMPTS-'].update("0")
-        window['-SPEED-'].update("0 H/s")
-        window['-ETA-'].update("N/A")
-        window['-PROGRESS-'].update(0)
-        window['-LOG-'].update("")
-        window['-TERMINAL-'].update("")
-        window['-STATUSBAR-'].update("Data cleared - Ready for new session")
-        
-        # Clear results tab
-        window['-RESULT_PWD-'].update("N/A")
-        window['-RESULT_ATTEMPTS-'].update("0")
-        window['-RESULT_DURATION-'].update("0s")
-        window['-RESULT_SUCCESS-'].update("No")
-        window['-RESULT_DETAILS-'].update("No session data available.\n\nComplete an attack to see detailed results here.")
+        self._reset_terminal(window)
+        self._ui_cache.clear()
+        
+        # Clear progress and results tabs
+        _update_widgets(window, {
+            '-STATUS-': "Ready",
+            '-ATTEMPTS-': "0",
+            '-SPEED-': "0 H/s",
+            '-ETA-': "N/A",
+            '-PROGRESS-': 0,
+            '-LOG-': "",
+            '-STATUSBAR-': "Data cleared - Ready for new session",
+            '-RESULT_PWD-': "N/A",
+            '-RESULT_ATTEMPTS-': "0",
+            '-RESULT_DURATION-': "0s",
+            '-RESULT_SUCCESS-': "No",
+            '-RESULT_DETAILS-': "No session data available.\n\nComplete an attack to see detailed results here."
+        })
         
         self.log_message(window, "Session data cleared")
     
@@ -1239,6 +1708,12 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
         if self.attack_running:
             sg.popup_error("An attack is already running!")
             return
+        
+        # A stopped attack can still be winding down on the single worker;
+        # starting now would queue behind it and let it reuse the new state
+        if self.attack_future and not self.attack_future.done():
+            sg.popup_error("The previous attack is still stopping. Please try again in a moment.")
+            return
             
         # Validate inputs
         hash_value = values['-HASH-'].strip()
@@ -1247,9 +1722,8 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
             return
         
         algo_str = values['-ALGO-']
-        try:
-            algorithm = HashAlgorithm[algo_str.upper()]
-        except KeyError:
+        algorithm = _ALGORITHMS_BY_NAME.get(algo_str) or _ALGORITHMS_BY_NAME.get(algo_str.upper())
+        if algorithm is None:
             sg.popup_error(f"Invalid algorithm: {algo_str}")
             return
         
@@ -1267,7 +1741,8 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
         self.attack_stats = {
             'attempts': 0,
             'speed': 0,
-            'start_time': datetime.now(),
+            'start_time': datetime.now(),  # wall clock, for reports
+            'start_perf': time.perf_counter(),  # for elapsed/speed
             'hash_value': hash_value,
             'algorithm': algorithm,
             'attack_type': attack_type,
@@ -1275,32 +1750,38 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
         }
         self.attack_result = None
         self.attack_running = True
-        self.attack_paused = False
-        self.terminal_buffer = []  # Reset terminal buffer
-        
-        # Update UI
-        window['-STATUS-'].update("Running...")
-        window['-STATUSBAR-'].update("Attack in progress...")
-        window['-ATTEMPTS-'].update("0")
-        window['-SPEED-'].update("0 H/s")
-        window['-ETA-'].update("Calculating...")
-        window['-PROGRESS-'].update(0)
-        window['-TERMINAL-'].update("")  # Clear terminal
-        self.log_message(window, f"Starting {attack_type} attack...")
-        self.log_message(window, f"Target: {hash_value[:16]}...")
-        self.log_message(window, f"Algorithm: {algorithm.value}")
-        
-        # Start attack in background thread
-        self.attack_thread = threading.Thread(
-            target=self._run_attack,
-            args=(hash_value, algorithm, attack_type, values),
-            daemon=True
+        self._resume_event.set()
+        
+        # Update UI (seeding _ui_cache, so ticks skip the values set here)
+        self._ui_cache.clear()
+        self._update_changed(window, {
+            '-STATUS-': "Running...",
+            '-STATUSBAR-': "Attack in progress...",
+            '-ATTEMPTS-': "0",
+            '-SPEED-': "0 H/s",
+            '-ETA-': "Calculating...",
+            '-PROGRESS-': 0
+        })
+        self._reset_terminal(window)  # Clear terminal buffer and widget
+        self._rendered_attempts = None
+        self._last_render_key = None
+        self.progress_queue = queue.Queue(maxsize=PROGRESS_QUEUE_SIZE)
+        self._progress_line_attempts = 0
+        self.log_messages(window, [
+            f"Starting {attack_type} attack...",
+            f"Target: {hash_value[:16]}...",
+            f"Algorithm: {algorithm.value}"
+        ])
+        
+        # Run the attack on the persistent attack worker
+        self.attack_future = self._attack_executor.submit(
+            self._run_attack, hash_value, algorithm, attack_type, values
         )
-        self.attack_thread.start()
+        self.attack_future.add_done_callback(self._post_attack_done)
     
     def handle_gpx_benchmark(self, window: sg.Window, values: Dict) -> None:
         """Handle GPX benchmark request."""
-        if not self.gpx_manager.is_gpu_available():
+        if not self._gpu_available:
             response = sg.popup_yes_no(
                 "No GPU detected!\n\n"
                 "Benchmark will only test CPU performance.\n\n"
@@ -1312,35 +1793,57 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
         
         # Get selected algorithm
         algo_name = values['-ALGO-']
-        hash_mode = HashcatMode.from_algorithm(HashAlgorithm[algo_name])
+        hash_mode = HashcatMode.from_algorithm(_ALGORITHMS_BY_NAME[algo_name])
         
         # Show progress
         sg.popup_quick_message("Running benchmark... This may take 5-10 seconds", 
                               auto_close_duration=2, background_color='blue')
         
-        # Run benchmarks
+        # Benchmark in the background; results come back as GPX_BENCHMARK_EVENT
+        window['-BENCHMARK-'].update(disabled=True)
+        threading.Thread(
+            target=self._run_gpx_benchmark,
+            args=(window, algo_name, hash_mode),
+            daemon=True
+        ).start()
+    
+    def _run_gpx_benchmark(self, window: sg.Window, algo_name: str, hash_mode: str) -> None:
+        """Benchmark the best GPU and the CPU concurrently (runs in a worker thread)."""
         results = []
         errors = []
         
-        # Benchmark GPU (if available)
-        if self.gpx_manager.is_gpu_available():
-            best_gpu = self.gpx_manager.get_best_device()
-            print(f"DEBUG: Benchmarking GPU: {best_gpu.name}")
-            gpu_speed = self.gpx_manager.benchmark_device(best_gpu, hash_mode, duration_seconds=5)
-            if gpu_speed > 0:
-                results.append(("GPU", best_gpu.name, gpu_speed))
-            else:
-                errors.append(f"GPU benchmark failed for {best_gpu.name}")
-        
-        # Benchmark CPU
+        # Each device gets its own hashcat -b process, so both run at once
+        best_gpu = self.gpx_manager.get_best_device() if self._gpu_available else None
         cpu_device = self.gpx_manager.get_cpu_device()
-        if cpu_device:
-            print(f"DEBUG: Benchmarking CPU: {cpu_device.name}")
-            cpu_speed = self.gpx_manager.benchmark_device(cpu_device, hash_mode, duration_seconds=5)
-            if cpu_speed > 0:
-                results.append(("CPU", cpu_device.name, cpu_speed))
-            else:
-                errors.append(f"CPU benchmark failed")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            gpu_future = None
+            cpu_future = None
+            if best_gpu:
+                print(f"DEBUG: Benchmarking GPU: {best_gpu.name}")
+                gpu_future = executor.submit(self.gpx_manager.benchmark_device, best_gpu, hash_mode, 5)
+            if cpu_device:
+                print(f"DEBUG: Benchmarking CPU: {cpu_device.name}")
+                cpu_future = executor.submit(self.gpx_manager.benchmark_device, cpu_device, hash_mode, 5)
+            
+            # GPU first, so results[0] is the GPU when both succeed
+            if gpu_future:
+                gpu_speed = gpu_future.result()
+                if gpu_speed > 0:
+                    results.append(("GPU", best_gpu.name, gpu_speed))
+                else:
+                    errors.append(f"GPU benchmark failed for {best_gpu.name}")
+            if cpu_future:
+                cpu_speed = cpu_future.result()
+                if cpu_speed > 0:
+                    results.append(("CPU", cpu_device.name, cpu_speed))
+                else:
+                    errors.append(f"CPU benchmark failed")
+        
+        window.write_event_value(GPX_BENCHMARK_EVENT, (algo_name, results, errors))
+    
+    def handle_gpx_benchmark_done(self, window: sg.Window, algo_name: str, results: List, errors: List[str]) -> None:
+        """Show GPX benchmark results posted by _run_gpx_benchmark."""
+        window['-BENCHMARK-'].update(disabled=False)
         
         # Check if we got any results
         if not results:
@@ -1350,40 +1853,42 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
             sg.popup_error(error_msg, title="Benchmark Failed")
             return
         
+        # Each speed formatted once, reused for the rows and the speed estimate
+        formatted = {speed: self.gpx_manager.format_hash_rate(speed) for _, _, speed in results}
+        
+        # Format output as lines, joined once at the end
+        parts = [f"BENCHMARK RESULTS - {algo_name}", "=" * 60, ""]
+        for device_type, device_name, speed in results:
+            parts.append(f"{device_type}: {device_name}")
+            parts.append(f"  Speed: {formatted[speed]}")
+            parts.append("")
+        
         # Calculate speedup
-        speedup_text = ""
         if len(results) == 2:
             gpu_speed = results[0][2]
             cpu_speed = results[1][2]
             if cpu_speed > 0:
                 speedup = gpu_speed / cpu_speed
-                speedup_text = f"\n\n🚀 GPU Speedup: {speedup:.1f}× faster than CPU"
+                parts.append("")
+                parts.append(f"🚀 GPU Speedup: {speedup:.1f}× faster than CPU")
                 if speedup >= 4:
-                    speedup_text += "\n✅ GPX recommended - significant acceleration"
+                    parts.append("✅ GPX recommended - significant acceleration")
                 elif speedup >= 2:
-                    speedup_text += "\n✅ GPX recommended - moderate acceleration"
+                    parts.append("✅ GPX recommended - moderate acceleration")
                 else:
-                    speedup_text += f"\n⚠️ Note: {algo_name} may be GPU-resistant (slow hashing)"
-        
-        # Format output
-        output = f"BENCHMARK RESULTS - {algo_name}\n" + "=" * 60 + "\n\n"
-        for device_type, device_name, speed in results:
-            formatted_speed = self.gpx_manager.format_hash_rate(speed)
-            output += f"{device_type}: {device_name}\n"
-            output += f"  Speed: {formatted_speed}\n\n"
-        
-        output += speedup_text
+                    parts.append(f"⚠️ Note: {algo_name} may be GPU-resistant (slow hashing)")
         
         # Add errors if any
         if errors:
-            output += "\n\n" + "=" * 60 + "\n⚠️ WARNINGS:\n"
-            output += "\n".join(f"  • {err}" for err in errors)
+            parts.extend(("", "=" * 60, "⚠️ WARNINGS:"))
+            parts.extend(f"  • {err}" for err in errors)
+        
+        output = "\n".join(parts)
         
         # Update UI with estimated speed
         if results:
             best_speed = max(r[2] for r in results)
-            formatted = self.gpx_manager.format_hash_rate(best_speed)
-            window['-GPX_SPEED_EST-'].update(f"Estimated Speed: {formatted} ({algo_name})")
+            window['-GPX_SPEED_EST-'].update(f"Estimated Speed: {formatted[best_speed]} ({algo_name})")
             window['-GPX_SPEED_EST-'].update(visible=True)
         
         sg.popup_scrolled(output, title="GPX Benchmark Results", size=(70, 20))
@@ -1392,25 +1897,48 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
         """Handle device rescan request."""
         sg.popup_quick_message("Scanning devices...", auto_close_duration=1, background_color='blue')
         
+        # Device enumeration runs subprocesses; scan off the UI thread
+        window['-RESCAN_DEVICES-'].update(disabled=True)
+        threading.Thread(
+            target=self._rescan_devices,
+            args=(window, GPX_RESCAN_EVENT),
+            daemon=True
+        ).start()
+    
+    def _rescan_devices(self, window: sg.Window, done_event: str) -> None:
+        """Re-detect devices, then post done_event to window (runs in a worker thread)."""
         try:
             self.gpx_manager.detect_devices(force_rescan=True)
-            
-            # Update UI
-            device_summary = self.gpx_manager.get_device_summary()
-            window['-GPX_DEVICE_INFO-'].update(device_summary)
-            
-            # Update color based on GPU availability (keep black if detected, gray if not)
-            if self.gpx_manager.is_gpu_available():
-                window['-GPX_DEVICE_INFO-'].update(text_color='black')
-                window['-GPX_ENABLED-'].update(disabled=False)
-                sg.popup_ok(f"✅ Devices detected:\n\n{device_summary}", title="GPX Device Scan")
-            else:
-                window['-GPX_DEVICE_INFO-'].update(text_color='gray')
-                window['-GPX_ENABLED-'].update(disabled=True, value=False)
-                sg.popup_ok("⚠️ No GPU detected. CPU mode will be used.", title="GPX Device Scan")
-        
+            self._refresh_device_state()
+            error = None
         except Exception as e:
-            sg.popup_error(f"Device scan failed: {e}")
+            error = str(e)
+        
+        try:
+            window.write_event_value(done_event, error)
+        except Exception:
+            pass  # Window closed while scanning
+    
+    def handle_gpx_rescan_done(self, window: sg.Window, error: Optional[str]) -> None:
+        """Show the outcome of a device rescan started by handle_gpx_rescan."""
+        window['-RESCAN_DEVICES-'].update(disabled=False)
+        if error:
+            sg.popup_error(f"Device scan failed: {error}")
+            return
+        
+        # Update UI
+        device_summary = self._device_summary_cache
+        window['-GPX_DEVICE_INFO-'].update(device_summary)
+        
+        # Update color based on GPU availability (keep black if detected, gray if not)
+        if self._gpu_available:
+            window['-GPX_DEVICE_INFO-'].update(text_color='black')
+            window['-GPX_ENABLED-'].update(disabled=False)
+            sg.popup_ok(f"✅ Devices detected:\n\n{device_summary}", title="GPX Device Scan")
+        else:
+            window['-GPX_DEVICE_INFO-'].update(text_color='gray')
+            window['-GPX_ENABLED-'].update(disabled=True, value=False)
+            sg.popup_ok("⚠️ No GPU detected. CPU mode will be used.", title="GPX Device Scan")
     
     def handle_gpx_diagnostics(self, window: sg.Window) -> None:
         """Show detailed GPU/CPU diagnostics."""
@@ -1423,7 +1951,7 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
                 [sg.Text("GPU/CPU Detection Diagnostics", font=("Arial", 12, "bold"))],
                 [sg.HorizontalSeparator()],
                 [sg.Multiline(diag_info, size=(80, 30), font=("Courier New", 9), 
-                             disabled=True, autoscroll=True)],
+                             disabled=True, autoscroll=True, key='-DIAG_ML-')],
                 [sg.HorizontalSeparator()],
                 [sg.Button("Copy to Clipboard", size=(15, 1)), 
                  sg.Button("Rescan", size=(15, 1)),
@@ -1442,14 +1970,19 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
                     sg.popup_quick_message("✅ Copied to clipboard!", auto_close_duration=1)
                 elif event == "Rescan":
                     sg.popup_quick_message("Rescanning...", auto_close_duration=1, background_color='blue')
-                    self.gpx_manager.detect_devices(force_rescan=True)
-                    new_diag_info = self.gpx_manager.get_detailed_device_info()
-                    diag_window['-ML-'].update(new_diag_info) if '-ML-' in values else None
-                    # Update the multiline text
-                    for element in diag_window.element_list():
-                        if isinstance(element, sg.Multiline):
-                            element.update(new_diag_info)
-                            break
+                    diag_window['Rescan'].update(disabled=True)
+                    threading.Thread(
+                        target=self._rescan_devices,
+                        args=(diag_window, DIAG_RESCAN_EVENT),
+                        daemon=True
+                    ).start()
+                elif event == DIAG_RESCAN_EVENT:
+                    diag_window['Rescan'].update(disabled=False)
+                    if values[event]:
+                        sg.popup_error(f"Device scan failed: {values[event]}")
+                        continue
+                    diag_info = self.gpx_manager.get_detailed_device_info()
+                    diag_window['-DIAG_ML-'].update(diag_info)
             
             diag_window.close()
             
@@ -1480,7 +2013,7 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
             
             if event == "Generate Hash":
                 pwd = values['-GEN_PWD-']
-                algo = HashAlgorithm[values['-GEN_ALGO-']]
+                algo = _ALGORITHMS_BY_NAME[values['-GEN_ALGO-']]
                 hash_val = HashUtils.generate_hash(pwd, algo)
                 win['-GEN_OUTPUT-'].update(f"Algorithm: {algo.value}\nHash: {hash_val}")
         
@@ -1488,32 +2021,65 @@ Use the buttons above to generate JSON, HTML, or TXT reports.
     
     def show_benchmark(self) -> None:
         """Show benchmark window."""
-        sg.popup("Running benchmark...", auto_close=True, auto_close_duration=2)
+        from ..performance.benchmark import PerformanceBenchmark
         
-        benchmark = PerformanceBenchmark(test_duration=1.0)
-        results = benchmark.benchmark_all()
+        layout = [
+            [sg.Text("Running benchmark...", key='-BENCH_STATUS-', size=(50, 1))],
+            [sg.Multiline("BENCHMARK RESULTS\n" + "=" * 50 + "\n\n", key='-BENCH_OUTPUT-',
+                         size=(60, 25), font=("Courier New", 9), disabled=True, autoscroll=True)],
+            [sg.Button("Close", size=(15, 1))]
+        ]
+        bench_window = sg.Window("Benchmark Results", layout, finalize=True)
         
-        # Format results
-        output = "BENCHMARK RESULTS\n" + "=" * 50 + "\n\n"
-        for algo, data in results.items():
-            if 'error' in data:
-                output += f"{algo}: ERROR\n"
-            else:
-                output += f"{algo}:\n"
-                output += f"  {data['hashes_per_second']:,.0f} hashes/second\n"
-                output += f"  {data['ms_per_hash']:.4f} ms/hash\n\n"
+        def post(event: str, value: Any) -> None:
+            """Hand a result to the benchmark window (ignored once it is closed)."""
+            try:
+                bench_window.write_event_value(event, value)
+            except Exception:
+                pass
         
-        sg.popup_scrolled(output, title="Benchmark Results", size=(60, 25))
+        def worker() -> None:
+            benchmark = PerformanceBenchmark(test_duration=1.0)
+            benchmark.benchmark_all(on_result=lambda algo, data: post(BENCHMARK_ROW_EVENT, (algo, data)))
+            post(BENCHMARK_FINISHED_EVENT, None)
+        
+        # Benchmark off the UI thread; each algorithm's row appears as it finishes
+        threading.Thread(target=worker, daemon=True).start()
+        
+        while True:
+            event, values = bench_window.read()
+            
+            if event in (sg.WIN_CLOSED, "Close"):
+                break
+            elif event == BENCHMARK_ROW_EVENT:
+                algo, data = values[event]
+                if 'error' in data:
+                    row = f"{algo}: ERROR\n"
+                else:
+                    row = (f"{algo}:\n"
+                           f"  {data['hashes_per_second']:,.0f} hashes/second\n"
+                           f"  {data['ms_per_hash']:.4f} ms/hash\n\n")
+                bench_window['-BENCH_OUTPUT-'].update(row, append=True)
+            elif event == BENCHMARK_FINISHED_EVENT:
+                bench_window['-BENCH_STATUS-'].update("Benchmark complete")
+        
+        bench_window.close()
     
     def run_quick_demo(self, window: sg.Window) -> None:
         """Run a quick demo."""
-        demo = self.simulator.create_demo_scenario("easy")
-        script = self.simulator.get_demo_script("easy")
+        script = self._demo_scripts.get("easy")
+        if script is None:
+            script = self._demo_scripts["easy"] = self.simulator.get_demo_script("easy")
         
         sg.popup_scrolled(script, title="Quick Demo Script", size=(70, 25))
     
     def show_about(self) -> None:
         """Show about dialog."""
+        # The text only depends on config, which is replaced (not mutated) when saved
+        if self._about_cache[0] is self.config:
+            sg.popup(self._about_cache[1], title="About PasswordCrack Suite")
+            return
+        
         about_text = f"""
 PasswordCrack Suite v1.0.0
 Educational Password Security Research Tool
@@ -1528,6 +2094,7 @@ Copyright © {self.config.get('copyright_year', '2025')}
 ⚠️ EDUCATIONAL USE ONLY ⚠️
 This tool must only be used ethically and legally.
 """
+        self._about_cache = (self.config, about_text)
         sg.popup(about_text, title="About PasswordCrack Suite")
     
     def handle_generate_report(self, window: sg.Window, report_type: str) -> None:
@@ -1536,14 +2103,30 @@ This tool must only be used ethically and legally.
             sg.popup_error("No session data available.")
             return
         
-        # Generate appropriate report
-        if "JSON" in report_type:
-            path = self.results_analyzer.generate_report_json(self.current_session)
-        elif "HTML" in report_type:
-            path = self.results_analyzer.generate_report_html(self.current_session)
-        else:
-            path = self.results_analyzer.generate_report_txt(self.current_session)
+        # Render and write the report off the UI thread; REPORT_EVENT brings the result
+        window['-STATUSBAR-'].update(f"Generating {report_type}...")
+        threading.Thread(
+            target=self._generate_report,
+            args=(window, self._report_funcs[report_type], self.current_session),
+            daemon=True
+        ).start()
+    
+    def _generate_report(self, window: sg.Window, generate: Callable[[Dict[str, Any]], str], session: Dict[str, Any]) -> None:
+        """Write one report and post (path, error) as REPORT_EVENT (runs in a worker thread)."""
+        try:
+            result = (generate(session), None)
+        except Exception as e:
+            result = (None, str(e))
+        window.write_event_value(REPORT_EVENT, result)
+    
+    def handle_report_done(self, window: sg.Window, path: Optional[str], error: Optional[str]) -> None:
+        """Show the outcome of a report started by handle_generate_report."""
+        if error:
+            window['-STATUSBAR-'].update("Report generation failed")
+            sg.popup_error(f"Report generation failed: {error}")
+            return
         
+        window['-STATUSBAR-'].update("Report generated")
         sg.popup(f"Report generated:\n{path}", title="Report Generated")
 
 
@@ -6,10 +6,22 @@ All operations are local file-based only.
 """
 
 import os
-from typing import List, Set, Iterator, Optional
+from collections import OrderedDict
+from itertools import islice
+from typing import Iterable, List, Set, Iterator, Optional, Tuple
 from pathlib import Path
 
 
+# Parsed wordlists kept in memory by load_cached (least recently used dropped first)
+WORD_CACHE_ENTRIES = 4
+
+# Wordlists larger than this are streamed with iter_words instead of cached
+WORD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Bytes read per chunk by load_wordlist_chunks
+READ_CHUNK_BYTES = 1 << 20
+
+
 class WordlistManager:
     """Manages wordlist files for dictionary attacks."""
     
@@ -27,6 +39,8 @@ class WordlistManager:
             self.wordlist_dir = Path(wordlist_dir)
         
         self.wordlist_dir.mkdir(parents=True, exist_ok=True)
+        # Resolved path -> ((mtime_ns, size), words) for load_cached
+        self._word_cache: "OrderedDict[Path, Tuple[Tuple[int, int], List[bytes]]]" = OrderedDict()
     
     def load_wordlist(self, filename: str, encoding: str = 'utf-8') -> Iterator[str]:
         """
@@ -52,6 +66,89 @@ class WordlistManager:
         except Exception as e:
             raise IOError(f"Error reading wordlist {filepath}: {e}")
     
+    def load_cached(self, path: Path) -> List[bytes]:
+        """
+        Load a wordlist as stripped UTF-8 bytes, reusing the parsed list while
+        the file is unchanged.
+        
+        Empty lines and '#' comments are dropped. The returned list is shared
+        between calls and must not be modified.
+        
+        Args:
+            path: Wordlist file path
+            
+        Returns:
+            Words as bytes, in file order
+        """
+        path = Path(path).resolve()
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        
+        cached = self._word_cache.get(path)
+        if cached is not None and cached[0] == key:
+            self._word_cache.move_to_end(path)
+            return cached[1]
+        
+        raw = path.read_bytes()
+        words = [w for w in map(bytes.strip, raw.splitlines()) if w and w[:1] != b'#']
+        
+        self._word_cache[path] = (key, words)
+        self._word_cache.move_to_end(path)
+        while len(self._word_cache) > WORD_CACHE_ENTRIES:
+            self._word_cache.popitem(last=False)
+        return words
+    
+    def iter_words(self, path: Path) -> Iterator[bytes]:
+        """
+        Stream a wordlist as stripped UTF-8 bytes without holding it in memory.
+        
+        Applies the same filtering as load_cached.
+        
+        Args:
+            path: Wordlist file path
+            
+        Yields:
+            Words as bytes, in file order
+        """
+        with open(path, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if line and line[:1] != b'#':
+                    yield line
+    
+    def load_wordlist_chunks(self, filename: str) -> Iterator[List[bytes]]:
+        """
+        Load a wordlist as lists of raw words, one list per READ_CHUNK_BYTES read.
+        
+        Lines are split, stripped and filtered (empty lines, '#' comments) by
+        C-level calls per chunk instead of Python code per line, so callers
+        that work on whole lists (sets, joins, map) skip per-word overhead.
+        
+        Args:
+            filename: Name of the wordlist file
+            
+        Yields:
+            Words as bytes, in file order, a chunk at a time
+        """
+        filepath = self.wordlist_dir / filename if not os.path.isabs(filename) else Path(filename)
+        
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Wordlist not found: {filepath}")
+        
+        leftover = b''
+        with f:
+            while chunk := f.read(READ_CHUNK_BYTES):
+                lines = (leftover + chunk).splitlines()
+                # A final line without its line break may continue in the next chunk
+                leftover = b'' if chunk[-1:] in (b'\n', b'\r') else lines.pop()
+                yield [w for w in map(bytes.strip, lines) if w and w[:1] != b'#']
+        
+        leftover = leftover.strip()
+        if leftover and leftover[:1] != b'#':
+            yield [leftover]
+    
     def load_wordlist_to_list(self, filename: str, max_words: Optional[int] = None) -> List[str]:
         """
         Load entire wordlist into memory.
@@ -63,12 +160,8 @@ class WordlistManager:
         Returns:
             List of words
         """
-        words = []
-        for i, word in enumerate(self.load_wordlist(filename)):
-            if max_words and i >= max_words:
-                break
-            words.append(word)
-        return words
+        # islice stops after max_words in C; 0 means no limit, as before
+        return list(islice(self.load_wordlist(filename), max_words or None))
     
     def save_wordlist(self, filename: str, words: List[str], overwrite: bool = False) -> None:
         """
@@ -88,6 +181,37 @@ class WordlistManager:
             for word in words:
                 f.write(f"{word}\n")
     
+    def _write_word_chunks(self, output_file: str, chunks: Iterable[List[bytes]]) -> int:
+        """
+        Write lists of raw words to a wordlist file, one word per line.
+        
+        The file is written under a temporary name and moved into place once
+        complete, so output_file may also be one of the inputs being read.
+        
+        Args:
+            output_file: Output filename
+            chunks: Lists of words as bytes
+            
+        Returns:
+            Number of words written
+        """
+        filepath = self.wordlist_dir / output_file if not os.path.isabs(output_file) else Path(output_file)
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        count = 0
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in chunks:
+                    if chunk:
+                        f.write(b'\n'.join(chunk) + b'\n')
+                        count += len(chunk)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, filepath)
+        
+        return count
+    
     def merge_wordlists(
         self,
         input_files: List[str],
@@ -107,19 +231,21 @@ class WordlistManager:
         Returns:
             Number of words in merged wordlist
         """
-        words: Set[str] = set() if deduplicate else []
+        chunks = (chunk for input_file in input_files for chunk in self.load_wordlist_chunks(input_file))
         
-        for input_file in input_files:
-            for word in self.load_wordlist(input_file):
-                if deduplicate:
-                    words.add(word)
-                else:
-                    words.append(word)
+        if deduplicate:
+            # Keep first occurrences only; set.add returns None, so each new
+            # word is recorded and kept in one pass
+            seen: Set[bytes] = set()
+            seen_add = seen.add
+            chunks = ([w for w in chunk if not (w in seen or seen_add(w))] for chunk in chunks)
         
-        word_list = sorted(words) if sort else list(words)
-        self.save_wordlist(output_file, word_list, overwrite=True)
+        if sort:
+            # UTF-8 byte order is code point order, so this matches sorting str
+            words = sorted(w for chunk in chunks for w in chunk)
+            chunks = [words]
         
-        return len(word_list)
+        return self._write_word_chunks(output_file, chunks)
     
     def clean_wordlist(
         self,
@@ -142,21 +268,18 @@ class WordlistManager:
         Returns:
             Number of words in cleaned wordlist
         """
-        cleaned_words = []
-        
-        for word in self.load_wordlist(input_file):
-            # Length filter
-            if len(word) < min_length or len(word) > max_length:
-                continue
-            
-            # ASCII filter
-            if remove_non_ascii and not word.isascii():
-                continue
+        def clean(chunk: List[bytes]) -> List[bytes]:
+            # ASCII filter; ASCII words are one byte per character
+            if remove_non_ascii:
+                return [w for w in chunk if w.isascii() and min_length <= len(w) <= max_length]
             
-            cleaned_words.append(word)
+            # Length filter, in characters (only non-ASCII words are decoded)
+            return [
+                w for w in chunk
+                if min_length <= (len(w) if w.isascii() else len(w.decode('utf-8', 'ignore'))) <= max_length
+            ]
         
-        self.save_wordlist(output_file, cleaned_words, overwrite=True)
-        return len(cleaned_words)
+        return self._write_word_chunks(output_file, map(clean, self.load_wordlist_chunks(input_file)))
     
     def deduplicate_wordlist(self, input_file: str, output_file: str) -> int:
         """
@@ -169,16 +292,15 @@ class WordlistManager:
         Returns:
             Number of unique words
         """
-        seen: Set[str] = set()
-        unique_words = []
-        
-        for word in self.load_wordlist(input_file):
-            if word not in seen:
-                seen.add(word)
-                unique_words.append(word)
-        
-        self.save_wordlist(output_file, unique_words, overwrite=True)
-        return len(unique_words)
+        # Keep first occurrences only; set.add returns None, so each new
+        # word is recorded and kept in one pass
+        seen: Set[bytes] = set()
+        seen_add = seen.add
+        chunks = (
+            [w for w in chunk if not (w in seen or seen_add(w))]
+            for chunk in self.load_wordlist_chunks(input_file)
+        )
+        return self._write_word_chunks(output_file, chunks)
     
     def get_wordlist_info(self, filename: str) -> dict:
         """
@@ -200,12 +322,18 @@ class WordlistManager:
         min_len = float('inf')
         max_len = 0
         
-        for word in self.load_wordlist(filename):
-            word_count += 1
-            length = len(word)
-            total_length += length
-            min_len = min(min_len, length)
-            max_len = max(max_len, length)
+        for chunk in self.load_wordlist_chunks(filename):
+            if not chunk:
+                continue
+            # Lengths in characters; ASCII words are one byte per character
+            if b''.join(chunk).isascii():
+                lengths = list(map(len, chunk))
+            else:
+                lengths = [len(w) if w.isascii() else len(w.decode('utf-8', 'ignore')) for w in chunk]
+            word_count += len(lengths)
+            total_length += sum(lengths)
+            min_len = min(min_len, min(lengths))
+            max_len = max(max_len, max(lengths))
         
         avg_len = total_length / word_count if word_count > 0 else 0
         
@@ -229,4 +357,10 @@ class WordlistManager:
         if not self.wordlist_dir.exists():
             return []
         
-        return [f.name for f in self.wordlist_dir.glob("*.txt")]
+        # scandir entries carry their type, so no Path objects or stat calls;
+        # normcase keeps the match case-insensitive on Windows like glob
+        with os.scandir(self.wordlist_dir) as entries:
+            return [
+                entry.name for entry in entries
+                if os.path.normcase(entry.name).endswith('.txt') and entry.is_file()
+            ]